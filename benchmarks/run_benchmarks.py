@@ -0,0 +1,331 @@
+"""
+Benchmarks for building, validating, serializing and running flows.
+
+Run the full suite and record the results:
+
+```bash
+python benchmarks/run_benchmarks.py --output results.json
+```
+
+Results are written as JSON, together with the Prefect, Python and platform versions
+they were recorded with. Pass a previous results file to `--compare` to print how
+each benchmark changed:
+
+```bash
+python benchmarks/run_benchmarks.py --output new.json --compare old.json
+```
+
+Use `--filter` to select benchmarks by a regular expression on their name, and
+`--sizes` / `--run-sizes` to choose the number of tasks in the flows that are built
+and run.
+"""
+import argparse
+import datetime
+import gc
+import json
+import logging
+import platform
+import re
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import prefect
+from prefect import Flow, Parameter, Task, task
+from prefect.engine.state import Pending
+from prefect.engine.task_runner import TaskRunner
+from prefect.executors import LocalDaskExecutor, LocalExecutor
+from prefect.utilities.storage import flow_from_bytes_pickle, flow_to_bytes_pickle
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+DEFAULT_RUN_SIZES = [100, 1000]
+
+# a benchmark is a generator function which yields once setup is complete; the time
+# until it is resumed (and finishes) is what gets measured
+BENCHMARKS = []  # type: List[Tuple[str, Callable[..., Iterator[None]], str]]
+
+
+def benchmark(name: str, sizes: str = "sizes") -> Callable:
+    """
+    Registers a benchmark which is run once for every value in the `sizes` (or
+    `run_sizes`) option.
+    """
+
+    def decorator(fn: Callable[..., Iterator[None]]) -> Callable[..., Iterator[None]]:
+        BENCHMARKS.append((name, fn, sizes))
+        return fn
+
+    return decorator
+
+
+@task
+def inc(x: int) -> int:
+    return x + 1
+
+
+def build_wide_flow(n: int) -> Flow:
+    """A flow with a single root task and `n - 1` tasks which depend on it"""
+    with Flow("wide") as flow:
+        root = inc(0)
+        for _ in range(n - 1):
+            inc(root)
+    return flow
+
+
+def build_deep_flow(n: int) -> Flow:
+    """A flow with `n` tasks which form a single chain"""
+    with Flow("deep") as flow:
+        result = inc(0)
+        for _ in range(n - 1):
+            result = inc(result)
+    return flow
+
+
+def build_mapped_flow(n: int) -> Flow:
+    """A flow which maps two tasks over a list of `n` items"""
+    with Flow("mapped") as flow:
+        items = Parameter("items", default=list(range(n)))
+        inc.map(inc.map(items))
+    return flow
+
+
+SHAPES = {
+    "wide": build_wide_flow,
+    "deep": build_deep_flow,
+    "mapped": build_mapped_flow,
+}  # type: Dict[str, Callable[[int], Flow]]
+
+
+def _uncached(flow: Flow) -> Flow:
+    flow._cache.clear()
+    return flow
+
+
+# Construction -----------------------------------------------------------------
+
+
+@benchmark("build_flow.wide")
+def bench_build_wide(n: int) -> Iterator[None]:
+    yield
+    build_wide_flow(n)
+
+
+@benchmark("build_flow.deep")
+def bench_build_deep(n: int) -> Iterator[None]:
+    yield
+    build_deep_flow(n)
+
+
+# Validation and serialization ---------------------------------------------------
+
+
+@benchmark("validate")
+def bench_validate(n: int) -> Iterator[None]:
+    flow = _uncached(build_deep_flow(n))
+    yield
+    flow.validate()
+
+
+@benchmark("sorted_tasks")
+def bench_sorted_tasks(n: int) -> Iterator[None]:
+    flow = _uncached(build_wide_flow(n))
+    yield
+    flow.sorted_tasks()
+
+
+@benchmark("serialize")
+def bench_serialize(n: int) -> Iterator[None]:
+    flow = _uncached(build_deep_flow(n))
+    yield
+    flow.serialize()
+
+
+@benchmark("serialized_hash")
+def bench_serialized_hash(n: int) -> Iterator[None]:
+    flow = _uncached(build_deep_flow(n))
+    yield
+    flow.serialized_hash()
+
+
+@benchmark("pickle.to_bytes")
+def bench_flow_to_bytes(n: int) -> Iterator[None]:
+    flow = build_deep_flow(n)
+    yield
+    flow_to_bytes_pickle(flow)
+
+
+@benchmark("pickle.from_bytes")
+def bench_flow_from_bytes(n: int) -> Iterator[None]:
+    data = flow_to_bytes_pickle(build_deep_flow(n))
+    yield
+    flow_from_bytes_pickle(data)
+
+
+# Execution --------------------------------------------------------------------
+
+
+def _make_run_benchmark(shape: str, executor_cls: type) -> None:
+    executor_name = executor_cls.__name__
+
+    @benchmark(f"run.{executor_name}.{shape}", sizes="run_sizes")
+    def bench_run(n: int) -> Iterator[None]:
+        flow = SHAPES[shape](n)
+        executor = executor_cls()
+        yield
+        state = flow.run(executor=executor)
+        assert state.is_successful(), state
+
+    bench_run.__name__ = f"bench_run_{executor_name}_{shape}"
+
+
+for _executor_cls in [LocalExecutor, LocalDaskExecutor]:
+    for _shape in SHAPES:
+        _make_run_benchmark(_shape, _executor_cls)
+
+
+@benchmark("task_runner.noop", sizes="run_sizes")
+def bench_task_runner(n: int) -> Iterator[None]:
+    runners = [TaskRunner(task=Task()) for _ in range(n)]
+    yield
+    for runner in runners:
+        runner.run(state=Pending(), context={})
+
+
+@benchmark("task_runner.noop_full_pipeline", sizes="run_sizes")
+def bench_task_runner_full_pipeline(n: int) -> Iterator[None]:
+    # a state handler rules out the plain task short path, so that the overhead of
+    # the full pipeline can be compared with `task_runner.noop`
+    runners = [
+        TaskRunner(task=Task(state_handlers=[lambda task, old, new: new]))
+        for _ in range(n)
+    ]
+    yield
+    for runner in runners:
+        runner.run(state=Pending(), context={})
+
+
+# Runner -------------------------------------------------------------------------
+
+
+def time_benchmark(
+    fn: Callable[..., Iterator[None]], n: int, repeat: int
+) -> Dict[str, Any]:
+    """
+    Runs a benchmark `repeat` times and summarizes its timings (in seconds).
+    """
+    timings = []
+    for _ in range(repeat):
+        gen = fn(n)
+        next(gen)
+        gc.collect()
+        start = time.perf_counter()
+        for _ in gen:
+            pass
+        timings.append(time.perf_counter() - start)
+    return dict(
+        min=min(timings),
+        mean=sum(timings) / len(timings),
+        max=max(timings),
+        per_task=min(timings) / n,
+        repeat=repeat,
+    )
+
+
+def run_benchmarks(
+    sizes: List[int],
+    run_sizes: List[int],
+    repeat: int = 3,
+    pattern: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Runs every registered benchmark whose name matches `pattern` and returns the
+    results, along with the versions they were recorded with.
+    """
+    results = []
+    for name, fn, size_option in BENCHMARKS:
+        if pattern and not re.search(pattern, name):
+            continue
+        for n in sizes if size_option == "sizes" else run_sizes:
+            result = dict(name=name, n=n, **time_benchmark(fn, n, repeat))
+            print(
+                "{name:<36} n={n:<8} min={min:.4f}s mean={mean:.4f}s".format(**result)
+            )
+            results.append(result)
+
+    return dict(
+        prefect_version=prefect.__version__,
+        python_version=platform.python_version(),
+        platform=platform.platform(),
+        timestamp=datetime.datetime.utcnow().isoformat(),
+        results=results,
+    )
+
+
+def compare_results(old: Dict[str, Any], new: Dict[str, Any]) -> None:
+    """
+    Prints the ratio of new to old minimum timings for every benchmark in both runs.
+    """
+    previous = {(r["name"], r["n"]): r for r in old["results"]}
+    print(
+        "\nComparison against Prefect {} (ratio > 1 is slower):".format(
+            old["prefect_version"]
+        )
+    )
+    for result in new["results"]:
+        before = previous.get((result["name"], result["n"]))
+        if before is None:
+            continue
+        print(
+            "{:<36} n={:<8} {:.2f}x".format(
+                result["name"], result["n"], result["min"] / before["min"]
+            )
+        )
+
+
+def main(argv: List[str] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_SIZES,
+        help="Number of tasks in the flows used for construction, validation and "
+        "serialization benchmarks",
+    )
+    parser.add_argument(
+        "--run-sizes",
+        nargs="+",
+        type=int,
+        default=DEFAULT_RUN_SIZES,
+        help="Number of tasks in the flows used for execution benchmarks",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Number of times to run each benchmark"
+    )
+    parser.add_argument(
+        "--filter", help="Only run benchmarks whose name matches this regex"
+    )
+    parser.add_argument("--output", help="Path to write the results to, as JSON")
+    parser.add_argument("--compare", help="Path to previous results to compare to")
+    args = parser.parse_args(argv)
+
+    # flow runs log every task state change, which would dominate the timings
+    logging.getLogger("prefect").setLevel(logging.ERROR)
+
+    results = run_benchmarks(
+        sizes=args.sizes,
+        run_sizes=args.run_sizes,
+        repeat=args.repeat,
+        pattern=args.filter,
+    )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare_results(json.load(f), results)
+
+
+if __name__ == "__main__":
+    main()
@@ -88,6 +88,8 @@ class Edge:
         ```
     """
 
+    __slots__ = ("upstream_task", "downstream_task", "key", "mapped", "flattened")
+
     def __init__(
         self,
         upstream_task: Any,
@@ -150,6 +152,14 @@ class Edge:
             )
         )
 
+    def __getstate__(self) -> dict:
+        return {attr: getattr(self, attr) for attr in self.__slots__}
+
+    def __setstate__(self, state: dict) -> None:
+        # edges pickled by older versions of Prefect carry their `__dict__` as state
+        for attr, value in state.items():
+            setattr(self, attr, value)
+
     def serialize(self) -> dict:
         """
         Represents the Edge as a dict.
@@ -35,6 +35,7 @@ from slugify import slugify
 import prefect
 import prefect.schedules
 from prefect.core.edge import Edge
+from prefect.core.graph import CompactTaskGraph, TaskGraph
 from prefect.core.parameter import Parameter
 from prefect.core.task import Task
 from prefect.executors import Executor
@@ -55,26 +56,25 @@ def cache(method: Callable) -> Callable:
     """
     Decorator for caching Flow methods.
 
-    Each Flow has a _cache dict that can be used to memoize expensive functions. This
-    decorator automatically compares a hash of the Flow's current tasks, edges, and reference_tasks
-    to a cached hash; if the hash is the same, it attempts to retrieve a value from the cache.
-    If the hash is different, it invalidates the cache.
+    Each Flow has a _cache dict that can be used to memoize expensive functions. Every
+    method that mutates the Flow's tasks, edges, or reference_tasks increments the Flow's
+    `_graph_version` counter; this decorator compares that counter to the version the
+    cache was populated at, and if they differ, it invalidates the cache.
     """
+    signature = inspect.signature(method)
 
     @functools.wraps(method)
     def wrapper(self, *args, **kwargs):  # type: ignore
 
-        cache_check = dict(
-            tasks=self.tasks.copy(),
-            edges=self.edges.copy(),
-            reference_tasks=copy.copy(self._reference_tasks),
-        )
-        if any(self._cache.get(k) != v for k, v in cache_check.items()):
+        if self._cache.get("_graph_version") != self._graph_version:
             self._cache.clear()
-            self._cache.update(cache_check)
+            self._cache["_graph_version"] = self._graph_version
 
-        callargs = inspect.signature(method).bind(self, *args, **kwargs).arguments
-        key = (method.__name__, tuple(callargs.items())[1:])
+        if args or kwargs:
+            callargs = signature.bind(self, *args, **kwargs).arguments
+            key = (method.__name__, tuple(callargs.items())[1:])
+        else:
+            key = (method.__name__, ())
         if key not in self._cache:
             self._cache[key] = method(self, *args, **kwargs)
         return self._cache[key]
@@ -151,6 +151,11 @@ class Flow:
             `reference_task_states` is set of states for all reference tasks in the flow. It should
             return either a new state for the flow run, or `None` (in which case the existing
             state will be used).
+        - compact_graph (bool, optional): Whether to store the flow's edges in an
+            integer-indexed, array-backed graph instead of a set of `Edge` objects. This
+            greatly reduces memory use for flows with very many tasks, at the cost of
+            creating `Edge` objects on demand. Defaults to the value of `compact_graph`
+            in your prefect configuration file.
     """
 
     def __init__(
@@ -171,8 +176,10 @@ class Flow:
         terminal_state_handler: Optional[
             Callable[["Flow", State, Set[State]], Optional[State]]
         ] = None,
+        compact_graph: bool = None,
     ):
         self._cache = {}  # type: dict
+        self._graph_version = 0
 
         if not name:
             raise ValueError("A name must be provided for the flow.")
@@ -187,12 +194,26 @@ class Flow:
         self.result = result
         self.terminal_state_handler = terminal_state_handler
 
+        if compact_graph is None:
+            compact_graph = cast(bool, prefect.config.flows.compact_graph)
+
         self.tasks = set()  # type: Set[Task]
-        self.edges = set()  # type: Set[Edge]
+        # the graph backend stores the edges and indexes them by task; `self.edges`
+        # is the backend's (set-like) edge collection
+        self._graph = (
+            CompactTaskGraph() if compact_graph else TaskGraph()
+        )  # type: Union[TaskGraph, CompactTaskGraph]
+        self.edges = self._graph.edges  # type: Set[Edge]
+        # a topological rank for every task, kept up to date by `add_task` /
+        # `add_edge` so that sorting never requires a full pass over the edges.
+        # `_task_order` is `None` whenever the rank is unknown (e.g. a cycle was
+        # introduced) and must be recomputed.
+        self._task_order = {}  # type: Optional[Dict[Task, int]]
         self._slug_counters = collections.defaultdict(
             cast(Callable, functools.partial(itertools.count, 1))
         )  # type: Dict[str, Iterator[int]]
         self.slugs = {}  # type: Dict[Task, str]
+        self._slug_values = set()  # type: Set[str]
         self.constants = collections.defaultdict(
             dict
         )  # type: Dict[Task, Dict[str, Any]]
@@ -237,6 +258,16 @@ class Flow:
     def __iter__(self) -> Iterable[Task]:
         yield from self.sorted_tasks()
 
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        # flows pickled by older versions of Prefect don't carry a graph backend
+        if "_graph" not in state:
+            self._graph_version = 0
+            self._slug_values = set(self.slugs.values())
+            self._graph = TaskGraph.from_edges(self.tasks, self.edges)
+            self.edges = self._graph.edges
+            self._task_order = None
+
     def copy(self) -> "Flow":
         """
         Create and returns a copy of the current Flow.
@@ -246,8 +277,13 @@ class Flow:
         new._cache = dict()
         new.constants = self.constants.copy()
         new.tasks = self.tasks.copy()
-        new.edges = self.edges.copy()
+        new._graph = self._graph.copy()
+        new.edges = new._graph.edges
+        new._task_order = (
+            self._task_order.copy() if self._task_order is not None else None
+        )
         new.slugs = self.slugs.copy()
+        new._slug_values = self._slug_values.copy()
         new.set_reference_tasks(self._reference_tasks)
         return new
 
@@ -309,18 +345,15 @@ class Flow:
 
         new = as_task(new, flow=self)
 
-        # update tasks
+        # update tasks, removing the old edges along with the old task
         self.tasks.remove(old)
-        self.slugs.pop(old)
+        self._slug_values.discard(self.slugs.pop(old))
+        affected_edges = self._graph.remove_task(old)
+        # removing a task leaves a gap in the topological rank, so recompute it lazily
+        self._task_order = None
         self.add_task(new)
 
-        self._cache.clear()
-
-        affected_edges = {e for e in self.edges if old in e.tasks}
-
-        # remove old edges
-        for edge in affected_edges:
-            self.edges.remove(edge)
+        self._graph_changed()
 
         # replace with new edges
         for edge in affected_edges:
@@ -479,7 +512,7 @@ class Flow:
         Returns:
             - None
         """
-        self._cache.clear()
+        self._graph_changed()
         reference_tasks = set(tasks)
         if any(t not in self.tasks for t in reference_tasks):
             raise ValueError("reference tasks must be part of the flow.")
@@ -509,7 +542,7 @@ class Flow:
         while True:
             ind = next(self._slug_counters[prefix])
             slug = f"{prefix}-{ind}"
-            if slug not in self.slugs.values():
+            if slug not in self._slug_values:
                 return slug
 
     def add_task(self, task: Task) -> Task:
@@ -532,15 +565,20 @@ class Flow:
                 "Tasks must be Task instances (received {})".format(type(task))
             )
         elif task not in self.tasks:
-            if task.slug and task.slug in self.slugs.values():
+            if task.slug and task.slug in self._slug_values:
                 raise ValueError(
                     'A task with the slug "{}" already exists in this '
                     "flow.".format(task.slug)
                 )
             self.slugs[task] = task.slug or self._generate_task_slug(task)
+            self._slug_values.add(self.slugs[task])
 
             self.tasks.add(task)
-            self._cache.clear()
+            self._graph.add_task(task)
+            if self._task_order is not None:
+                # a new task has no edges, so it can always be placed last
+                self._task_order[task] = len(self._task_order)
+            self._graph_changed()
 
             # Parameters and constants must be root tasks
             # All other new tasks should be added to the current case/resource (if any)
@@ -626,14 +664,15 @@ class Flow:
             self.add_task(edge.downstream_task)
             return edge
 
-        # add the edge
-        self.edges.add(edge)
-
         # add the tasks from the edge (note they may be different than the passed tasks)
         # due to calling `as_task()` inside the Edge constructor
         self.add_task(edge.upstream_task)
         self.add_task(edge.downstream_task)
 
+        # add the edge and move its tasks into a consistent topological order
+        self._graph.add_edge(edge)
+        self._update_task_order(edge)
+
         # we can only check the downstream task's edges once it has been added to the
         # flow, so we need to perform this check here and not earlier.
         if (
@@ -655,7 +694,7 @@ class Flow:
             }
             inspect.signature(downstream_task.run).bind_partial(**edge_keys)
 
-        self._cache.clear()
+        self._graph_changed()
 
         # check for cycles
         if validate:
@@ -738,6 +777,7 @@ class Flow:
             )
 
         self.constants.update(flow.constants or {})
+        self._graph_changed()
 
     @cache
     def all_upstream_edges(self) -> Dict[Task, Set[Edge]]:
@@ -748,10 +788,7 @@ class Flow:
         Returns:
             - dict with the key as tasks and the value as a set of upstream edges
         """
-        edges = {t: set() for t in self.tasks}  # type: Dict[Task, Set[Edge]]
-        for edge in self.edges:
-            edges[edge.downstream_task].add(edge)
-        return edges
+        return {t: set(self._graph.edges_to(t)) for t in self.tasks}
 
     @cache
     def all_downstream_edges(self) -> Dict[Task, Set[Edge]]:
@@ -762,10 +799,7 @@ class Flow:
         Returns:
             - dict with the key as tasks and the value as a set of downstream edges
         """
-        edges = {t: set() for t in self.tasks}  # type: Dict[Task, Set[Edge]]
-        for edge in self.edges:
-            edges[edge.upstream_task].add(edge)
-        return edges
+        return {t: set(self._graph.edges_from(t)) for t in self.tasks}
 
     def edges_to(self, task: Task) -> Set[Edge]:
         """
@@ -784,7 +818,7 @@ class Flow:
             raise ValueError(
                 "Task {t} was not found in Flow {f}".format(t=task, f=self)
             )
-        return self.all_upstream_edges()[task]
+        return set(self._graph.edges_to(task))
 
     def edges_from(self, task: Task) -> Set[Edge]:
         """
@@ -803,7 +837,7 @@ class Flow:
             raise ValueError(
                 "Task {t} was not found in Flow {f}".format(t=task, f=self)
             )
-        return self.all_downstream_edges()[task]
+        return set(self._graph.edges_from(task))
 
     def upstream_tasks(self, task: Task) -> Set[Task]:
         """
@@ -815,7 +849,11 @@ class Flow:
         Returns:
             - set of Task objects which are upstream of `task`
         """
-        return set(e.upstream_task for e in self.edges_to(task))
+        if task not in self.tasks:
+            raise ValueError(
+                "Task {t} was not found in Flow {f}".format(t=task, f=self)
+            )
+        return set(self._graph.upstream_tasks(task))
 
     def downstream_tasks(self, task: Task) -> Set[Task]:
         """
@@ -827,7 +865,23 @@ class Flow:
         Returns:
             - set of Task objects which are downstream of `task`
         """
-        return set(e.downstream_task for e in self.edges_from(task))
+        if task not in self.tasks:
+            raise ValueError(
+                "Task {t} was not found in Flow {f}".format(t=task, f=self)
+            )
+        return set(self._graph.downstream_tasks(task))
+
+    def graph_stats(self) -> Dict[str, Any]:
+        """
+        Reports the size of the flow's graph and an estimate of the memory used to
+        store it.
+
+        Returns:
+            - dict: a dictionary with the graph `backend` (`"default"` or `"compact"`),
+                the number of `tasks` and `edges`, and the estimated `edge_bytes`,
+                `index_bytes` and `total_bytes` used by the graph
+        """
+        return self._graph.stats()
 
     def validate(self) -> None:
         """
@@ -891,56 +945,115 @@ class Flow:
                     )
 
             tasks = set(root_tasks)
-            seen = set()  # type: Set[Task]
-
-            # compute the downstream edges dict once, this method uses
-            # @cached but validation is expensive for large flows
-            downstream_edges = self.all_downstream_edges()
-
-            # while the set of tasks is different from the seen tasks...
-            while tasks.difference(seen):
-                # iterate over the new tasks...
-                for t in list(tasks.difference(seen)):
-                    # add its downstream tasks to the task list
-                    tasks.update({e.downstream_task for e in downstream_edges[t]})
-                    # mark it as seen
-                    seen.add(t)
+            to_visit = list(tasks)
+            while to_visit:
+                for downstream in self._graph.downstream_tasks(to_visit.pop()):
+                    if downstream not in tasks:
+                        tasks.add(downstream)
+                        to_visit.append(downstream)
         else:
             tasks = self.tasks
 
-        # build the list of sorted tasks
-        remaining_tasks = list(tasks)
+        if self._task_order is None:
+            sorted_tasks = self._topological_sort(tasks)
+            # only a sort of the full flow can be used as the flow's task order
+            if not root_tasks:
+                self._task_order = {t: i for i, t in enumerate(sorted_tasks)}
+            return tuple(sorted_tasks)
+
+        return tuple(sorted(tasks, key=self._task_order.__getitem__))
+
+    def _topological_sort(self, tasks: Set[Task]) -> List[Task]:
+        """
+        Sorts the provided tasks using Kahn's algorithm, only considering edges whose
+        upstream and downstream tasks are both part of `tasks`. Runs in O(V + E).
+
+        Raises:
+            - ValueError: if a cycle is found among the tasks
+        """
+        in_degree = {
+            t: sum(1 for u in self._graph.upstream_tasks(t) if u in tasks)
+            for t in tasks
+        }
+        ready = collections.deque(t for t, n in in_degree.items() if n == 0)
         sorted_tasks = []
 
-        # compute the upstream edges dict once, this method uses
-        # @cached but validation is expensive for large flows
-        upstream_edges = self.all_upstream_edges()
-
-        while remaining_tasks:
-            # mark the flow as cyclic unless we prove otherwise
-            cyclic = True
-
-            # iterate over each remaining task
-            for task in remaining_tasks.copy():
-                # check all the upstream tasks of that task
-                upstream_tasks = {e.upstream_task for e in upstream_edges[task]}
-                for upstream_task in upstream_tasks:
-                    # if the upstream task is also remaining, it means it
-                    # hasn't been sorted, so we can't sort this task either
-                    if upstream_task in remaining_tasks:
-                        break
-                else:
-                    # but if all upstream tasks have been sorted, we can sort
-                    # this one too. We note that we found no cycle this time.
-                    cyclic = False
-                    remaining_tasks.remove(task)
-                    sorted_tasks.append(task)
+        while ready:
+            task = ready.popleft()
+            sorted_tasks.append(task)
+            for downstream in self._graph.downstream_tasks(task):
+                if downstream in in_degree:
+                    in_degree[downstream] -= 1
+                    if in_degree[downstream] == 0:
+                        ready.append(downstream)
+
+        # any task whose upstream tasks were never all sorted is part of a cycle
+        if len(sorted_tasks) != len(in_degree):
+            raise ValueError("Cycle found; flows must be acyclic!")
+
+        return sorted_tasks
+
+    def _update_task_order(self, edge: Edge) -> None:
+        """
+        Incrementally restores the flow's topological task order after `edge` has been
+        added, using the Pearce-Kelly algorithm: only the tasks whose rank lies between
+        the edge's endpoints are visited and re-ranked. If the new edge introduces a
+        cycle the order is discarded, and the cycle will be reported the next time the
+        tasks are sorted.
+        """
+        order = self._task_order
+        if order is None:
+            return
+
+        upstream, downstream = edge.upstream_task, edge.downstream_task
+        lower, upper = order[downstream], order[upstream]
+        if upper < lower:
+            return
+
+        # collect everything reachable from the downstream task that is currently
+        # ranked no later than the upstream task
+        forward = set()  # type: Set[Task]
+        to_visit = [downstream]
+        while to_visit:
+            task = to_visit.pop()
+            if task is upstream:
+                self._task_order = None
+                return
+            if task in forward:
+                continue
+            forward.add(task)
+            to_visit.extend(
+                t for t in self._graph.downstream_tasks(task) if order[t] <= upper
+            )
 
-            # if we were unable to match any upstream tasks, we have a cycle
-            if cyclic:
-                raise ValueError("Cycle found; flows must be acyclic!")
+        # collect everything that reaches the upstream task and is currently ranked
+        # no earlier than the downstream task
+        backward = set()  # type: Set[Task]
+        to_visit = [upstream]
+        while to_visit:
+            task = to_visit.pop()
+            if task in backward:
+                continue
+            backward.add(task)
+            to_visit.extend(
+                t for t in self._graph.upstream_tasks(task) if order[t] >= lower
+            )
 
-        return tuple(sorted_tasks)
+        # reuse the affected ranks, placing the backward set ahead of the forward set
+        ranks = sorted(order[t] for t in forward | backward)
+        affected = sorted(backward, key=order.__getitem__) + sorted(
+            forward, key=order.__getitem__
+        )
+        for task, rank in zip(affected, ranks):
+            order[task] = rank
+
+    def _graph_changed(self) -> None:
+        """
+        Records that the flow's tasks, edges, or reference tasks were modified by
+        incrementing the graph version, which invalidates all cached graph lookups.
+        """
+        self._graph_version += 1
+        self._cache.clear()
 
     # Dependencies ------------------------------------------------------------
 
@@ -0,0 +1,450 @@
+"""
+Storage backends for the task graph of a `Flow`.
+
+A `Flow` delegates the bookkeeping of its edges to one of the classes in this module:
+
+- `TaskGraph`: the default backend, which stores `Edge` objects in a set and indexes
+    them by their upstream and downstream tasks
+- `CompactTaskGraph`: an integer-indexed, array-backed backend intended for very large
+    flows. Tasks are assigned integer ids, edges are stored as parallel arrays with
+    CSR-style adjacency indexes, and `Edge` objects are only created when requested
+
+Both backends expose the same interface and neither is intended to be used directly;
+use `Flow(..., compact_graph=True)` to opt into the compact backend.
+"""
+import collections.abc
+import sys
+from array import array
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from prefect.core.edge import Edge
+from prefect.core.task import Task
+
+_MAPPED = 1
+_FLATTENED = 2
+_REMOVED = 4
+
+
+def _build_edge(
+    upstream_task: Task,
+    downstream_task: Task,
+    key: Optional[str],
+    mapped: bool,
+    flattened: bool,
+) -> Edge:
+    """
+    Creates an `Edge` from already-validated attributes, skipping the task conversion
+    and key validation performed by `Edge.__init__`.
+    """
+    edge = Edge.__new__(Edge)
+    edge.upstream_task = upstream_task
+    edge.downstream_task = downstream_task
+    edge.key = key
+    edge.mapped = mapped
+    edge.flattened = flattened
+    return edge
+
+
+class TaskGraph:
+    """
+    The default task graph backend: edges are stored in a set (exposed as `Flow.edges`)
+    and indexed by task in dictionaries of sets.
+    """
+
+    backend = "default"
+
+    def __init__(self) -> None:
+        self.edges = set()  # type: Set[Edge]
+        self._upstream = {}  # type: Dict[Task, Set[Edge]]
+        self._downstream = {}  # type: Dict[Task, Set[Edge]]
+
+    def add_task(self, task: Task) -> None:
+        self._upstream.setdefault(task, set())
+        self._downstream.setdefault(task, set())
+
+    def remove_task(self, task: Task) -> Set[Edge]:
+        """
+        Removes a task and returns all of the edges that referenced it, which are
+        removed as well.
+        """
+        edges = self._upstream.pop(task) | self._downstream.pop(task)
+        for edge in edges:
+            self.remove_edge(edge)
+        return edges
+
+    def add_edge(self, edge: Edge) -> None:
+        self.edges.add(edge)
+        self._upstream[edge.downstream_task].add(edge)
+        self._downstream[edge.upstream_task].add(edge)
+
+    def remove_edge(self, edge: Edge) -> None:
+        self.edges.discard(edge)
+        self._upstream.get(edge.downstream_task, set()).discard(edge)
+        self._downstream.get(edge.upstream_task, set()).discard(edge)
+
+    def edges_to(self, task: Task) -> Set[Edge]:
+        return self._upstream[task]
+
+    def edges_from(self, task: Task) -> Set[Edge]:
+        return self._downstream[task]
+
+    def upstream_tasks(self, task: Task) -> List[Task]:
+        """
+        Returns the upstream task of every edge leading to `task`; a task appears once
+        for each edge connecting it to `task`.
+        """
+        return [e.upstream_task for e in self._upstream[task]]
+
+    def downstream_tasks(self, task: Task) -> List[Task]:
+        """
+        Returns the downstream task of every edge leading from `task`; a task appears
+        once for each edge connecting it to `task`.
+        """
+        return [e.downstream_task for e in self._downstream[task]]
+
+    def copy(self) -> "TaskGraph":
+        new = type(self)()
+        new.edges = self.edges.copy()
+        new._upstream = {t: e.copy() for t, e in self._upstream.items()}
+        new._downstream = {t: e.copy() for t, e in self._downstream.items()}
+        return new
+
+    def stats(self) -> Dict[str, Any]:
+        edge_size = sum(sys.getsizeof(e) for e in self.edges)
+        index_size = sum(
+            sys.getsizeof(index) + sum(sys.getsizeof(s) for s in index.values())
+            for index in (self._upstream, self._downstream)
+        )
+        return dict(
+            backend=self.backend,
+            tasks=len(self._upstream),
+            edges=len(self.edges),
+            edge_bytes=edge_size + sys.getsizeof(self.edges),
+            index_bytes=index_size,
+            total_bytes=edge_size + sys.getsizeof(self.edges) + index_size,
+        )
+
+    @classmethod
+    def from_edges(cls, tasks: Iterable[Task], edges: Iterable[Edge]) -> "TaskGraph":
+        graph = cls()
+        for task in tasks:
+            graph.add_task(task)
+        for edge in edges:
+            graph.add_edge(edge)
+        return graph
+
+
+class _EdgeView(collections.abc.MutableSet):
+    """
+    A set-like view over the edges of a `CompactTaskGraph`, used as `Flow.edges`.
+    `Edge` objects are created as the view is iterated.
+    """
+
+    def __init__(self, graph: "CompactTaskGraph"):
+        self._graph = graph
+
+    def __contains__(self, edge: object) -> bool:
+        return isinstance(edge, Edge) and self._graph._find_edge(edge) is not None
+
+    def __iter__(self) -> Iterator[Edge]:
+        graph = self._graph
+        for eid in range(len(graph._edge_flags)):
+            if not graph._edge_flags[eid] & _REMOVED:
+                yield graph._make_edge(eid)
+
+    def __len__(self) -> int:
+        return len(self._graph._edge_flags) - self._graph._n_removed_edges
+
+    def __repr__(self) -> str:
+        return "<EdgeView: {} edges>".format(len(self))
+
+    def add(self, edge: Edge) -> None:
+        self._graph.add_edge(edge)
+
+    def discard(self, edge: Edge) -> None:
+        self._graph.remove_edge(edge)
+
+    def copy(self) -> Set[Edge]:
+        return set(self)
+
+
+class CompactTaskGraph:
+    """
+    An integer-indexed task graph backend for very large flows.
+
+    Every task is assigned an integer id and every edge is stored as one entry in a set
+    of parallel arrays (upstream id, downstream id, key id and flags). Adjacency lookups
+    use CSR-style indexes: an offsets array per direction plus a flat array of edge ids
+    sorted by task. The indexes are rebuilt in O(V + E) whenever the number of edges
+    added since the last build exceeds the number of indexed edges, and edges added in
+    between are tracked in small per-task overflow lists, so adding an edge is amortized
+    O(1). `Edge` objects are only created when they are requested.
+    """
+
+    backend = "compact"
+
+    def __init__(self) -> None:
+        self._tasks = []  # type: List[Optional[Task]]
+        self._task_ids = {}  # type: Dict[Task, int]
+        self._keys = [None]  # type: List[Optional[str]]
+        self._key_ids = {None: 0}  # type: Dict[Optional[str], int]
+
+        self._edge_upstream = array("l")
+        self._edge_downstream = array("l")
+        self._edge_key = array("l")
+        self._edge_flags = array("b")
+        self._n_removed_edges = 0
+
+        self._clear_index()
+        self.edges = _EdgeView(self)
+
+    # Indexes ------------------------------------------------------------------
+
+    def _clear_index(self) -> None:
+        self._n_indexed = 0
+        self._down_offsets = array("l", [0])
+        self._down_edges = array("l")
+        self._up_offsets = array("l", [0])
+        self._up_edges = array("l")
+        self._pending_down = {}  # type: Dict[int, List[int]]
+        self._pending_up = {}  # type: Dict[int, List[int]]
+
+    @staticmethod
+    def _csr(ids: array, n_tasks: int, flags: array) -> tuple:
+        """
+        Computes CSR `(offsets, edge_ids)` arrays grouping all live edges by `ids`.
+        """
+        counts = [0] * (n_tasks + 1)
+        for eid, tid in enumerate(ids):
+            if not flags[eid] & _REMOVED:
+                counts[tid + 1] += 1
+        for tid in range(n_tasks):
+            counts[tid + 1] += counts[tid]
+        offsets = array("l", counts)
+        cursor = counts[:-1]
+        edge_ids = array("l", bytes(offsets.itemsize * counts[-1]))
+        for eid, tid in enumerate(ids):
+            if not flags[eid] & _REMOVED:
+                edge_ids[cursor[tid]] = eid
+                cursor[tid] += 1
+        return offsets, edge_ids
+
+    def _build_index(self) -> None:
+        n_tasks = len(self._tasks)
+        self._down_offsets, self._down_edges = self._csr(
+            self._edge_upstream, n_tasks, self._edge_flags
+        )
+        self._up_offsets, self._up_edges = self._csr(
+            self._edge_downstream, n_tasks, self._edge_flags
+        )
+        self._n_indexed = len(self._edge_flags)
+        self._pending_down = {}
+        self._pending_up = {}
+
+    def _row(
+        self, tid: int, offsets: array, edge_ids: array, pending: Dict[int, List[int]]
+    ) -> Iterator[int]:
+        if tid < len(offsets) - 1:
+            for i in range(offsets[tid], offsets[tid + 1]):
+                eid = edge_ids[i]
+                if not self._edge_flags[eid] & _REMOVED:
+                    yield eid
+        for eid in pending.get(tid, ()):
+            if not self._edge_flags[eid] & _REMOVED:
+                yield eid
+
+    @staticmethod
+    def _row_length(tid: int, offsets: array, pending: Dict[int, List[int]]) -> int:
+        length = len(pending.get(tid, ()))
+        if tid < len(offsets) - 1:
+            length += offsets[tid + 1] - offsets[tid]
+        return length
+
+    def _downstream_ids(self, tid: int) -> Iterator[int]:
+        return self._row(tid, self._down_offsets, self._down_edges, self._pending_down)
+
+    def _upstream_ids(self, tid: int) -> Iterator[int]:
+        return self._row(tid, self._up_offsets, self._up_edges, self._pending_up)
+
+    # Edges --------------------------------------------------------------------
+
+    def _make_edge(self, eid: int) -> Edge:
+        flags = self._edge_flags[eid]
+        return _build_edge(
+            upstream_task=self._tasks[self._edge_upstream[eid]],  # type: ignore
+            downstream_task=self._tasks[self._edge_downstream[eid]],  # type: ignore
+            key=self._keys[self._edge_key[eid]],
+            mapped=bool(flags & _MAPPED),
+            flattened=bool(flags & _FLATTENED),
+        )
+
+    def _find_edge(self, edge: Edge) -> Optional[int]:
+        upstream = self._task_ids.get(edge.upstream_task)
+        downstream = self._task_ids.get(edge.downstream_task)
+        key = self._key_ids.get(edge.key)
+        if upstream is None or downstream is None or key is None:
+            return None
+        flags = (_MAPPED if edge.mapped else 0) | (_FLATTENED if edge.flattened else 0)
+        # scan whichever of the two adjacency rows is shorter
+        if self._row_length(upstream, self._down_offsets, self._pending_down) <= (
+            self._row_length(downstream, self._up_offsets, self._pending_up)
+        ):
+            candidates = self._downstream_ids(upstream)
+        else:
+            candidates = self._upstream_ids(downstream)
+        for eid in candidates:
+            if (
+                self._edge_upstream[eid] == upstream
+                and self._edge_downstream[eid] == downstream
+                and self._edge_key[eid] == key
+                and self._edge_flags[eid] == flags
+            ):
+                return eid
+        return None
+
+    def add_task(self, task: Task) -> None:
+        if task not in self._task_ids:
+            self._task_ids[task] = len(self._tasks)
+            self._tasks.append(task)
+
+    def remove_task(self, task: Task) -> Set[Edge]:
+        """
+        Removes a task and returns all of the edges that referenced it, which are
+        removed as well.
+        """
+        tid = self._task_ids.pop(task)
+        eids = set(self._upstream_ids(tid)) | set(self._downstream_ids(tid))
+        edges = {self._make_edge(eid) for eid in eids}
+        for eid in eids:
+            self._edge_flags[eid] |= _REMOVED
+        self._n_removed_edges += len(eids)
+        self._tasks[tid] = None
+        return edges
+
+    def add_edge(self, edge: Edge) -> None:
+        if self._find_edge(edge) is not None:
+            return
+
+        if edge.key not in self._key_ids:
+            self._key_ids[edge.key] = len(self._keys)
+            self._keys.append(edge.key)
+
+        upstream = self._task_ids[edge.upstream_task]
+        downstream = self._task_ids[edge.downstream_task]
+        eid = len(self._edge_flags)
+        self._edge_upstream.append(upstream)
+        self._edge_downstream.append(downstream)
+        self._edge_key.append(self._key_ids[edge.key])
+        self._edge_flags.append(
+            (_MAPPED if edge.mapped else 0) | (_FLATTENED if edge.flattened else 0)
+        )
+
+        # rebuilding geometrically keeps the overflow lists (and their cost) bounded
+        if eid + 1 - self._n_indexed > max(self._n_indexed, 1024):
+            self._build_index()
+        else:
+            self._pending_down.setdefault(upstream, []).append(eid)
+            self._pending_up.setdefault(downstream, []).append(eid)
+
+    def remove_edge(self, edge: Edge) -> None:
+        eid = self._find_edge(edge)
+        if eid is not None:
+            self._edge_flags[eid] |= _REMOVED
+            self._n_removed_edges += 1
+
+    def edges_to(self, task: Task) -> Set[Edge]:
+        return {self._make_edge(eid) for eid in self._upstream_ids(self._task_ids[task])}
+
+    def edges_from(self, task: Task) -> Set[Edge]:
+        return {
+            self._make_edge(eid) for eid in self._downstream_ids(self._task_ids[task])
+        }
+
+    def upstream_tasks(self, task: Task) -> List[Task]:
+        """
+        Returns the upstream task of every edge leading to `task`; a task appears once
+        for each edge connecting it to `task`.
+        """
+        return [
+            self._tasks[self._edge_upstream[eid]]  # type: ignore
+            for eid in self._upstream_ids(self._task_ids[task])
+        ]
+
+    def downstream_tasks(self, task: Task) -> List[Task]:
+        """
+        Returns the downstream task of every edge leading from `task`; a task appears
+        once for each edge connecting it to `task`.
+        """
+        return [
+            self._tasks[self._edge_downstream[eid]]  # type: ignore
+            for eid in self._downstream_ids(self._task_ids[task])
+        ]
+
+    def copy(self) -> "CompactTaskGraph":
+        new = type(self)()
+        new._tasks = self._tasks.copy()
+        new._task_ids = self._task_ids.copy()
+        new._keys = self._keys.copy()
+        new._key_ids = self._key_ids.copy()
+        for attr in [
+            "_edge_upstream",
+            "_edge_downstream",
+            "_edge_key",
+            "_edge_flags",
+            "_down_offsets",
+            "_down_edges",
+            "_up_offsets",
+            "_up_edges",
+        ]:
+            setattr(new, attr, array(getattr(self, attr).typecode, getattr(self, attr)))
+        new._n_removed_edges = self._n_removed_edges
+        new._n_indexed = self._n_indexed
+        new._pending_down = {t: e.copy() for t, e in self._pending_down.items()}
+        new._pending_up = {t: e.copy() for t, e in self._pending_up.items()}
+        return new
+
+    def stats(self) -> Dict[str, Any]:
+        edge_size = sum(
+            sys.getsizeof(a)
+            for a in [
+                self._edge_upstream,
+                self._edge_downstream,
+                self._edge_key,
+                self._edge_flags,
+            ]
+        )
+        index_size = sum(
+            sys.getsizeof(a)
+            for a in [
+                self._down_offsets,
+                self._down_edges,
+                self._up_offsets,
+                self._up_edges,
+                self._tasks,
+                self._task_ids,
+                self._keys,
+                self._key_ids,
+            ]
+        ) + sum(
+            sys.getsizeof(pending) + sum(sys.getsizeof(e) for e in pending.values())
+            for pending in (self._pending_down, self._pending_up)
+        )
+        return dict(
+            backend=self.backend,
+            tasks=len(self._task_ids),
+            edges=len(self.edges),
+            edge_bytes=edge_size,
+            index_bytes=index_size,
+            total_bytes=edge_size + index_size,
+        )
+
+    @classmethod
+    def from_edges(
+        cls, tasks: Iterable[Task], edges: Iterable[Edge]
+    ) -> "CompactTaskGraph":
+        graph = cls()
+        for task in tasks:
+            graph.add_task(task)
+        for edge in edges:
+            graph.add_edge(edge)
+        return graph
@@ -715,6 +715,8 @@ class Task(metaclass=TaskMetaclass):
         upstream_tasks: Iterable[Any] = None,
         flow: "Flow" = None,
         task_args: dict = None,
+        chunk_size: int = None,
+        max_mapped_in_flight: int = None,
         **kwargs: Any,
     ) -> "Task":
         """
@@ -737,11 +739,22 @@ class Task(metaclass=TaskMetaclass):
                 flow in context if no flow is specified
             - task_args (dict, optional): a dictionary of task attribute keyword arguments,
                 these attributes will be set on the new copy
+            - chunk_size (int, optional): if provided, consecutive mapped children are
+                grouped into chunks of this many elements, and each chunk is submitted
+                to the executor as a single unit of work. Every element still gets its
+                own state (and retries, state handlers and results), but the scheduling
+                overhead is paid once per chunk, which helps when mapping a cheap task
+                over many elements
+            - max_mapped_in_flight (int, optional): if provided, at most this many mapped
+                children are left running at once; further children are submitted as
+                earlier ones complete. Overrides the executor's `max_mapped_in_flight`
             - **kwargs: keyword arguments to map over, which will elementwise be bound to the
                 Task's `run` method
 
         Raises:
             - AttributeError: if any passed `task_args` are not attributes of the original
+            - ValueError: if `chunk_size` or `max_mapped_in_flight` is not a positive
+                integer
 
         Returns:
             - Task: a new Task instance
@@ -753,9 +766,19 @@ class Task(metaclass=TaskMetaclass):
                         t=type(arg), preview=repr(arg)[:10]
                     )
                 )
+        for name, value in [
+            ("chunk_size", chunk_size),
+            ("max_mapped_in_flight", max_mapped_in_flight),
+        ]:
+            if value is not None and (not isinstance(value, int) or value < 1):
+                raise ValueError(
+                    "`{}` must be a positive integer, got {!r}".format(name, value)
+                )
         task_args = task_args.copy() if task_args else {}
         task_args.setdefault("nout", None)
         new = self.copy(**task_args)
+        new.chunk_size = chunk_size
+        new.max_mapped_in_flight = max_mapped_in_flight
         return new.bind(
             *args, mapped=True, upstream_tasks=upstream_tasks, flow=flow, **kwargs
         )
@@ -176,7 +176,9 @@ class CloudTaskRunner(TaskRunner):
 
         # we assign this so it can be shared with heartbeat thread
         self.task_run_id = context.get("task_run_id", "")  # type: str
-        context.update(checkpointing=True)
+        # results are written before the task run's state (and so the results'
+        # locations) is sent to the backend, rather than in the background
+        context.update(checkpointing=True, checkpoint_writer=None)
 
         return super().initialize_run(state=state, context=context)
 
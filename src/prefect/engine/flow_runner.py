@@ -1,19 +1,24 @@
+import collections
+import itertools
+import threading
 from typing import (
     Any,
     Callable,
     Dict,
     Iterable,
     Iterator,
+    List,
     NamedTuple,
     Optional,
     Set,
 )
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 
 import pendulum
 import prefect
 from prefect.core import Edge, Flow, Task
 from prefect.engine.result import Result
+from prefect.engine.result.writer import ResultWriter
 from prefect.engine.results import ConstantResult
 from prefect.engine.runner import ENDRUN, Runner, call_state_handlers
 from prefect.engine.state import (
@@ -25,8 +30,10 @@ from prefect.engine.state import (
     State,
     Success,
 )
+from prefect.executors.limits import TaskTagLimiter
 from prefect.utilities import executors
-from prefect.utilities.collections import flatten_seq
+from prefect.utilities.collections import flatten_seq, merge_dicts
+from prefect.utilities.executors import release_result
 
 FlowRunnerInitializeResult = NamedTuple(
     "FlowRunnerInitializeResult",
@@ -60,6 +67,14 @@ class FlowRunner(Runner):
             `state_handler(fr: FlowRunner, old_state: State, new_state: State) -> Optional[State]`
             If multiple functions are passed, then the `new_state` argument will be the
             result of the previous handler.
+        - scheduling (str, optional): how tasks are submitted to the executor. With
+            `"sorted"`, tasks are submitted one at a time in topological order, and
+            each mapped task waits for its upstream tasks to finish before any later
+            task is submitted. With `"ready_queue"`, tasks are submitted as soon as
+            their upstream tasks have been submitted, and mapped tasks are set aside
+            until their upstream tasks finish, so that independent branches of the flow
+            can proceed concurrently. Defaults to the value of
+            `engine.flow_runner.scheduling` in your prefect configuration.
 
     Note: new FlowRunners are initialized within the call to `Flow.run()` and in general,
     this is the endpoint through which FlowRunners will be interacted with most frequently.
@@ -83,11 +98,20 @@ class FlowRunner(Runner):
         flow: Flow,
         task_runner_cls: type = None,
         state_handlers: Iterable[Callable] = None,
+        scheduling: str = None,
     ):
         self.flow = flow
         if task_runner_cls is None:
             task_runner_cls = prefect.engine.get_default_task_runner_class()
         self.task_runner_cls = task_runner_cls
+        if scheduling is None:
+            scheduling = prefect.config.engine.flow_runner.scheduling
+        if scheduling not in ("sorted", "ready_queue"):
+            raise ValueError(
+                f"Unknown scheduling mode {scheduling!r}, expected one of "
+                "'sorted' or 'ready_queue'"
+            )
+        self.scheduling = scheduling
         super().__init__(state_handlers=state_handlers)
 
     def __repr__(self) -> str:
@@ -430,6 +454,19 @@ class FlowRunner(Runner):
         if set(return_tasks).difference(self.flow.tasks):
             raise ValueError("Some tasks in return_tasks were not found in the flow.")
 
+        # the number of downstream tasks that have yet to be submitted for each task;
+        # once all of them have been submitted, nothing else reads the task's state, so
+        # its in-memory result is released. The states of reference, terminal and
+        # return tasks are needed to determine the flow run state and are always kept.
+        kept_tasks = (
+            self.flow.reference_tasks() | self.flow.terminal_tasks() | set(return_tasks)
+        )
+        unconsumed = {
+            t: len(self.flow.downstream_tasks(t))
+            for t in self.flow.tasks
+            if t not in kept_tasks
+        }
+
         def extra_context(task: Task, task_index: int = None) -> dict:
             return {
                 "task_name": task.name,
@@ -437,196 +474,429 @@ class FlowRunner(Runner):
                 "task_index": task_index,
             }
 
-        # -- process each task in order
-
-        with self.check_for_cancellation(), executor.start():
-
-            for task in self.flow.sorted_tasks():
-                task_state = task_states.get(task)
-
-                # if a task is a constant task, we already know its return value
-                # no need to use up resources by running it through a task runner
-                if task_state is None and isinstance(
-                    task, prefect.tasks.core.constants.Constant
-                ):
-                    task_states[task] = task_state = Success(result=task.value)
-
-                # Always restart completed resource setup/cleanup tasks and
-                # secret tasks unless they were explicitly cached.
-                # TODO: we only need to rerun these tasks if any pending
-                # downstream tasks depend on them.
-                if (
-                    isinstance(
-                        task,
-                        (
-                            prefect.tasks.core.resource_manager.ResourceSetupTask,
-                            prefect.tasks.core.resource_manager.ResourceCleanupTask,
-                            prefect.tasks.secrets.SecretBase,
-                        ),
-                    )
-                    and task_state is not None
-                    and task_state.is_finished()
-                    and not task_state.is_cached()
-                ):
-                    task_states[task] = task_state = Pending()
-
-                # if the state is finished, don't run the task, just use the provided state if
-                # the state is cached / mapped, we still want to run the task runner pipeline
-                # steps to either ensure the cache is still valid / or to recreate the mapped
-                # pipeline for possible retries
-                if (
-                    isinstance(task_state, State)
-                    and task_state.is_finished()
-                    and not task_state.is_cached()
-                    and not task_state.is_mapped()
-                ):
-                    continue
-
-                upstream_states = {}  # type: Dict[Edge, State]
-
-                # this dictionary is used exclusively for "reduce" tasks in particular we store
-                # the states / futures corresponding to the upstream children, and if running
-                # on Dask, let Dask resolve them at the appropriate time.
-                # Note: this is an optimization that allows Dask to resolve the mapped
-                # dependencies by "elevating" them to a function argument.
-                upstream_mapped_states = {}  # type: Dict[Edge, list]
+        def submit_task(task: Task) -> None:
+            """
+            Submits a task (or, for mapped tasks, its children) to the executor and
+            records its state in `task_states`.
+            """
+            task_state = task_states.get(task)
+
+            # if a task is a constant task, we already know its return value
+            # no need to use up resources by running it through a task runner
+            if task_state is None and isinstance(
+                task, prefect.tasks.core.constants.Constant
+            ):
+                task_states[task] = task_state = Success(result=task.value)
+
+            # Always restart completed resource setup/cleanup tasks and
+            # secret tasks unless they were explicitly cached.
+            # TODO: we only need to rerun these tasks if any pending
+            # downstream tasks depend on them.
+            if (
+                isinstance(
+                    task,
+                    (
+                        prefect.tasks.core.resource_manager.ResourceSetupTask,
+                        prefect.tasks.core.resource_manager.ResourceCleanupTask,
+                        prefect.tasks.secrets.SecretBase,
+                    ),
+                )
+                and task_state is not None
+                and task_state.is_finished()
+                and not task_state.is_cached()
+            ):
+                task_states[task] = task_state = Pending()
+
+            # if the state is finished, don't run the task, just use the provided state if
+            # the state is cached / mapped, we still want to run the task runner pipeline
+            # steps to either ensure the cache is still valid / or to recreate the mapped
+            # pipeline for possible retries
+            if (
+                isinstance(task_state, State)
+                and task_state.is_finished()
+                and not task_state.is_cached()
+                and not task_state.is_mapped()
+            ):
+                return
+
+            upstream_states = {}  # type: Dict[Edge, State]
+
+            # this dictionary is used exclusively for "reduce" tasks in particular we store
+            # the states / futures corresponding to the upstream children, and if running
+            # on Dask, let Dask resolve them at the appropriate time.
+            # Note: this is an optimization that allows Dask to resolve the mapped
+            # dependencies by "elevating" them to a function argument.
+            upstream_mapped_states = {}  # type: Dict[Edge, list]
+
+            # -- process each edge to the task
+            for edge in self.flow.edges_to(task):
+
+                # load the upstream task states (supplying Pending as a default)
+                upstream_states[edge] = task_states.get(
+                    edge.upstream_task, Pending(message="Task state not available.")
+                )
 
-                # -- process each edge to the task
-                for edge in self.flow.edges_to(task):
+                # if the edge is flattened and not the result of a map, then we
+                # preprocess the upstream states. If it IS the result of a
+                # map, it will be handled in `prepare_upstream_states_for_mapping`
+                if edge.flattened:
+                    if not isinstance(upstream_states[edge], Mapped):
+                        upstream_states[edge] = executor.submit(
+                            executors.flatten_upstream_state, upstream_states[edge]
+                        )
 
-                    # load the upstream task states (supplying Pending as a default)
-                    upstream_states[edge] = task_states.get(
-                        edge.upstream_task, Pending(message="Task state not available.")
-                    )
+                # this checks whether the task is a "reduce" task for a mapped pipeline
+                # and if so, collects the appropriate upstream children
+                if not edge.mapped and isinstance(upstream_states[edge], Mapped):
+                    children = mapped_children.get(edge.upstream_task, [])
 
-                    # if the edge is flattened and not the result of a map, then we
-                    # preprocess the upstream states. If it IS the result of a
-                    # map, it will be handled in `prepare_upstream_states_for_mapping`
+                    # if the edge is flattened, then we need to wait for the mapped children
+                    # to complete and then flatten them
                     if edge.flattened:
-                        if not isinstance(upstream_states[edge], Mapped):
-                            upstream_states[edge] = executor.submit(
-                                executors.flatten_upstream_state, upstream_states[edge]
-                            )
+                        children = executors.flatten_mapped_children(
+                            mapped_children=children, executor=executor
+                        )
 
-                    # this checks whether the task is a "reduce" task for a mapped pipeline
-                    # and if so, collects the appropriate upstream children
-                    if not edge.mapped and isinstance(upstream_states[edge], Mapped):
-                        children = mapped_children.get(edge.upstream_task, [])
+                    upstream_mapped_states[edge] = children
 
-                        # if the edge is flattened, then we need to wait for the mapped children
-                        # to complete and then flatten them
-                        if edge.flattened:
-                            children = executors.flatten_mapped_children(
-                                mapped_children=children, executor=executor
-                            )
+            # augment edges with upstream constants
+            for key, val in self.flow.constants[task].items():
+                edge = Edge(
+                    upstream_task=prefect.tasks.core.constants.Constant(val),
+                    downstream_task=task,
+                    key=key,
+                )
+                upstream_states[edge] = Success(
+                    "Auto-generated constant value",
+                    result=ConstantResult(value=val),
+                )
 
-                        upstream_mapped_states[edge] = children
+            # handle mapped tasks
+            if any(edge.mapped for edge in upstream_states.keys()):
 
-                # augment edges with upstream constants
-                for key, val in self.flow.constants[task].items():
-                    edge = Edge(
-                        upstream_task=prefect.tasks.core.constants.Constant(val),
-                        downstream_task=task,
-                        key=key,
+                # wait on upstream states to determine the width of the pipeline
+                # this is the key to depth-first execution
+                upstream_states = executor.wait(
+                    {e: state for e, state in upstream_states.items()}
+                )
+                # we submit the task to the task runner to determine if
+                # we can proceed with mapping - if the new task state is not a Mapped
+                # state then we don't proceed
+                task_states[task] = executor.wait(
+                    executor.submit(
+                        run_task,
+                        task=task,
+                        state=task_state,  # original state
+                        upstream_states=upstream_states,
+                        context=task_contexts.get(task, {}),
+                        base_context=base_context,
+                        flow_result=self.flow.result,
+                        task_runner_cls=self.task_runner_cls,
+                        task_runner_state_handlers=task_runner_state_handlers,
+                        upstream_mapped_states=upstream_mapped_states,
+                        is_mapped_parent=True,
+                        extra_context=extra_context(task),
                     )
-                    upstream_states[edge] = Success(
-                        "Auto-generated constant value",
-                        result=ConstantResult(value=val),
+                )
+
+                # either way, we should now have enough resolved states to restructure
+                # the upstream states into upstream state dictionaries to iterate over;
+                # these are produced lazily so that streamed upstream results are
+                # consumed as the children are submitted
+                iter_upstream_states = executors.iter_upstream_states_for_mapping(
+                    task_states[task],
+                    upstream_states,
+                    mapped_children,
+                    executor=executor,
+                )
+
+                # children are submitted one at a time, or in chunks of `chunk_size`
+                # children which each run as a single unit of work and return the list
+                # of their children's states. Each child of a chunk is represented by a
+                # `(chunk, index)` pair, which executors resolve like any other nested
+                # future.
+                chunk_size = getattr(task, "chunk_size", None)
+                batches = iter(
+                    lambda: list(
+                        itertools.islice(iter_upstream_states, chunk_size or 1)
+                    ),
+                    [],
+                )
+
+                # the number of children left in flight can be limited per task or
+                # per executor, and is always limited when mapping over a stream.
+                # Once the limit is reached, no more children are submitted (or items
+                # taken from the stream) until some of those in flight complete.
+                streaming = any(
+                    edge.mapped and executors.is_stream(state.result)
+                    for edge, state in upstream_states.items()
+                )
+                max_in_flight = getattr(task, "max_mapped_in_flight", None) or getattr(
+                    executor, "max_mapped_in_flight", None
+                )
+                if streaming and not max_in_flight:
+                    max_in_flight = max(
+                        prefect.config.engine.flow_runner.stream_window, 1
                     )
+                # the children of each submission still in flight, keyed by the
+                # index of their first child
+                in_flight = {}  # type: Dict[int, List[Any]]
 
-                # handle mapped tasks
-                if any(edge.mapped for edge in upstream_states.keys()):
+                n_map_states = getattr(task_states[task], "n_map_states", 0)
+                metrics = dict(
+                    queued=0 if streaming else n_map_states, running=0, completed=0
+                )
+                executor.mapped_metrics[self.flow.slugs[task]] = metrics
+
+                submitted_states = []  # type: List[Any]
+
+                # each child is given a list of its upstream states, in the order of
+                # the edges, which are shared with the executor once for all children
+                upstream_edges = executor.share(list(upstream_states))
+
+                def current_state(idx: int) -> Optional[State]:
+                    # if we are on a future rerun of a partially complete flow run,
+                    # there might be mapped children in a retrying state; this check
+                    # looks into the current task state's map_states for such info
+                    if isinstance(task_state, Mapped):
+                        if len(task_state.map_states) >= idx + 1:
+                            return task_state.map_states[idx]
+                        return None
+                    return task_state
+
+                while True:
+                    # as many submissions as can be in flight at once (all of them,
+                    # without a limit) are handed to the executor together, so that
+                    # executors can send them in a handful of messages
+                    window = []  # type: List[list]
+                    window_size = 0
+                    for batch in batches:
+                        window.append(batch)
+                        window_size += len(batch)
+                        if (
+                            max_in_flight
+                            and metrics["running"] + window_size >= max_in_flight
+                        ):
+                            break
+                    if not window:
+                        break
 
-                    # wait on upstream states to determine the width of the pipeline
-                    # this is the key to depth-first execution
-                    upstream_states = executor.wait(
-                        {e: state for e, state in upstream_states.items()}
+                    starts = list(
+                        itertools.accumulate(
+                            [len(submitted_states)] + [len(b) for b in window[:-1]]
+                        )
                     )
-                    # we submit the task to the task runner to determine if
-                    # we can proceed with mapping - if the new task state is not a Mapped
-                    # state then we don't proceed
-                    task_states[task] = executor.wait(
-                        executor.submit(
-                            run_task,
+                    metrics["queued"] = max(metrics["queued"] - window_size, 0)
+                    metrics["running"] += window_size
+
+                    if chunk_size:
+                        chunks = executor.submit_many(
+                            run_task_chunk,
+                            [
+                                dict(
+                                    states=[
+                                        current_state(idx)
+                                        for idx in range(start, start + len(batch))
+                                    ],
+                                    upstream_states=[
+                                        list(child.values()) for child in batch
+                                    ],
+                                    start_index=start,
+                                )
+                                for start, batch in zip(starts, window)
+                            ],
+                            extra_contexts=[
+                                extra_context(task, task_index=start)
+                                for start in starts
+                            ],
                             task=task,
-                            state=task_state,  # original state
-                            upstream_states=upstream_states,
-                            context=dict(
-                                prefect.context, **task_contexts.get(task, {})
-                            ),
+                            context=task_contexts.get(task, {}),
+                            base_context=base_context,
                             flow_result=self.flow.result,
                             task_runner_cls=self.task_runner_cls,
                             task_runner_state_handlers=task_runner_state_handlers,
                             upstream_mapped_states=upstream_mapped_states,
-                            is_mapped_parent=True,
-                            extra_context=extra_context(task),
+                            upstream_edges=upstream_edges,
                         )
-                    )
-
-                    # either way, we should now have enough resolved states to restructure
-                    # the upstream states into a list of upstream state dictionaries to iterate over
-                    list_of_upstream_states = (
-                        executors.prepare_upstream_states_for_mapping(
-                            task_states[task],
-                            upstream_states,
-                            mapped_children,
-                            executor=executor,
-                        )
-                    )
-
-                    submitted_states = []
-
-                    for idx, states in enumerate(list_of_upstream_states):
-                        # if we are on a future rerun of a partially complete flow run,
-                        # there might be mapped children in a retrying state; this check
-                        # looks into the current task state's map_states for such info
-                        if (
-                            isinstance(task_state, Mapped)
-                            and len(task_state.map_states) >= idx + 1
-                        ):
-                            current_state = task_state.map_states[
-                                idx
-                            ]  # type: Optional[State]
-                        elif isinstance(task_state, Mapped):
-                            current_state = None
-                        else:
-                            current_state = task_state
-
-                        # this is where each child is submitted for actual work
-                        submitted_states.append(
-                            executor.submit(
+                        for chunk, batch in zip(chunks, window):
+                            submitted_states.extend(
+                                (chunk, i) for i in range(len(batch))
+                            )
+                    else:
+                        # this is where the children are submitted for actual work
+                        submitted_states.extend(
+                            executor.submit_many(
                                 run_task,
+                                [
+                                    dict(
+                                        state=current_state(start),
+                                        upstream_states=list(batch[0].values()),
+                                        context=dict(
+                                            task_contexts.get(task, {}),
+                                            map_index=start,
+                                        ),
+                                    )
+                                    for start, batch in zip(starts, window)
+                                ],
+                                extra_contexts=[
+                                    extra_context(task, task_index=start)
+                                    for start in starts
+                                ],
                                 task=task,
-                                state=current_state,
-                                upstream_states=states,
-                                context=dict(
-                                    prefect.context,
-                                    **task_contexts.get(task, {}),
-                                    map_index=idx,
-                                ),
+                                base_context=base_context,
                                 flow_result=self.flow.result,
                                 task_runner_cls=self.task_runner_cls,
                                 task_runner_state_handlers=task_runner_state_handlers,
                                 upstream_mapped_states=upstream_mapped_states,
-                                extra_context=extra_context(task, task_index=idx),
+                                upstream_edges=upstream_edges,
                             )
                         )
-                    if isinstance(task_states.get(task), Mapped):
-                        mapped_children[task] = submitted_states  # type: ignore
 
+                    if max_in_flight:
+                        # whole submissions are waited on together, so that the
+                        # children of a chunk are resolved (and run) at once
+                        for start, batch in zip(starts, window):
+                            in_flight[start] = submitted_states[
+                                start : start + len(batch)
+                            ]
+                        while metrics["running"] >= max_in_flight:
+                            done = executor.wait_any(in_flight)
+                            for first, children in list(done.items()):
+                                del in_flight[first]
+                                # completed children are replaced by their states,
+                                # unless their results are kept where they ran
+                                if not executor.results_on_workers:
+                                    submitted_states[first : first + len(children)] = [
+                                        executors.resolve_mapped_child(child)
+                                        for child in children
+                                    ]
+                                metrics["running"] -= len(children)
+                                metrics["completed"] += len(children)
+
+                if isinstance(task_states.get(task), Mapped):
+                    mapped_children[task] = submitted_states  # type: ignore
+
+            else:
+                task_states[task] = executor.submit(
+                    run_task,
+                    task=task,
+                    state=task_state,
+                    upstream_states=upstream_states,
+                    context=task_contexts.get(task, {}),
+                    base_context=base_context,
+                    flow_result=self.flow.result,
+                    task_runner_cls=self.task_runner_cls,
+                    task_runner_state_handlers=task_runner_state_handlers,
+                    upstream_mapped_states=upstream_mapped_states,
+                    extra_context=extra_context(task),
+                )
+
+        def release_upstream_results(task: Task) -> None:
+            """
+            Marks the states of a task's upstream tasks as consumed by it, releasing
+            the results of any upstream task whose downstream tasks have all been
+            submitted.
+            """
+            for upstream in self.flow.upstream_tasks(task):
+                if upstream not in unconsumed:
+                    continue
+                unconsumed[upstream] -= 1
+                if unconsumed[upstream]:
+                    continue
+                upstream_state = task_states.get(upstream)
+                if isinstance(upstream_state, State):
+                    task_states[upstream] = release_result(upstream_state)
                 else:
-                    task_states[task] = executor.submit(
-                        run_task,
-                        task=task,
-                        state=task_state,
-                        upstream_states=upstream_states,
-                        context=dict(prefect.context, **task_contexts.get(task, {})),
-                        flow_result=self.flow.result,
-                        task_runner_cls=self.task_runner_cls,
-                        task_runner_state_handlers=task_runner_state_handlers,
-                        upstream_mapped_states=upstream_mapped_states,
-                        extra_context=extra_context(task),
-                    )
+                    # drop our reference to the future so the executor can free it
+                    # once its downstream tasks have finished
+                    task_states.pop(upstream, None)
+                mapped_children.pop(upstream, None)
+
+        def blocking_futures(task: Task) -> Dict[Edge, Any]:
+            """
+            Returns the upstream futures that `submit_task` would wait on before it could
+            submit this task: the upstream states of a mapped task, and the children of
+            any mapped upstream task whose results are flattened into this one.
+            """
+            edges = self.flow.edges_to(task)
+            futures = {}  # type: Dict[Edge, Any]
+            if any(edge.mapped for edge in edges):
+                futures.update((e, task_states.get(e.upstream_task)) for e in edges)
+            for edge in edges:
+                upstream_state = task_states.get(edge.upstream_task)
+                if edge.flattened and isinstance(upstream_state, Mapped):
+                    futures[edge] = mapped_children.get(edge.upstream_task, [])
+            return futures
+
+        # -- process each task
+
+        # with write-behind checkpointing, task results are written in the background
+        # while downstream tasks run, and the flow run waits for all writes to finish
+        writer = None  # type: Optional[ResultWriter]
+        if prefect.config.flows.checkpoint_write_behind:
+            writer = ResultWriter(
+                max_workers=prefect.config.flows.checkpoint_write_behind_workers
+            )
+
+        # task runs with tags which have a concurrency limit wait for a free slot of
+        # each of those tags, held by the executor's limiter
+        task_tag_limits = dict(prefect.config.flows.get("task_tag_limits") or {})
+        task_tag_limits.update(prefect.context.get("task_tag_limits") or {})
+
+        with self.check_for_cancellation(), executor.start(), ExitStack() as stack:
+            if writer is not None:
+                stack.enter_context(writer)
+            limiter = None  # type: Optional[TaskTagLimiter]
+            if task_tag_limits:
+                limiter = stack.enter_context(executor.limit_task_tags(task_tag_limits))
+
+            # the flow run's context is shared by every task run, so it's given to the
+            # executor once; each submission only carries its task's own context
+            base_context = dict(prefect.context)
+            if writer is not None:
+                base_context.update(checkpoint_writer=writer)
+            if limiter is not None:
+                base_context.update(task_tag_limiter=limiter)
+            base_context = executor.share(base_context)
+
+            if self.scheduling == "sorted":
+                for task in self.flow.sorted_tasks():
+                    submit_task(task)
+                    release_upstream_results(task)
+
+            else:
+                # submit each task once all of its upstream tasks have been submitted.
+                # Tasks which need upstream results before they can be submitted (such
+                # as mapped tasks) are set aside until the executor reports that those
+                # results are available, so that they don't hold up any other tasks.
+                sorted_tasks = self.flow.sorted_tasks()
+                unresolved = {t: len(self.flow.upstream_tasks(t)) for t in sorted_tasks}
+                ready = collections.deque(t for t in sorted_tasks if not unresolved[t])
+                blocked = {}  # type: Dict[Task, Dict[Edge, Any]]
+
+                while ready or blocked:
+                    submitted = []
+                    while ready:
+                        task = ready.popleft()
+                        futures = blocking_futures(task)
+                        if futures:
+                            blocked[task] = futures
+                        else:
+                            submit_task(task)
+                            submitted.append(task)
+
+                    if blocked and not submitted:
+                        for task in list(executor.wait_any(blocked)):
+                            del blocked[task]
+                            submit_task(task)
+                            submitted.append(task)
+
+                    for task in submitted:
+                        release_upstream_results(task)
+                        for downstream in self.flow.downstream_tasks(task):
+                            unresolved[downstream] -= 1
+                            if not unresolved[downstream]:
+                                ready.append(downstream)
 
             # ---------------------------------------------
             # Collect results
@@ -640,12 +910,26 @@ class FlowRunner(Runner):
 
             # wait until all terminal tasks are finished
             final_tasks = terminal_tasks.union(reference_tasks).union(return_tasks)
-            final_states = executor.wait(
-                {
-                    t: task_states.get(t, Pending("Task not evaluated by FlowRunner."))
-                    for t in final_tasks
-                }
-            )
+            final_futures = {
+                t: task_states.get(t, Pending("Task not evaluated by FlowRunner."))
+                for t in final_tasks
+            }
+            if executor.results_on_workers:
+                # only the states of return tasks are gathered with their results
+                final_states = executor.wait(
+                    {t: f for t, f in final_futures.items() if t in return_tasks}
+                )
+                final_states.update(
+                    executor.wait_for_states(
+                        {
+                            t: f
+                            for t, f in final_futures.items()
+                            if t not in return_tasks
+                        }
+                    )
+                )
+            else:
+                final_states = executor.wait(final_futures)
 
             # also wait for any children of Mapped tasks to finish, and add them
             # to the dictionary to determine flow state
@@ -654,13 +938,58 @@ class FlowRunner(Runner):
                 if s.is_mapped():
                     # ensure we wait for any mapped children to complete
                     if t in mapped_children:
-                        s.map_states = executor.wait(mapped_children[t])
-                    s.result = [ms.result for ms in s.map_states]
+                        wait = (
+                            executor.wait
+                            if t in return_tasks
+                            else executor.wait_for_states
+                        )
+                        s.map_states = [
+                            executors.resolve_mapped_child(c)
+                            for c in wait(mapped_children[t])
+                        ]
+                    s.result = s.map_states.results
                     all_final_states[t] = s.map_states
 
+            # every mapped child has completed by now
+            for metrics in executor.mapped_metrics.values():
+                metrics["completed"] += metrics["running"]
+                metrics["running"] = 0
+
+            if limiter is not None:
+                executor.task_tag_metrics = limiter.metrics()
+                for tag, metrics in executor.task_tag_metrics.items():
+                    self.logger.info(
+                        "Task tag %r (limit %d): %d task runs, at most %d waiting at "
+                        "once, %.2fs total wait (%.2fs longest)",
+                        tag,
+                        metrics["limit"],
+                        metrics["runs"],
+                        metrics["max_waiting"],
+                        metrics["total_wait"],
+                        metrics["max_wait"],
+                    )
+
             assert isinstance(final_states, dict)
 
+            write_errors = writer.wait() if writer is not None else {}
+
+        # tasks whose results failed to be written fail, as does the flow run
+        write_failures = set()
+        tasks_by_slug = {slug: t for t, slug in self.flow.slugs.items()}
+        for (slug, map_index), exc in write_errors.items():
+            self.logger.error("Failed to write the result of task %r: %r", slug, exc)
+            failed = Failed(f"Failed to write the task's result: {exc!r}", result=exc)
+            write_failures.add(failed)
+            task = tasks_by_slug.get(slug)
+            if task not in final_states:
+                continue
+            if map_index is None:
+                final_states[task] = failed
+            elif final_states[task].is_mapped():
+                final_states[task].map_states[map_index] = failed  # type: ignore
+
         key_states = set(flatten_seq([all_final_states[t] for t in reference_tasks]))
+        key_states.update(write_failures)
         terminal_states = set(
             flatten_seq([all_final_states[t] for t in terminal_tasks])
         )
@@ -727,6 +1056,35 @@ class FlowRunner(Runner):
         return state
 
 
+# the most recent merge of a shared flow run config in each thread, as
+# `(current_config, shared_config, merged_config)`
+_shared_config_merges = threading.local()
+
+
+def _merge_shared_config(shared_config: Any) -> Any:
+    """
+    Merges the config of a flow run's shared context into the current context's
+    config. The shared context isn't modified during a flow run, so the merged config
+    is reused by every task run in the same thread instead of being merged (and
+    copied) again for each of them.
+
+    Args:
+        - shared_config (Any): the config of the shared context
+
+    Returns:
+        - Any: the merged config
+    """
+    current = prefect.context.get("config", {})
+    if shared_config is current:
+        return current
+    last = getattr(_shared_config_merges, "value", None)
+    if last is not None and last[0] is current and last[1] is shared_config:
+        return last[2]
+    merged = merge_dicts(current, shared_config)
+    _shared_config_merges.value = (current, shared_config, merged)
+    return merged
+
+
 def run_task(
     task: Task,
     state: State,
@@ -737,6 +1095,8 @@ def run_task(
     task_runner_state_handlers: Iterable[Callable],
     upstream_mapped_states: Dict[Edge, list],
     is_mapped_parent: bool = False,
+    base_context: Dict[str, Any] = None,
+    upstream_edges: List[Edge] = None,
 ) -> State:
     """
     Runs a specific task. This method is intended to be called by submitting it to
@@ -756,19 +1116,43 @@ def run_task(
             corresponding to mapped children dependencies
         - is_mapped_parent (bool): a boolean indicating whether this task run is the
             run of a parent mapped task
+        - base_context (Dict[str, Any], optional): the context shared by every task
+            run of the flow run, which `context` is layered on top of
+        - upstream_edges (List[Edge], optional): the edges of the upstream states,
+            if `upstream_states` is a list of the states in the same order rather
+            than a dictionary; mapped children are given their upstream states this
+            way, so that the edges they share are only sent to the executor once
 
     Returns:
         - State: `State` representing the final post-run state of the `Flow`.
     """
+    if upstream_edges is not None:
+        upstream_states = dict(zip(upstream_edges, upstream_states))
+    config = None
+    if base_context is not None:
+        context = dict(base_context, **context)
+        # the flow run's config is set once the context is entered, so that it's
+        # only merged into the current config once per thread
+        if "config" in context:
+            config = _merge_shared_config(context.pop("config"))
     with prefect.context(context):
+        if config is not None:
+            context["config"] = prefect.context["config"] = config
+        upstream_states = {
+            edge: executors.resolve_mapped_child(upstream_state)
+            for edge, upstream_state in upstream_states.items()
+        }
         # Update upstream_states with info from upstream_mapped_states
         for edge, upstream_state in upstream_states.items():
             if not edge.mapped and upstream_state.is_mapped():
                 assert isinstance(upstream_state, Mapped)  # mypy assert
-                upstream_state.map_states = upstream_mapped_states.get(
-                    edge, upstream_state.map_states
-                )
-                upstream_state.result = [s.result for s in upstream_state.map_states]
+                upstream_state.map_states = [
+                    executors.resolve_mapped_child(child)
+                    for child in upstream_mapped_states.get(
+                        edge, upstream_state.map_states
+                    )
+                ]
+                upstream_state.result = upstream_state.map_states.results
         task_runner = task_runner_cls(
             task=task,
             state_handlers=task_runner_state_handlers,
@@ -780,3 +1164,61 @@ def run_task(
             is_mapped_parent=is_mapped_parent,
             context=context,
         )
+
+
+def run_task_chunk(
+    task: Task,
+    states: List[Optional[State]],
+    upstream_states: List[Dict[Edge, State]],
+    context: Dict[str, Any],
+    start_index: int,
+    flow_result: Result,
+    task_runner_cls: Callable,
+    task_runner_state_handlers: Iterable[Callable],
+    upstream_mapped_states: Dict[Edge, list],
+    base_context: Dict[str, Any] = None,
+    upstream_edges: List[Edge] = None,
+) -> List[State]:
+    """
+    Runs a chunk of consecutive mapped children of a task, one after another. This
+    method is intended to be called by submitting it to an executor, so that the
+    whole chunk is a single unit of work.
+
+    Args:
+        - task (Task): the task to run
+        - states (List[Optional[State]]): the starting state of each child
+        - upstream_states (List[Dict[Edge, State]]): the upstream states of each child
+        - context (Dict[str, Any]): a context dictionary for the task runs; each child
+            is given its own `map_index`
+        - start_index (int): the map index of the first child in the chunk
+        - flow_result (Result): the `Result` associated with the flow (if any)
+        - task_runner_cls (Callable): the `TaskRunner` class to use
+        - task_runner_state_handlers (Iterable[Callable]): A list of state change
+            handlers that will be provided to the task_runner, and called
+            whenever a task changes state.
+        - upstream_mapped_states (Dict[Edge, list]): dictionary of upstream states
+            corresponding to mapped children dependencies
+        - base_context (Dict[str, Any], optional): the context shared by every task
+            run of the flow run, which `context` is layered on top of
+        - upstream_edges (List[Edge], optional): the edges of the upstream states, if
+            the upstream states of each child are lists of the states in the same
+            order (see `run_task`)
+
+    Returns:
+        - List[State]: the final state of each child, in order
+    """
+    return [
+        run_task(
+            task=task,
+            state=state,
+            upstream_states=child_upstream_states,
+            context=dict(context, map_index=start_index + i),
+            flow_result=flow_result,
+            task_runner_cls=task_runner_cls,
+            task_runner_state_handlers=task_runner_state_handlers,
+            upstream_mapped_states=upstream_mapped_states,
+            base_context=base_context,
+            upstream_edges=upstream_edges,
+        )
+        for i, (state, child_upstream_states) in enumerate(zip(states, upstream_states))
+    ]
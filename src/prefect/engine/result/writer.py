@@ -0,0 +1,129 @@
+"""
+Writes checkpointed task results in the background, so that downstream tasks can run
+while results are being persisted. See the `flows.checkpoint_write_behind` setting.
+"""
+import threading
+import uuid
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+import prefect
+from prefect.engine.result.base import Result, ResultNotImplementedError
+
+# the writers of this process, so that writers passed to other processes (for example
+# in the context of a task run submitted to a Dask cluster) unpickle as `None`
+_writers = weakref.WeakValueDictionary()  # type: weakref.WeakValueDictionary
+
+
+def _get_writer(writer_id: str) -> Optional["ResultWriter"]:
+    return _writers.get(writer_id)
+
+
+class ResultWriter:
+    """
+    Writes results with a bounded pool of background threads.
+
+    `write` returns a result which holds the value in memory right away, so that
+    it can be handed to downstream tasks, and sets the result's `location` once the
+    value is written. `wait` blocks until every write has finished and returns the
+    errors of those that failed.
+
+    Writers are only usable in the process that created them: a pickled writer is
+    unpickled as `None` in any other process, where results are written as usual.
+
+    Args:
+        - max_workers (int, optional): the number of threads writing results
+        - max_pending (int, optional): the number of writes which can be queued or in
+            progress at once; once reached, `write` blocks until a write finishes.
+            Defaults to twice `max_workers`.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = None):
+        self.id = str(uuid.uuid4())
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="prefect-result-writer"
+        )
+        self._slots = threading.BoundedSemaphore(max_pending or 2 * max_workers)
+        self._lock = threading.Lock()
+        self._pending = []  # type: List[Tuple[Hashable, Future]]
+        _writers[self.id] = self
+
+    def __reduce__(self) -> tuple:
+        return (_get_writer, (self.id,))
+
+    def __enter__(self) -> "ResultWriter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._pool.shutdown(wait=True)
+        _writers.pop(self.id, None)
+
+    def _write(
+        self,
+        result: Result,
+        pending: Result,
+        value: Any,
+        kwargs: Dict[str, Any],
+        context: Dict[str, Any],
+    ) -> None:
+        try:
+            with prefect.context(context):
+                written = result.write(value, **kwargs)
+            pending.location = written.location
+        except ResultNotImplementedError:
+            pass
+        finally:
+            self._slots.release()
+
+    def write(
+        self,
+        key: Hashable,
+        result: Result,
+        value: Any,
+        kwargs: Dict[str, Any],
+        context: Dict[str, Any] = None,
+    ) -> Result:
+        """
+        Starts writing a value in the background with `result.write`.
+
+        Args:
+            - key (Hashable): identifies the write among the errors returned by `wait`
+            - result (Result): the result to write the value with
+            - value (Any): the value to write
+            - kwargs (Dict[str, Any]): the keyword arguments for `result.write`
+            - context (Dict[str, Any], optional): the context to write the value in
+
+        Returns:
+            - Result: a copy of `result` with the value, whose `location` is set once
+                the value is written
+        """
+        pending = result.from_value(value)
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(
+                self._write, result, pending, value, kwargs, context or {}
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.append((key, future))
+        return pending
+
+    def wait(self) -> Dict[Hashable, Exception]:
+        """
+        Waits for every write started so far to finish.
+
+        Returns:
+            - Dict[Hashable, Exception]: the error raised by each write that failed,
+                keyed by the key it was started with
+        """
+        with self._lock:
+            pending, self._pending = self._pending, []
+        errors = {}
+        for key, future in pending:
+            exc = future.exception()
+            if exc is not None:
+                errors[key] = exc
+        return errors
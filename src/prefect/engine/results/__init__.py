@@ -32,6 +32,7 @@ Results will only persist return data if checkpointing is turned on. To learn mo
 
 
 """
+from prefect.engine.results.cached_result import CachedResult
 from prefect.engine.results.constant_result import ConstantResult
 from prefect.engine.results.gcs_result import GCSResult
 from prefect.engine.results.local_result import LocalResult
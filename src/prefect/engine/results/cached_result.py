@@ -0,0 +1,254 @@
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from prefect.engine.result import Result
+from prefect.engine.results.local_result import LocalResult
+
+# the caches of the `CachedResult`s in this process, by id, so that copies of a result
+# (including copies unpickled in the same process) share its cache
+_CACHES = {}  # type: Dict[str, _ResultCache]
+_CACHES_LOCK = threading.Lock()
+
+
+class _ResultCache:
+    """
+    A size-bounded LRU cache of result values by location, whose evicted values are
+    optionally spilled to a local directory.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        sizeof: Callable[[Any], int],
+        spill: Optional[LocalResult],
+    ) -> None:
+        self.max_size = max_size
+        self.sizeof = sizeof
+        self.spill = spill
+        self.size = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._values = OrderedDict()  # type: OrderedDict[str, Tuple[Any, int]]
+        # the locations of spilled values, by the location of the result
+        self._spilled = {}  # type: Dict[str, str]
+        self._lock = threading.RLock()
+
+    def get(self, location: str) -> Tuple[bool, Any]:
+        with self._lock:
+            if location in self._values:
+                self._values.move_to_end(location)
+                self.hits += 1
+                return True, self._values[location][0]
+            spilled = self._spilled.get(location)
+
+        if spilled is not None and self.spill is not None:
+            try:
+                value = self.spill.read(spilled).value
+            except FileNotFoundError:
+                # the spilled value was evicted from disk
+                with self._lock:
+                    self._spilled.pop(location, None)
+            else:
+                with self._lock:
+                    self.disk_hits += 1
+                self.put(location, value)
+                return True, value
+
+        with self._lock:
+            self.misses += 1
+        return False, None
+
+    def put(self, location: str, value: Any) -> None:
+        size = self.sizeof(value)
+        evicted = []
+        with self._lock:
+            self.discard(location)
+            if size > self.max_size:
+                evicted.append((location, value))
+            else:
+                self._values[location] = (value, size)
+                self.size += size
+            while self.size > self.max_size:
+                old_location, (old_value, old_size) = self._values.popitem(last=False)
+                self.size -= old_size
+                evicted.append((old_location, old_value))
+
+        if self.spill is not None:
+            for old_location, old_value in evicted:
+                spilled = self.spill.write(old_value).location
+                with self._lock:
+                    self._spilled[old_location] = spilled
+
+    def discard(self, location: str) -> None:
+        with self._lock:
+            if location in self._values:
+                self.size -= self._values.pop(location)[1]
+            self._spilled.pop(location, None)
+
+    def __contains__(self, location: str) -> bool:
+        with self._lock:
+            return location in self._values or location in self._spilled
+
+
+class CachedResult(Result):
+    """
+    Result that wraps another result, keeping the values it reads and writes in an
+    in-memory LRU cache by location, so that reading the same location repeatedly (for
+    example, from several downstream tasks, retries or cached reruns) only downloads and
+    deserializes it once per process. Writes go through to the wrapped result.
+
+    Values evicted from memory can be spilled to a local directory (as
+    content-addressed `LocalResult`s), from which they're read back before falling back
+    to the wrapped result.
+
+    The cache is shared by all copies of a result in a process, and is not pickled with
+    it. Cached values are returned as they are, so tasks reading them shouldn't mutate
+    them.
+
+    Args:
+        - result (Result): the result to wrap, whose location and serializer this result
+            uses
+        - max_size (int, optional): the maximum total size of the values in memory, in
+            bytes, as estimated by `sizeof`. Defaults to 256 MiB
+        - spill_dir (str, optional): a local directory to spill values evicted from
+            memory to. Defaults to not spilling values
+        - spill_max_size (int, optional): the maximum total size, in bytes, of the values
+            spilled to `spill_dir`; the least recently used are deleted beyond it.
+            Defaults to no limit
+        - sizeof (Callable, optional): a function estimating the size of a value in
+            memory, in bytes. Defaults to `dask.sizeof.sizeof`
+    """
+
+    def __init__(
+        self,
+        result: Result,
+        max_size: int = 256 * 2**20,
+        spill_dir: str = None,
+        spill_max_size: int = None,
+        sizeof: Callable[[Any], int] = None,
+    ) -> None:
+        if max_size < 0:
+            raise ValueError("`max_size` must be non-negative")
+        if spill_max_size is not None and spill_dir is None:
+            raise ValueError("`spill_max_size` requires a `spill_dir`")
+        if sizeof is None:
+            from dask.sizeof import sizeof
+
+        self.result = result
+        self.max_size = max_size
+        self.spill_dir = spill_dir
+        self.spill_max_size = spill_max_size
+        self.sizeof = sizeof
+        self._cache_id = str(uuid.uuid4())
+        super().__init__(
+            value=result.value,
+            location=result.location or result._formatter,
+            serializer=result.serializer,
+        )
+
+    @property
+    def default_location(self) -> str:
+        return self.result.default_location
+
+    @property
+    def _cache(self) -> _ResultCache:
+        with _CACHES_LOCK:
+            if self._cache_id not in _CACHES:
+                spill = None
+                if self.spill_dir is not None:
+                    spill = LocalResult(
+                        dir=self.spill_dir,
+                        content_addressed=True,
+                        max_size=self.spill_max_size,
+                        serializer=self.serializer,
+                    )
+                _CACHES[self._cache_id] = _ResultCache(
+                    max_size=self.max_size, sizeof=self.sizeof, spill=spill
+                )
+            return _CACHES[self._cache_id]
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        The cache statistics of this result (and its copies) in this process: the
+        number of reads served from memory (`hits`), from the spill directory
+        (`disk_hits`) and from the wrapped result (`misses`), and the estimated size of
+        the values in memory (`size`), in bytes.
+        """
+        cache = self._cache
+        return dict(
+            hits=cache.hits,
+            disk_hits=cache.disk_hits,
+            misses=cache.misses,
+            size=cache.size,
+        )
+
+    def clear(self) -> None:
+        """
+        Removes all values from this result's cache in this process, and resets its
+        statistics.
+        """
+        with _CACHES_LOCK:
+            _CACHES.pop(self._cache_id, None)
+
+    def read(self, location: str) -> Result:
+        """
+        Reads a result from the cache, or from the wrapped result if it isn't cached,
+        and returns a new `Result` object with the corresponding value.
+
+        Args:
+            - location (str): the location to read from
+
+        Returns:
+            - Result: a new result instance with the data represented by the location
+        """
+        new = self.copy()
+        new.location = location
+
+        found, value = self._cache.get(location)
+        if found:
+            self.logger.debug("Read result at {} from the cache".format(location))
+            new.value = value
+            return new
+
+        new.value = self.result.read(location).value
+        self._cache.put(location, new.value)
+        return new
+
+    def write(self, value_: Any, **kwargs: Any) -> Result:
+        """
+        Writes a result with the wrapped result, and caches its value.
+
+        Args:
+            - value_ (Any): the value to write; will then be stored as the `value` attribute
+                of the returned `Result` instance
+            - **kwargs (optional): if provided, will be used to format the location template
+                to determine the location to write to
+
+        Returns:
+            - Result: a new Result instance with the location written to
+        """
+        new = self.copy()
+        new.value = value_
+        new.location = self.result.write(value_, **kwargs).location
+        assert new.location is not None
+        self._cache.put(new.location, value_)
+        return new
+
+    def exists(self, location: str, **kwargs: Any) -> bool:
+        """
+        Checks whether the target result is cached, or exists in the wrapped result.
+
+        Args:
+            - location (str): Location of the result in the specific result target.
+            - **kwargs (Any): string format arguments for `location`
+
+        Returns:
+            - bool: whether or not the target result exists
+        """
+        return location.format(**kwargs) in self._cache or self.result.exists(
+            location, **kwargs
+        )
@@ -1,12 +1,44 @@
+import hashlib
+import json
+import mmap
 import os
+import re
+import threading
+import time
+import uuid
 from slugify import slugify
-from typing import Any
+from typing import IO, Any, Dict
+
 
 import pendulum
 
 from prefect import config
 from prefect.engine.result import Result
 
+# the names of content-addressed result files, and of the index of their access times
+_CONTENT_ADDRESSED_NAME = re.compile(r"^[0-9a-f]{32}\.prefect_result$")
+_INDEX_NAME = ".prefect-result-index.json"
+
+# guards the index files of the results in this process
+_INDEX_LOCK = threading.Lock()
+
+
+class _HashingWriter:
+    """
+    Wraps a binary file opened for writing, hashing everything written to it.
+    """
+
+    def __init__(self, file: IO[bytes]) -> None:
+        self._file = file
+        self.hash = hashlib.blake2b(digest_size=16)
+
+    def write(self, data: Any) -> int:
+        self.hash.update(data)
+        return self._file.write(data)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._file, name)
+
 
 class LocalResult(Result):
     """
@@ -28,12 +60,32 @@ class LocalResult(Result):
         - validate_dir (bool, optional): a boolean specifying whether to validate the
             provided directory path; if `True`, the directory will be converted to an
             absolute path and created.  Defaults to `True`
+        - content_addressed (bool, optional): whether results are stored in files named
+            after a hash of their serialized contents, so that identical values are only
+            stored once; any `location` template is ignored when writing. Defaults to
+            `False`
+        - max_size (int, optional): the maximum total size, in bytes, of the
+            content-addressed results in `dir`; once results are written beyond it, the
+            least recently written or read results are deleted. Access times are
+            recorded in an index file in `dir`. Defaults to no limit
         - **kwargs (Any, optional): any additional `Result` initialization options
     """
 
     def __init__(
-        self, dir: str = None, validate_dir: bool = True, **kwargs: Any
+        self,
+        dir: str = None,
+        validate_dir: bool = True,
+        content_addressed: bool = False,
+        max_size: int = None,
+        **kwargs: Any
     ) -> None:
+        if max_size is not None and not content_addressed:
+            raise ValueError("`max_size` only applies to content-addressed results")
+        if max_size is not None and max_size < 0:
+            raise ValueError("`max_size` must be non-negative")
+        self.content_addressed = content_addressed
+        self.max_size = max_size
+
         full_prefect_path = os.path.abspath(config.home_dir)
         common_path = ""
         try:
@@ -81,9 +133,16 @@ class LocalResult(Result):
         self.logger.debug("Starting to read result from {}...".format(location))
 
         with open(os.path.join(self.dir, location), "rb") as f:
-            value = f.read()
+            if self.serializer.zero_copy and os.fstat(f.fileno()).st_size:
+                # the serializer builds the value from a view of the file, whose
+                # pages are only read (and copied, if written to) as they're used
+                value = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)  # type: Any
+            else:
+                value = f.read()
 
         new.value = self.serializer.deserialize(value)
+        if self.content_addressed:
+            self._record_access(os.path.join(self.dir, location))
 
         self.logger.debug("Finished reading result from {}...".format(location))
 
@@ -103,6 +162,9 @@ class LocalResult(Result):
         Returns:
             - Result: returns a new `Result` with both `value` and `location` attributes
         """
+        if self.content_addressed:
+            return self._write_content_addressed(value_)
+
         new = self.format(**kwargs)
         new.value = value_
         assert new.location is not None
@@ -112,16 +174,121 @@ class LocalResult(Result):
         full_path = os.path.join(self.dir, new.location)
         os.makedirs(os.path.dirname(full_path), exist_ok=True)
 
-        value = self.serializer.serialize(new.value)
+        # the value is written to a temporary file which is then moved into place, so
+        # that a failed write doesn't leave a partial result behind
+        partial_path = "{}.{}.partial".format(full_path, uuid.uuid4().hex)
+        try:
+            with open(partial_path, "wb") as f:
+                self.serializer.write_to(new.value, f)
+            os.replace(partial_path, full_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
+
+        new.location = full_path
+        self.logger.debug("Finished uploading result to {}...".format(new.location))
+
+        return new
+
+    def _write_content_addressed(self, value_: Any) -> Result:
+        """
+        Writes a result to a file named after the hash of its serialized contents,
+        unless a file with the same contents already exists.
+        """
+        new = self.copy()
+        new.value = value_
 
-        with open(full_path, "wb") as f:
-            f.write(value)
+        self.logger.debug("Starting to upload result to {}...".format(self.dir))
+
+        os.makedirs(self.dir, exist_ok=True)
+        partial_path = os.path.join(self.dir, "{}.partial".format(uuid.uuid4().hex))
+        try:
+            with open(partial_path, "wb") as f:
+                writer = _HashingWriter(f)
+                self.serializer.write_to(new.value, writer)  # type: ignore
+            fname = "{}.prefect_result".format(writer.hash.hexdigest())
+            full_path = os.path.join(self.dir, fname)
+            if os.path.exists(full_path):
+                # the same contents were already written
+                os.remove(partial_path)
+            else:
+                os.replace(partial_path, full_path)
+        except BaseException:
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+            raise
 
         new.location = full_path
+        self._record_access(full_path)
         self.logger.debug("Finished uploading result to {}...".format(new.location))
 
         return new
 
+    def _record_access(self, path: str) -> None:
+        """
+        Records the access time of a content-addressed result in the index, and
+        evicts the least recently used results if the results are over `max_size`.
+        """
+        fname = os.path.basename(path)
+        in_dir = os.path.normpath(os.path.dirname(path)) == os.path.normpath(self.dir)
+        if not in_dir or not _CONTENT_ADDRESSED_NAME.match(fname):
+            return
+
+        index_path = os.path.join(self.dir, _INDEX_NAME)
+        with _INDEX_LOCK:
+            try:
+                with open(index_path) as f:
+                    index = json.load(f)  # type: Dict[str, float]
+            except (OSError, ValueError):
+                index = {}
+            index[fname] = time.time()
+
+            if self.max_size is not None:
+                index = self._evict(index, keep=fname)
+
+            # the index is replaced as a whole, so that it's never read half-written;
+            # updates from other processes in between may be lost, which only affects
+            # the order in which results are evicted
+            partial_path = "{}.{}.partial".format(index_path, uuid.uuid4().hex)
+            with open(partial_path, "w") as f:
+                json.dump(index, f)
+            os.replace(partial_path, index_path)
+
+    def _evict(self, index: Dict[str, float], keep: str) -> Dict[str, float]:
+        """
+        Deletes the least recently used content-addressed results (other than `keep`)
+        until the results in `dir` fit in `max_size`, and returns the updated index.
+        """
+        # results written by other processes may be missing from the index, in which
+        # case their modification time is used
+        entries = []
+        for entry in os.scandir(self.dir):
+            if _CONTENT_ADDRESSED_NAME.match(entry.name):
+                stat = entry.stat()
+                accessed = index.get(entry.name, stat.st_mtime)
+                entries.append((accessed, entry.name, stat.st_size))
+
+        total = sum(size for _, _, size in entries)
+        for _, fname, size in sorted(entries):
+            if total <= self.max_size:  # type: ignore
+                break
+            if fname == keep:
+                continue
+            try:
+                os.remove(os.path.join(self.dir, fname))
+            except FileNotFoundError:
+                pass
+            total -= size
+            self.logger.debug("Evicted result {} from {}".format(fname, self.dir))
+
+        present = {name for _, name, _ in entries}
+        return {
+            name: accessed
+            for name, accessed in index.items()
+            if name in present and os.path.exists(os.path.join(self.dir, name))
+        }
+
     def exists(self, location: str, **kwargs: Any) -> bool:
         """
         Checks whether the target result exists in the file system.
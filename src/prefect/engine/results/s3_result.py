@@ -1,11 +1,181 @@
+import concurrent.futures
 import io
-from typing import Any, TYPE_CHECKING, Dict
+import threading
+from typing import Any, TYPE_CHECKING, Dict, List, Optional
 
+import cloudpickle
+
+import prefect
 from prefect.engine.result import Result
 
 if TYPE_CHECKING:
     import boto3
 
+# S3 requires the parts of a multipart upload (other than the last) to be at least 5 MiB
+MIN_PART_SIZE = 5 * 2**20
+
+# the S3 clients of this process, by their arguments and credentials, shared by all
+# `S3Result`s (and the copies unpickled in this process) that use the same ones
+_CLIENT_POOL = {}  # type: Dict[bytes, boto3.client]
+_CLIENT_POOL_LOCK = threading.Lock()
+
+
+class _S3MultipartWriter(io.RawIOBase):
+    """
+    A write-only file which uploads what's written to it to an S3 object, in parts of
+    `part_size` bytes which are uploaded concurrently as they fill up. At most
+    `max_concurrency` parts are uploaded at once, with writes blocking until one of
+    them completes. Objects smaller than a part are uploaded in a single request.
+    """
+
+    def __init__(
+        self,
+        client: "boto3.client",
+        bucket: str,
+        key: str,
+        part_size: int,
+        max_concurrency: int,
+    ) -> None:
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._buffer = bytearray()
+        self._written = 0
+        self._upload_id = None  # type: Optional[str]
+        self._pool = None  # type: Optional[concurrent.futures.ThreadPoolExecutor]
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._parts = []  # type: List[concurrent.futures.Future]
+
+    def writable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._written
+
+    def write(self, data: Any) -> int:
+        view = memoryview(data).cast("B")
+        position = 0
+        while position < len(view):
+            take = min(self._part_size - len(self._buffer), len(view) - position)
+            self._buffer += view[position : position + take]
+            position += take
+            if len(self._buffer) == self._part_size:
+                self._upload_part()
+        self._written += len(view)
+        return len(view)
+
+    def _upload_part(self) -> None:
+        if self._upload_id is None:
+            response = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key
+            )
+            self._upload_id = response["UploadId"]
+            self._pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self._max_concurrency,
+                thread_name_prefix="prefect-s3-upload",
+            )
+
+        body, self._buffer = bytes(self._buffer), bytearray()
+        part_number = len(self._parts) + 1
+
+        def upload() -> dict:
+            try:
+                response = self._client.upload_part(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                )
+                return dict(ETag=response["ETag"], PartNumber=part_number)
+            finally:
+                self._slots.release()
+
+        # bounds the number of parts held in memory
+        self._slots.acquire()
+        self._parts.append(self._pool.submit(upload))  # type: ignore
+
+    def complete(self) -> None:
+        """Uploads the rest of the object, and completes the upload"""
+        if self._upload_id is None:
+            self._client.put_object(
+                Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer)
+            )
+            return
+
+        if self._buffer:
+            self._upload_part()
+        try:
+            parts = [future.result() for future in self._parts]
+        finally:
+            self._pool.shutdown()  # type: ignore
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": parts},
+        )
+
+    def abort(self) -> None:
+        """Aborts the upload, discarding any parts already uploaded"""
+        if self._pool is not None:
+            for future in self._parts:
+                future.cancel()
+            self._pool.shutdown()
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+
+
+class _S3ObjectFile(io.RawIOBase):
+    """
+    A read-only, seekable file over an S3 object, which downloads the byte ranges that
+    are read from it as they're read.
+    """
+
+    def __init__(self, client: "boto3.client", bucket: str, key: str) -> None:
+        self._client = client
+        self._bucket = bucket
+        self._key = key
+        self._size = client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence == io.SEEK_END:
+            offset += self._size
+        if offset < 0:
+            raise ValueError("Negative seek position {}".format(offset))
+        self._position = offset
+        return offset
+
+    def readinto(self, buffer: Any) -> int:
+        end = min(self._position + len(buffer), self._size)
+        if end <= self._position:
+            return 0
+        response = self._client.get_object(
+            Bucket=self._bucket,
+            Key=self._key,
+            Range="bytes={}-{}".format(self._position, end - 1),
+        )
+        data = response["Body"].read()
+        buffer[: len(data)] = data
+        self._position += len(data)
+        return len(data)
+
 
 class S3Result(Result):
     """
@@ -25,14 +195,31 @@ class S3Result(Result):
         - boto3_kwargs (dict, optional): keyword arguments to pass on to boto3 when the [client
             session](https://boto3.amazonaws.com/v1/documentation/api/latest/reference/core/session.html#boto3.session.Session.client)
             is initialized.
+        - part_size (int, optional): the size, in bytes, of the parts that results are
+            uploaded and downloaded in. Results are serialized into parts as they're
+            uploaded, so that only about `max_concurrency` parts are held in memory at
+            once. Must be at least 5 MiB. Defaults to 8 MiB
+        - max_concurrency (int, optional): the maximum number of parts uploaded or
+            downloaded at once. Defaults to 8
         - **kwargs (Any, optional): any additional `Result` initialization options
     """
 
     def __init__(
-        self, bucket: str, boto3_kwargs: Dict[str, Any] = None, **kwargs: Any
+        self,
+        bucket: str,
+        boto3_kwargs: Dict[str, Any] = None,
+        part_size: int = 8 * 2**20,
+        max_concurrency: int = 8,
+        **kwargs: Any
     ) -> None:
+        if part_size < MIN_PART_SIZE:
+            raise ValueError("`part_size` must be at least 5 MiB")
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1")
         self.bucket = bucket
         self.boto3_kwargs = boto3_kwargs or {}
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
         super().__init__(**kwargs)
 
     @property
@@ -40,7 +227,12 @@ class S3Result(Result):
         if getattr(self, "_client", None) is None:
             from prefect.utilities.aws import get_boto_client
 
-            self._client = get_boto_client("s3", **self.boto3_kwargs)
+            credentials = prefect.context.get("secrets", {}).get("AWS_CREDENTIALS")
+            key = cloudpickle.dumps((credentials, self.boto3_kwargs))
+            with _CLIENT_POOL_LOCK:
+                if key not in _CLIENT_POOL:
+                    _CLIENT_POOL[key] = get_boto_client("s3", **self.boto3_kwargs)
+                self._client = _CLIENT_POOL[key]
         return self._client
 
     def __getstate__(self) -> dict:
@@ -68,18 +260,25 @@ class S3Result(Result):
         new = self.format(**kwargs)
         new.value = value_
         self.logger.debug("Starting to upload result to {}...".format(new.location))
-        binary_data = new.serializer.serialize(new.value)
 
-        stream = io.BytesIO(binary_data)
-
-        # upload
         from botocore.exceptions import ClientError
 
+        # the value is uploaded in parts as it's serialized
+        writer = _S3MultipartWriter(
+            self.client,
+            bucket=self.bucket,
+            key=new.location,  # type: ignore
+            part_size=self.part_size,
+            max_concurrency=self.max_concurrency,
+        )
         try:
-            self.client.upload_fileobj(stream, Bucket=self.bucket, Key=new.location)
-        except ClientError as err:
-            self.logger.error("Error uploading to S3: {}".format(err))
-            raise err
+            new.serializer.write_to(new.value, writer)
+            writer.complete()
+        except BaseException as err:
+            writer.abort()
+            if isinstance(err, ClientError):
+                self.logger.error("Error uploading to S3: {}".format(err))
+            raise
 
         self.logger.debug("Finished uploading result to {}.".format(new.location))
         return new
@@ -99,16 +298,23 @@ class S3Result(Result):
         new.location = location
 
         try:
+            if new.serializer.random_access:
+                # the serializer downloads only the byte ranges of the object it needs
+                self.logger.debug("Opening result at {}...".format(location))
+                new.value = new.serializer.deserialize_from(
+                    _S3ObjectFile(self.client, self.bucket, location)
+                )
+                return new
+
             self.logger.debug("Starting to download result from {}...".format(location))
-            stream = io.BytesIO()
 
             # download - uses `self` in case the client is already instantiated
-            self.client.download_fileobj(
-                Bucket=self.bucket, Key=location, Fileobj=stream
-            )
+            data = self._download(location)
+            if not new.serializer.zero_copy:
+                data = bytes(data)
 
             try:
-                new.value = new.serializer.deserialize(stream.getvalue())
+                new.value = new.serializer.deserialize(data)
             except EOFError:
                 new.value = None
             self.logger.debug("Finished downloading result from {}.".format(location))
@@ -123,6 +329,46 @@ class S3Result(Result):
 
         return new
 
+    def _download(self, location: str) -> bytearray:
+        """
+        Downloads an object into a buffer, in parts of `part_size` bytes which are
+        downloaded concurrently.
+        """
+        size = self.client.head_object(Bucket=self.bucket, Key=location)[
+            "ContentLength"
+        ]
+        data = bytearray(size)
+        view = memoryview(data)
+
+        def download(start: int) -> None:
+            end = min(start + self.part_size, size)
+            response = self.client.get_object(
+                Bucket=self.bucket,
+                Key=location,
+                Range="bytes={}-{}".format(start, end - 1),
+            )
+            chunk = response["Body"].read()
+            if len(chunk) != end - start:
+                raise ValueError(
+                    "Expected {} bytes of {} from byte {}, got {}".format(
+                        end - start, location, start, len(chunk)
+                    )
+                )
+            view[start:end] = chunk
+
+        starts = range(0, size, self.part_size)
+        if len(starts) <= 1:
+            for start in starts:
+                download(start)
+            return data
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="prefect-s3-download"
+        ) as pool:
+            for future in [pool.submit(download, start) for start in starts]:
+                future.result()
+        return data
+
     def exists(self, location: str, **kwargs: Any) -> bool:
         """
         Checks whether the target result exists in the S3 bucket.
@@ -2,22 +2,28 @@ import base64
 import io
 import json
 import importlib
+import pickle
+import struct
 
-from typing import TYPE_CHECKING, Any, Callable, Dict, Tuple
+from typing import IO, TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import cloudpickle
 import pendulum
 
 if TYPE_CHECKING:
     import pandas as pd
+    import pyarrow as pa
 
 __all__ = (
     "Serializer",
     "PickleSerializer",
+    "OutOfBandPickleSerializer",
     "JSONSerializer",
     "DateTimeSerializer",
     "PandasSerializer",
     "CompressedSerializer",
+    "ArrowSerializer",
+    "LazyArrowTable",
 )
 
 
@@ -29,6 +35,16 @@ class Serializer:
     Subclasses should implement `serialize` and `deserialize`.
     """
 
+    # whether `deserialize` accepts any bytes-like object, such as a memory-mapped
+    # file, and builds values which reference its memory rather than copies of it;
+    # results which support it hand such serializers a view of the stored data
+    zero_copy = False
+
+    # whether `deserialize_from` only reads the parts of a file it needs; results
+    # which support it hand such serializers a seekable file which reads the stored
+    # data on demand
+    random_access = False
+
     def __eq__(self, other: Any) -> bool:
         return type(self) == type(other)
 
@@ -56,6 +72,30 @@ class Serializer:
         """
         raise NotImplementedError
 
+    def deserialize_from(self, file: IO[bytes]) -> Any:
+        """
+        Deserialize an object from a binary file. The default implementation reads the
+        whole file and passes its contents to `deserialize`.
+
+        Args:
+            - file (IO[bytes]): a file opened for reading in binary mode
+
+        Returns:
+            - Any: the deserialized value
+        """
+        return self.deserialize(file.read())
+
+    def write_to(self, value: Any, file: IO[bytes]) -> None:
+        """
+        Serialize an object to a binary file. The default implementation writes the
+        bytes returned by `serialize`.
+
+        Args:
+            - value (Any): the value to serialize
+            - file (IO[bytes]): a file opened for writing in binary mode
+        """
+        file.write(self.serialize(value))
+
 
 class PickleSerializer(Serializer):
     """A `Serializer` that uses cloudpickle to serialize Python objects."""
@@ -94,6 +134,109 @@ class PickleSerializer(Serializer):
                 raise exc from e
 
 
+class OutOfBandPickleSerializer(Serializer):
+    """
+    A `Serializer` that uses cloudpickle with pickle protocol 5, which stores large
+    buffers (such as the data of NumPy arrays and Arrow-backed data frames) outside of
+    the pickle stream, so that they are neither copied into it nor out of it.
+
+    The pickle stream and each out-of-band buffer are written as separate segments,
+    aligned to 64 bytes, after a header locating them. Values are deserialized from
+    any bytes-like object, and their buffers are views of the corresponding segments:
+    results which read data through a memory map (such as `LocalResult`) load large
+    buffers without copying them.
+
+    Data serialized by `PickleSerializer` can also be deserialized. On Python versions
+    before 3.8, which don't support protocol 5, buffers are pickled in-band.
+    """
+
+    zero_copy = True
+
+    _MAGIC = b"PFPKL5\x00\x01"
+    _ALIGNMENT = 64
+
+    def _segments(self, value: Any) -> List[memoryview]:
+        buffers = []  # type: List[Any]
+        if hasattr(pickle, "PickleBuffer"):
+            data = cloudpickle.dumps(value, protocol=5, buffer_callback=buffers.append)
+        else:
+            data = cloudpickle.dumps(value)
+        return [memoryview(data)] + [buffer.raw() for buffer in buffers]
+
+    def _aligned(self, offset: int) -> int:
+        return -(-offset // self._ALIGNMENT) * self._ALIGNMENT
+
+    def write_to(self, value: Any, file: IO[bytes]) -> None:
+        """
+        Serialize an object to a binary file, writing its out-of-band buffers to the
+        file directly.
+
+        Args:
+            - value (Any): the value to serialize
+            - file (IO[bytes]): a file opened for writing in binary mode
+        """
+        segments = self._segments(value)
+
+        # header: magic, number of segments, then the offset and length of each
+        offset = len(self._MAGIC) + 8 + 16 * len(segments)
+        locations = []
+        for segment in segments:
+            offset = self._aligned(offset)
+            locations.append((offset, segment.nbytes))
+            offset += segment.nbytes
+        file.write(self._MAGIC)
+        file.write(struct.pack("<Q", len(segments)))
+        for location in locations:
+            file.write(struct.pack("<QQ", *location))
+
+        position = len(self._MAGIC) + 8 + 16 * len(segments)
+        for (offset, length), segment in zip(locations, segments):
+            file.write(b"\x00" * (offset - position))
+            file.write(segment)
+            position = offset + length
+
+    def serialize(self, value: Any) -> bytes:
+        """
+        Serialize an object to bytes using cloudpickle and pickle protocol 5.
+
+        Args:
+            - value (Any): the value to serialize
+
+        Returns:
+            - bytes: the serialized value
+        """
+        buffer = io.BytesIO()
+        self.write_to(value, buffer)
+        return buffer.getvalue()
+
+    def deserialize(self, value: bytes) -> Any:
+        """
+        Deserialize an object from bytes, or any bytes-like object. The out-of-band
+        buffers of the deserialized object are views of `value`.
+
+        Args:
+            - value (bytes): the value to deserialize
+
+        Returns:
+            - Any: the deserialized value
+        """
+        view = memoryview(value).cast("B")
+        header = len(self._MAGIC) + 8
+        if view[: len(self._MAGIC)] != self._MAGIC:
+            return PickleSerializer().deserialize(bytes(view))
+
+        (count,) = struct.unpack_from("<Q", view, len(self._MAGIC))
+        segments = [
+            view[offset : offset + length]
+            for offset, length in struct.iter_unpack(
+                "<QQ", view[header : header + 16 * count]
+            )
+        ]
+        if len(segments) == 1:
+            return cloudpickle.loads(segments[0])
+        return cloudpickle.loads(segments[0], buffers=segments[1:])
+
+
 class JSONSerializer(Serializer):
     """A Serializer that uses JSON to serialize objects"""
 
@@ -378,3 +521,239 @@ class CompressedSerializer(Serializer):
             ) from exc
 
         return funcs
+
+
+class LazyArrowTable:
+    """
+    A handle to a table serialized by an `ArrowSerializer`, which only reads the
+    columns and chunks of rows (the row groups of a Parquet file, or the record batches
+    of an Arrow IPC file) that are asked for.
+
+    Pickling a handle pickles the whole file it refers to.
+
+    Args:
+        - source (Any): a bytes-like object, or a seekable binary file, holding the
+            serialized table
+        - format (str): the format of the table, "parquet" or "ipc"
+    """
+
+    def __init__(self, source: Any, format: str):
+        import pyarrow as pa
+
+        if not hasattr(source, "read"):
+            source = pa.BufferReader(pa.py_buffer(memoryview(source).cast("B")))
+        self._source = source
+        self._num_rows = None
+        self.format = format
+        if format == "parquet":
+            import pyarrow.parquet as pq
+
+            self._reader = pq.ParquetFile(source)  # type: Any
+            self.schema = self._reader.schema_arrow  # type: pa.Schema
+            self._num_rows = self._reader.metadata.num_rows  # type: Optional[int]
+            self.num_row_groups = self._reader.num_row_groups  # type: int
+        else:
+            self._reader = pa.ipc.open_file(source)
+            self.schema = self._reader.schema
+            self.num_row_groups = self._reader.num_record_batches
+
+    def __repr__(self) -> str:
+        return "<LazyArrowTable: {} rows, {} columns, {} row groups>".format(
+            self.num_rows, len(self.column_names), self.num_row_groups
+        )
+
+    def __reduce__(self) -> tuple:
+        source = self._source
+        source.seek(0)
+        return (type(self), (bytes(source.read()), self.format))
+
+    @property
+    def num_rows(self) -> int:
+        """The number of rows in the table"""
+        if self._num_rows is None:
+            # the row counts of record batches are only stored with the batches
+            self._num_rows = sum(
+                self._reader.get_batch(i).num_rows for i in range(self.num_row_groups)
+            )
+        return self._num_rows
+
+    @property
+    def column_names(self) -> List[str]:
+        """The names of the table's columns"""
+        return list(self.schema.names)
+
+    def read(
+        self, columns: List[str] = None, row_groups: List[int] = None
+    ) -> "pa.Table":
+        """
+        Reads (some of) the table.
+
+        Args:
+            - columns (List[str], optional): the columns to read; defaults to all of them
+            - row_groups (List[int], optional): the indices of the row groups (or record
+                batches) to read; defaults to all of them
+
+        Returns:
+            - pyarrow.Table: the requested columns of the requested rows
+        """
+        import pyarrow as pa
+
+        if row_groups is None:
+            row_groups = list(range(self.num_row_groups))
+        if self.format == "parquet":
+            return self._reader.read_row_groups(
+                row_groups, columns=columns, use_pandas_metadata=True
+            )
+        table = pa.Table.from_batches(
+            [self._reader.get_batch(i) for i in row_groups], schema=self.schema
+        )
+        return table if columns is None else table.select(columns)
+
+    def to_pandas(
+        self, columns: List[str] = None, row_groups: List[int] = None
+    ) -> "pd.DataFrame":
+        """
+        Reads (some of) the table as a pandas DataFrame.
+
+        Args:
+            - columns (List[str], optional): the columns to read; defaults to all of them
+            - row_groups (List[int], optional): the indices of the row groups (or record
+                batches) to read; defaults to all of them
+
+        Returns:
+            - DataFrame: the requested columns of the requested rows
+        """
+        return self.read(columns=columns, row_groups=row_groups).to_pandas()
+
+
+class ArrowSerializer(Serializer):
+    """
+    A Serializer for tables (pandas DataFrames and `pyarrow.Table`s) which writes them
+    with Apache Arrow in chunks of rows: as the row groups of a Parquet file, or the
+    record batches of an Arrow IPC file.
+
+    Tables are deserialized as they were serialized: as a DataFrame if a DataFrame was
+    serialized, and as a `pyarrow.Table` otherwise. With `lazy=True`, they're
+    deserialized as a `LazyArrowTable` instead, a handle which only reads the columns
+    and row groups that are asked for. Results which hand this serializer a view of the
+    stored data never read the rest of it: `LocalResult` reads results through a memory
+    map, and `S3Result` reads the byte ranges of an object as they're needed (for
+    which Parquet, whose columns are stored separately within row groups, is better
+    suited).
+
+    Args:
+        - format (str, optional): the file format, either "parquet" or "ipc".
+            Defaults to "parquet".
+        - row_group_size (int, optional): the maximum number of rows in each row group
+            (or record batch). Defaults to 65536.
+        - lazy (bool, optional): whether tables are deserialized as `LazyArrowTable`
+            handles. Defaults to `False`.
+        - serialize_kwargs (dict, optional): keyword arguments to pass to
+            `pyarrow.parquet.write_table` or `pyarrow.ipc.new_file`
+    """
+
+    zero_copy = True
+    random_access = True
+
+    def __init__(
+        self,
+        format: str = "parquet",
+        row_group_size: int = 65536,
+        lazy: bool = False,
+        serialize_kwargs: dict = None,
+    ) -> None:
+        # Fails fast if pyarrow isn't installed
+        import pyarrow  # noqa: F401
+
+        if format not in ("parquet", "ipc"):
+            raise ValueError(
+                "`format` must be either 'parquet' or 'ipc', got {!r}".format(format)
+            )
+        self.format = format
+        self.row_group_size = row_group_size
+        self.lazy = lazy
+        self.serialize_kwargs = {} if serialize_kwargs is None else serialize_kwargs
+
+    def __eq__(self, other: Any) -> bool:
+        if type(self) == type(other):
+            return (
+                self.format == other.format
+                and self.row_group_size == other.row_group_size
+                and self.lazy == other.lazy
+                and self.serialize_kwargs == other.serialize_kwargs
+            )
+        return False
+
+    def write_to(self, value: Any, file: IO[bytes]) -> None:
+        """
+        Serialize a table to a binary file.
+
+        Args:
+            - value (Any): the DataFrame or `pyarrow.Table` to serialize
+            - file (IO[bytes]): a file opened for writing in binary mode
+        """
+        import pyarrow as pa
+
+        table = value if isinstance(value, pa.Table) else pa.Table.from_pandas(value)
+        # the sink is left open, as closing it would close `file`
+        sink = pa.PythonFile(file, mode="w")
+        if self.format == "parquet":
+            import pyarrow.parquet as pq
+
+            pq.write_table(
+                table, sink, row_group_size=self.row_group_size, **self.serialize_kwargs
+            )
+        else:
+            with pa.ipc.new_file(sink, table.schema, **self.serialize_kwargs) as writer:
+                writer.write_table(table, max_chunksize=self.row_group_size)
+
+    def serialize(self, value: Any) -> bytes:
+        """
+        Serialize a table to bytes.
+
+        Args:
+            - value (Any): the DataFrame or `pyarrow.Table` to serialize
+
+        Returns:
+            - bytes: the serialized value
+        """
+        buffer = io.BytesIO()
+        self.write_to(value, buffer)
+        return buffer.getvalue()
+
+    def _load(self, table: LazyArrowTable) -> Any:
+        if self.lazy:
+            return table
+        value = table.read()
+        # tables written from DataFrames carry pandas metadata
+        if value.schema.metadata and b"pandas" in value.schema.metadata:
+            return value.to_pandas()
+        return value
+
+    def deserialize(self, value: bytes) -> Any:
+        """
+        Deserialize a table from bytes, or any bytes-like object. Lazy handles (and
+        the tables read from them) reference the memory of `value` rather than copies
+        of it.
+
+        Args:
+            - value (bytes): the value to deserialize
+
+        Returns:
+            - Any: the deserialized DataFrame, `pyarrow.Table` or `LazyArrowTable`
+        """
+        return self._load(LazyArrowTable(value, self.format))
+
+    def deserialize_from(self, file: IO[bytes]) -> Any:
+        """
+        Deserialize a table from a seekable binary file, only reading the parts of
+        the file which are needed. Lazy handles keep a reference to `file`, and read
+        from it as they're used.
+
+        Args:
+            - file (IO[bytes]): a seekable file opened for reading in binary mode
+
+        Returns:
+            - Any: the deserialized DataFrame, `pyarrow.Table` or `LazyArrowTable`
+        """
+        return self._load(LazyArrowTable(file, self.format))
@@ -10,8 +10,10 @@ class as follows:
 Every run is initialized with the `Pending` state, meaning that it is waiting for
 execution. During execution a run will enter a `Running` state. Finally, runs become `Finished`.
 """
+import array
+import collections.abc
 import datetime
-from typing import Any, Dict, List, Optional, Type, Mapping
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Type, Mapping, Union
 
 import pendulum
 import cloudpickle
@@ -140,9 +142,7 @@ class State:
                 for s in self.map_states  # type: ignore
             ]
             if self.map_states:
-                self.result = [
-                    s.result if s is not None else None for s in self.map_states
-                ]
+                self.result = self.map_states.results  # type: ignore
             return self
 
         result_reader = result or self._result
@@ -899,9 +899,20 @@ class Mapped(Success):
         super().__init__(
             message=message, result=result, context=context, cached_inputs=cached_inputs
         )
-        self.map_states = map_states or []  # type: List[State]
+        self.map_states = map_states or []  # type: MappedStates
         self.n_map_states = n_map_states  # type: ignore
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # child states are always stored compactly
+        if name == "map_states" and not isinstance(value, MappedStates):
+            value = MappedStates(value)
+        super().__setattr__(name, value)
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if not isinstance(self.__dict__.get("map_states"), MappedStates):
+            self.map_states = self.__dict__.get("map_states") or []
+
     @property
     def n_map_states(self) -> int:
         return self._n_map_states or len(self.map_states)
@@ -911,6 +922,190 @@ class Mapped(Success):
         self._n_map_states = val
 
 
+class MappedStates(collections.abc.MutableSequence):
+    """
+    A list of the states of the children of a `Mapped` task, which is how
+    `Mapped.map_states` is stored.
+
+    Rather than keeping a full `State` object per child, the type of each child state is
+    stored as a code in an array, and its result, message and any other (non-empty)
+    attributes in side tables, so that a task with many children takes a fraction of the
+    memory. States are rebuilt whenever they are accessed, so changes to an accessed
+    state are not kept unless it is assigned back. Children without a state yet are
+    stored as `None`, and any other values are stored as they are.
+
+    The `n_finished`, `n_successful`, `n_failed` and `n_skipped` counts are computed from
+    the type codes alone, without rebuilding any state.
+
+    Args:
+        - states (Iterable[Optional[State]], optional): the initial child states
+    """
+
+    def __init__(self, states: Iterable[Optional[State]] = ()):
+        # code 0 is used for `None` and code 1 for values which aren't states
+        self._types = [None, None]  # type: List[Optional[Type[State]]]
+        self._type_codes = {type(None): 0}  # type: Dict[type, int]
+        self._codes = array.array("H")
+        self._results = []  # type: List[Any]
+        self._messages = []  # type: List[Any]
+        self._extras = []  # type: List[Optional[Dict[str, Any]]]
+        self.extend(states)
+
+    def _unpack(self, state: Optional[State]) -> tuple:
+        """
+        Splits a state into its type code, result, message and other attributes
+        """
+        if state is None:
+            return 0, None, None, None
+        if not isinstance(state, State):
+            return 1, state, None, None
+        cls = type(state)
+        code = self._type_codes.get(cls)
+        if code is None:
+            code = self._type_codes[cls] = len(self._types)
+            self._types.append(cls)
+
+        extras = {
+            key: value
+            for key, value in state.__dict__.items()
+            if key not in ("_result", "message")
+            and not (key in ("context", "cached_inputs") and not value)
+        }
+        # children usually share their context, so equal attributes are only kept once
+        if not extras:
+            extras = None
+        elif self._extras and extras == self._extras[-1]:
+            extras = self._extras[-1]
+        return code, state.__dict__.get("_result", NoResult), state.message, extras
+
+    def _pack(self, index: int) -> Optional[State]:
+        """
+        Rebuilds the state stored at a (non-negative) index
+        """
+        code = self._codes[index]
+        if code < 2:
+            return self._results[index]
+        cls = self._types[code]
+        state = cls.__new__(cls)  # type: ignore
+        state.__dict__.update(
+            message=self._messages[index],
+            _result=self._results[index],
+            context={},
+            cached_inputs={},
+        )
+        extras = self._extras[index]
+        if extras:
+            state.__dict__.update(
+                {
+                    key: dict(value) if key in ("context", "cached_inputs") else value
+                    for key, value in extras.items()
+                }
+            )
+        return state
+
+    def _count(self, check: str) -> int:
+        """
+        Counts the states for which the given `State.is_*` check is true
+        """
+        count = sum(
+            self._codes.count(code)
+            for code, cls in enumerate(self._types)
+            if cls is not None and getattr(cls.__new__(cls), check)()
+        )
+        if 1 in self._codes:
+            count += sum(
+                bool(getattr(value, check)())
+                for code, value in zip(self._codes, self._results)
+                if code == 1
+            )
+        return count
+
+    @property
+    def n_finished(self) -> int:
+        """The number of child states which are finished"""
+        return self._count("is_finished")
+
+    @property
+    def n_successful(self) -> int:
+        """The number of child states which are successful"""
+        return self._count("is_successful")
+
+    @property
+    def n_failed(self) -> int:
+        """The number of child states which are failed"""
+        return self._count("is_failed")
+
+    @property
+    def n_skipped(self) -> int:
+        """The number of child states which are skipped"""
+        return self._count("is_skipped")
+
+    @property
+    def results(self) -> List[Any]:
+        """The result of each child state (or `None` for children without a state)"""
+        return [
+            getattr(result, "value", result)
+            if code > 1
+            else getattr(result, "result", None)
+            for code, result in zip(self._codes, self._results)
+        ]
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._pack(i) for i in range(len(self))[index]]
+        return self._pack(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[Optional[State]]:
+        for i in range(len(self)):
+            yield self._pack(i)
+
+    def __setitem__(self, index: Union[int, slice], value: Any) -> None:
+        if isinstance(index, slice):
+            states = list(self)
+            states[index] = value
+            self.__init__(states)  # type: ignore
+            return
+        index = range(len(self))[index]
+        code, result, message, extras = self._unpack(value)
+        self._codes[index] = code
+        self._results[index] = result
+        self._messages[index] = message
+        self._extras[index] = extras
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        del self._codes[index]
+        del self._results[index]
+        del self._messages[index]
+        del self._extras[index]
+
+    def insert(self, index: int, value: Optional[State]) -> None:
+        code, result, message, extras = self._unpack(value)
+        self._codes.insert(index, code)
+        self._results.insert(index, result)
+        self._messages.insert(index, message)
+        self._extras.insert(index, extras)
+
+    def append(self, value: Optional[State]) -> None:
+        code, result, message, extras = self._unpack(value)
+        self._codes.append(code)
+        self._results.append(result)
+        self._messages.append(message)
+        self._extras.append(extras)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, collections.abc.Sequence) or isinstance(
+            other, (str, bytes)
+        ):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    def __repr__(self) -> str:
+        return "<MappedStates: {} children>".format(len(self))
+
+
 class Cancelled(Finished):
     """
     Finished state indicating that a user cancelled the flow run manually, mid-run.
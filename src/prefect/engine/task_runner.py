@@ -7,7 +7,6 @@ from typing import (
     Iterable,
     NamedTuple,
     Optional,
-    Set,
     Tuple,
 )
 
@@ -38,6 +37,7 @@ from prefect.engine.state import (
 )
 from prefect.utilities.executors import (
     RecursiveCall,
+    is_stream,
     tail_recursive,
 )
 from prefect.utilities.compatibility import nullcontext
@@ -49,6 +49,24 @@ TaskRunnerInitializeResult = NamedTuple(
 )
 
 
+# the steps of the full pipeline which `TaskRunner.run_plain_task` skips; runners which
+# override any of them (such as the `CloudTaskRunner`) always run the full pipeline
+PLAIN_TASK_SKIPPED_STEPS = (
+    "handle_state_change",
+    "call_runner_target_handlers",
+    "check_task_is_ready",
+    "check_task_reached_start_time",
+    "check_upstream_finished",
+    "check_upstream_skipped",
+    "check_target",
+    "check_task_is_cached",
+    "check_task_trigger",
+    "set_task_to_running",
+    "cache_result",
+    "check_for_retry",
+)
+
+
 class TaskRunner(Runner):
     """
     TaskRunners handle the execution of Tasks and determine the State of a Task
@@ -221,7 +239,7 @@ class TaskRunner(Runner):
             - `State` object representing the final post-run state of the Task
         """
         upstream_states = upstream_states or {}
-        context = context or prefect.context.to_dict()
+        context = context or dict(prefect.context)
         map_index = context.setdefault("map_index", None)
         context["task_full_name"] = "{name}{index}".format(
             name=self.task.name,
@@ -234,6 +252,9 @@ class TaskRunner(Runner):
             # initialize the run
             state, context = self.initialize_run(state, context)
 
+            # looped runs are nested within the run which logs when it's finished
+            log_finished = prefect.context.get("task_loop_count") is None
+
             # run state transformation pipeline
             with prefect.context(context):
 
@@ -244,6 +265,24 @@ class TaskRunner(Runner):
                         )
                     )
 
+                if not is_mapped_parent and self.is_plain_task_run(
+                    state, upstream_states=upstream_states
+                ):
+                    state = self.run_plain_task(
+                        state, upstream_states=upstream_states, context=context
+                    )
+                    # the run is logged as finished here, to avoid entering
+                    # the context a second time below
+                    if log_finished:
+                        self.logger.info(
+                            "Task '{name}': Finished task run for task with final "
+                            "state: '{state}'".format(
+                                name=context["task_full_name"],
+                                state=type(state).__name__,
+                            )
+                        )
+                    return state
+
                 # check to make sure the task is in a pending state
                 state = self.check_task_is_ready(state)
 
@@ -341,6 +380,81 @@ class TaskRunner(Runner):
 
         return state
 
+    def is_plain_task_run(
+        self, state: State, upstream_states: Dict[Edge, State]
+    ) -> bool:
+        """
+        Checks whether this run can take the short path of `run_plain_task`: the task
+        is Pending, every upstream task succeeded, and the task has no state handlers,
+        cache, target, retries or timeout and uses the default trigger, so that every
+        step of the full pipeline except running the task is known to be a no-op.
+
+        Args:
+            - state (State): the current state of this task
+            - upstream_states (Dict[Edge, State]): the upstream states
+
+        Returns:
+            - bool: whether the run can take the short path
+        """
+        task = self.task
+        if (
+            type(state) is not Pending
+            or self.state_handlers
+            or task.state_handlers
+            or task.trigger is not prefect.triggers.all_successful
+            or task.cache_for is not None
+            or task.target
+            or task.max_retries
+            or task.timeout
+        ):
+            return False
+
+        cls = type(self)
+        if cls is not TaskRunner and any(
+            getattr(cls, step) is not getattr(TaskRunner, step)
+            for step in PLAIN_TASK_SKIPPED_STEPS
+        ):
+            return False
+
+        return all(
+            s.is_successful() and not s.is_skipped() and not isinstance(s, Mapped)
+            for s in upstream_states.values()
+        )
+
+    def run_plain_task(
+        self,
+        state: State,
+        upstream_states: Dict[Edge, State],
+        context: Dict[str, Any],
+    ) -> State:
+        """
+        Runs a task which `is_plain_task_run` has accepted, skipping the pipeline steps
+        which can't change its state. Must be called within the run's context.
+
+        Args:
+            - state (State): the current (Pending) state of this task
+            - upstream_states (Dict[Edge, State]): the upstream states
+            - context (dict): the context of the run
+
+        Returns:
+            - State: the state of the task after running it
+        """
+        state, upstream_states = self.load_results(
+            state=state, upstream_states=upstream_states
+        )
+        task_inputs = self.get_task_inputs(state=state, upstream_states=upstream_states)
+        self.set_task_run_name(task_inputs=task_inputs)
+
+        state = self.get_task_run_state(
+            Running(message="Starting task run."), inputs=task_inputs
+        )
+        return self.check_task_is_looping(
+            state,
+            inputs=task_inputs,
+            upstream_states=upstream_states,
+            context=context,
+        )
+
     @call_state_handlers
     def check_upstream_finished(
         self, state: State, upstream_states: Dict[Edge, State]
@@ -358,17 +472,18 @@ class TaskRunner(Runner):
         Raises:
             - ENDRUN: if upstream tasks are not finished.
         """
-        all_states = set()  # type: Set[State]
+        finished = True
         for edge, upstream_state in upstream_states.items():
             # if the upstream state is Mapped, and this task is also mapped,
             # we want each individual child to determine if it should
             # proceed or not based on its upstream parent in the mapping
             if isinstance(upstream_state, Mapped) and not edge.mapped:
-                all_states.update(upstream_state.map_states)
+                map_states = upstream_state.map_states
+                finished &= map_states.n_finished == len(map_states)
             else:
-                all_states.add(upstream_state)
+                finished &= upstream_state.is_finished()
 
-        if not all(s.is_finished() for s in all_states):
+        if not finished:
             self.logger.debug(
                 "Task '{name}': Not all upstream states are finished; "
                 "ending run.".format(
@@ -393,18 +508,18 @@ class TaskRunner(Runner):
             - State: the state of the task after running the check
         """
 
-        all_states = set()  # type: Set[State]
+        skipped = False
         for edge, upstream_state in upstream_states.items():
 
             # if the upstream state is Mapped, and this task is also mapped,
             # we want each individual child to determine if it should
             # skip or not based on its upstream parent in the mapping
             if isinstance(upstream_state, Mapped) and not edge.mapped:
-                all_states.update(upstream_state.map_states)
+                skipped |= upstream_state.map_states.n_skipped > 0
             else:
-                all_states.add(upstream_state)
+                skipped |= upstream_state.is_skipped()
 
-        if self.task.skip_on_upstream_skip and any(s.is_skipped() for s in all_states):
+        if self.task.skip_on_upstream_skip and skipped:
             self.logger.debug(
                 "Task '{name}': Upstream states were skipped; ending run.".format(
                     name=prefect.context.get("task_full_name", self.task.name)
@@ -461,7 +576,7 @@ class TaskRunner(Runner):
             raise ENDRUN(new_state)
         elif not all(
             [
-                hasattr(state.result, "__getitem__")
+                hasattr(state.result, "__getitem__") or is_stream(state.result)
                 for edge, state in upstream_states.items()
                 if state.is_successful() and not state.is_mapped() and edge.mapped
             ]
@@ -469,7 +584,14 @@ class TaskRunner(Runner):
             new_state = Failed("At least one upstream state has an unmappable result.")
             raise ENDRUN(new_state)
         else:
-            # compute and set n_map_states
+            # compute and set n_map_states; the length of a stream is only known once
+            # it has been consumed, so it's left unset if any stream is mapped over
+            if any(
+                e.mapped and is_stream(s.result) for e, s in upstream_states.items()
+            ):
+                new_state = Mapped("Ready to proceed with mapping.")
+                raise ENDRUN(new_state)
+
             n_map_states = min(
                 [
                     len(s.result)
@@ -872,7 +994,15 @@ class TaskRunner(Runner):
                 else nullcontext()
             )  # type: AbstractContextManager
 
-            with log_context:
+            # runs of tasks with tags which have a concurrency limit (see
+            # `Executor.limit_task_tags`) wait for a free slot of each of those tags;
+            # the wait doesn't count towards the task's timeout
+            limiter = prefect.context.get("task_tag_limiter")
+            limit_context = (
+                limiter.limit(self.task.tags) if limiter is not None else nullcontext()
+            )  # type: AbstractContextManager
+
+            with limit_context, log_context:
                 value = prefect.utilities.executors.run_task_with_timeout(
                     task=self.task,
                     args=(),
@@ -923,7 +1053,22 @@ class TaskRunner(Runner):
                     **prefect.context,
                     **raw_inputs,
                 }
-                result = self.result.write(value, **formatting_kwargs)
+                # with write-behind checkpointing, the result is written in the
+                # background and downstream tasks are given its value from memory
+                writer = prefect.context.get("checkpoint_writer")
+                if writer is not None:
+                    result = writer.write(
+                        (
+                            prefect.context.get("task_slug"),
+                            prefect.context.get("map_index"),
+                        ),
+                        self.result,
+                        value,
+                        kwargs=formatting_kwargs,
+                        context=dict(prefect.context),
+                    )
+                else:
+                    result = self.result.write(value, **formatting_kwargs)
             except ResultNotImplementedError:
                 result = self.result.from_value(value=value)
         else:
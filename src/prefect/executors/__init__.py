@@ -11,11 +11,18 @@ Currently, the available executor options are:
     using either threads or processes.
 - `DaskExecutor`: the most feature-rich of the executors, this executor runs
     on `dask.distributed` and has support for distributed execution.
+- `PoolExecutor`: an executor that runs functions in a local pool of threads or
+    processes from `concurrent.futures`, with low overhead per function.
+- `AsyncExecutor`: an executor that runs coroutine tasks (defined with
+    `async def`) concurrently on a single `asyncio` event loop, for flows with
+    many I/O-bound tasks.
 
 Which executor you choose depends on the performance requirements and
 characteristics of your Flow.  See [the executors
 docs](/orchestration/flow_config/executors.md) for more information.
 """
+from .asyncio import AsyncExecutor
 from .base import Executor
 from .dask import DaskExecutor, LocalDaskExecutor
 from .local import LocalExecutor
+from .pool import PoolExecutor
@@ -0,0 +1,69 @@
+import asyncio
+import concurrent.futures
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from prefect.executors.pool import PoolExecutor
+from prefect.utilities.executors import set_thread_event_loop
+
+
+class AsyncExecutor(PoolExecutor):
+    """
+    An executor that runs coroutine tasks (tasks whose `run` method is defined with
+    `async def`) on a single `asyncio` event loop, so that many I/O-bound tasks can be
+    in flight at once in one process.
+
+    Each submitted function runs in a thread of a pool of `max_concurrency` threads
+    once the futures it takes as arguments are complete; task runs await their
+    coroutines on the shared event loop, and the runs of regular tasks run in the
+    threads themselves. Threads only wait on the event loop while their coroutine is in
+    flight, so the concurrency limit can be set in the thousands for tasks which mostly
+    wait on I/O.
+
+    Args:
+        - max_concurrency (int, optional): the maximum number of functions (and so
+            task runs) in flight at once. Defaults to 100.
+    """
+
+    def __init__(self, max_concurrency: int = 100):
+        if max_concurrency < 1:
+            raise ValueError("`max_concurrency` must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        super().__init__(kind="threads", max_workers=max_concurrency)
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        state["_loop"] = None
+        return state
+
+    def _create_pool(self) -> concurrent.futures.Executor:
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="prefect-async-executor",
+            initializer=set_thread_event_loop,
+            initargs=(self._loop,),
+        )
+
+    @contextmanager
+    def start(self) -> Iterator[None]:
+        """
+        Context manager for initializing execution: starts the event loop (in a
+        background thread) and the thread pool, and stops them once all submitted
+        functions have finished.
+        """
+        loop = asyncio.new_event_loop()
+        loop_thread = threading.Thread(
+            target=loop.run_forever, name="prefect-async-executor-loop", daemon=True
+        )
+        loop_thread.start()
+        self._loop = loop
+        try:
+            with super().start():
+                yield
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            loop_thread.join()
+            loop.close()
+            self._loop = None
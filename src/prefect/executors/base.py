@@ -1,16 +1,39 @@
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator
+from typing import Any, Callable, Dict, Hashable, Iterator, List, Mapping, Optional
 
+from prefect.executors.limits import TaskTagLimiter
 from prefect.utilities.logging import get_logger
 
 
 class Executor:
     """
     Base Executor class that all other executors inherit from.
+
+    While a flow runs, the number of children of each mapped task is tracked in the
+    `mapped_metrics` dictionary, keyed by task slug, as a dictionary with keys:
+
+    - `queued`: the number of children not yet submitted to the executor
+    - `running`: the number of children submitted but not yet known to be complete
+    - `completed`: the number of children known to be complete
+
+    If task tag concurrency limits are configured, a summary of the waits of the task
+    runs with each limited tag is stored in the `task_tag_metrics` dictionary, keyed by
+    tag, once the flow run finishes (see `TaskTagLimiter.metrics`).
     """
 
+    # the maximum number of children of each mapped task to leave in flight at once;
+    # executors which support it set this in `__init__`
+    max_mapped_in_flight = None  # type: Optional[int]
+
+    # whether task results stay where they were computed, rather than being gathered
+    # into the flow runner's process when it only needs task states (see
+    # `wait_for_states`); executors which support it set this in `__init__`
+    results_on_workers = False
+
     def __init__(self) -> None:
         self.logger = get_logger(type(self).__name__)
+        self.mapped_metrics = {}  # type: Dict[str, Dict[str, int]]
+        self.task_tag_metrics = {}  # type: Dict[str, Dict[str, Any]]
 
     def __repr__(self) -> str:
         return "<Executor: {}>".format(type(self).__name__)
@@ -25,6 +48,26 @@ class Executor:
         """
         yield
 
+    @contextmanager
+    def limit_task_tags(self, limits: Mapping[str, int]) -> Iterator[TaskTagLimiter]:
+        """
+        Context manager which yields a limiter enforcing task tag concurrency limits
+        for the functions submitted to this executor. Must be entered once the
+        executor has started.
+
+        The default implementation limits task runs in the threads of the current
+        process.
+
+        Args:
+            - limits (Mapping[str, int]): the maximum number of concurrent runs of
+                tasks with each tag
+
+        Returns:
+            - Iterator[TaskTagLimiter]: the limiter, which task runs take their slots
+                from
+        """
+        yield TaskTagLimiter(limits)
+
     def submit(
         self, fn: Callable, *args: Any, extra_context: dict = None, **kwargs: Any
     ) -> Any:
@@ -43,6 +86,55 @@ class Executor:
         """
         raise NotImplementedError()
 
+    def submit_many(
+        self,
+        fn: Callable,
+        kwargs_list: List[dict],
+        extra_contexts: List[dict] = None,
+        **kwargs: Any,
+    ) -> List[Any]:
+        """
+        Submit many calls of a function to the executor for execution, such as the
+        children of a mapped task. Returns a list of future-like objects, one per call.
+
+        The default implementation submits each call with `submit`; executors for which
+        each submission has a significant overhead submit the calls together instead.
+
+        Args:
+            - fn (Callable): function that is being submitted for execution
+            - kwargs_list (List[dict]): the keyword arguments of each call
+            - extra_contexts (List[dict], optional): an optional dictionary with extra
+                information about each call
+            - **kwargs (Any): keyword arguments to be passed to every call, which are
+                overridden by the keyword arguments of the call
+
+        Returns:
+            - List[Any]: a list of future-like objects, in the order of `kwargs_list`
+        """
+        if extra_contexts is None:
+            extra_contexts = [None] * len(kwargs_list)  # type: ignore
+        return [
+            self.submit(fn, extra_context=extra_context, **dict(kwargs, **call_kwargs))
+            for call_kwargs, extra_context in zip(kwargs_list, extra_contexts)
+        ]
+
+    def share(self, value: Any) -> Any:
+        """
+        Makes a value which many submitted functions take as an argument available to
+        the executor once, rather than with every submission. Returns a future-like
+        object which can be passed to `submit` in place of the value.
+
+        The default implementation returns the value itself, which is all executors
+        that run functions in the current process need.
+
+        Args:
+            - value (Any): the value to share
+
+        Returns:
+            - Any: a future-like object resolving to `value`
+        """
+        return value
+
     def wait(self, futures: Any) -> Any:
         """
         Resolves futures to their values. Blocks until the future is complete.
@@ -54,3 +146,37 @@ class Executor:
             - Any: an iterable of resolved futures
         """
         raise NotImplementedError()
+
+    def wait_for_states(self, futures: Any) -> Any:
+        """
+        Resolves futures of task states to the states, for when the states' results
+        aren't needed. Blocks until the futures are complete.
+
+        The default implementation is `wait`; executors with `results_on_workers` set
+        resolve the futures to copies of the states without their results instead.
+
+        Args:
+            - futures (Any): iterable of futures to compute
+
+        Returns:
+            - Any: an iterable of resolved states
+        """
+        return self.wait(futures)
+
+    def wait_any(self, futures: Dict[Hashable, Any]) -> Dict[Hashable, Any]:
+        """
+        Resolves the groups of futures that complete first. Blocks until at least one
+        group is complete.
+
+        The default implementation resolves every group at once, which is the best
+        executors that only compute futures when they are waited on can do.
+
+        Args:
+            - futures (Dict[Hashable, Any]): a dictionary of (potentially nested)
+                collections of futures to wait on
+
+        Returns:
+            - Dict[Hashable, Any]: the resolved values of at least one of the
+                groups in `futures`, keyed the same way
+        """
+        return self.wait(futures)
@@ -4,12 +4,30 @@ import uuid
 import sys
 import weakref
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, TYPE_CHECKING, Union, Optional, Dict
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    TYPE_CHECKING,
+    Union,
+    Optional,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+)
 
 from prefect.utilities.compatibility import nullcontext
 
 from prefect import context
 from prefect.executors.base import Executor
+from prefect.executors.limits import (
+    DaskTaskTagLimiter,
+    ManagedTaskTagLimiter,
+    TaskTagLimiter,
+)
+from prefect.executors.pool import _interrupt_threads
+from prefect.utilities.executors import release_results
 from prefect.utilities.importtools import import_object
 
 if TYPE_CHECKING:
@@ -23,17 +41,35 @@ __any__ = ("DaskExecutor", "LocalDaskExecutor")
 
 
 def _make_task_key(
-    task_name: str = "", task_index: int = None, **kwargs: Any
+    task_name: str = "", task_index: int = None, suffix: str = None, **kwargs: Any
 ) -> Optional[str]:
     """A helper for generating a dask task key from fields set in `extra_context`"""
     if task_name:
-        suffix = uuid.uuid4().hex
+        suffix = suffix or uuid.uuid4().hex
         if task_index is not None:
             return f"{task_name}-{task_index}-{suffix}"
         return f"{task_name}-{suffix}"
     return None
 
 
+def _check_max_mapped_in_flight(max_mapped_in_flight: Optional[int]) -> Optional[int]:
+    """A helper for validating the `max_mapped_in_flight` executor option"""
+    if max_mapped_in_flight is not None and (
+        not isinstance(max_mapped_in_flight, int) or max_mapped_in_flight < 1
+    ):
+        raise ValueError(
+            "`max_mapped_in_flight` must be a positive integer, got {!r}".format(
+                max_mapped_in_flight
+            )
+        )
+    return max_mapped_in_flight
+
+
+def _identity(value: Any) -> Any:
+    """A helper for sharing a value with the workers of a cluster"""
+    return value
+
+
 def _maybe_run(event_name: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
     """Check if the task should run against a `distributed.Event` before
     starting the task. This offers stronger guarantees than distributed's
@@ -62,6 +98,16 @@ def _maybe_run(event_name: str, fn: Callable, *args: Any, **kwargs: Any) -> Any:
         return fn(*args, **kwargs)
 
 
+def _run_call(
+    call_kwargs: dict, fn: Callable, shared_kwargs: dict, event_name: str = None
+) -> Any:
+    """A helper for running one of the calls submitted with `submit_many`"""
+    kwargs = dict(shared_kwargs, **call_kwargs)
+    if event_name is None:
+        return fn(**kwargs)
+    return _maybe_run(event_name, fn, **kwargs)
+
+
 class DaskExecutor(Executor):
     """
     An executor that runs all functions using the `dask.distributed` scheduler.
@@ -100,6 +146,20 @@ class DaskExecutor(Executor):
             your Prefect configuration.
         - performance_report_path (str, optional): An optional path for the [dask performance
             report](https://distributed.dask.org/en/latest/api.html#distributed.performance_report).
+        - max_mapped_in_flight (int, optional): the maximum number of children of each
+            mapped task to have submitted to the cluster at once. Once the limit is
+            reached, further children are only submitted as earlier ones complete,
+            which bounds the number of futures (and their inputs) held by the
+            scheduler for large maps. Tasks can override this with the
+            `max_mapped_in_flight` argument to `Task.map`. Defaults to no limit.
+        - results_on_workers (bool, optional): if `True`, task results stay on the
+            workers which computed them, and downstream tasks are given the futures
+            of their upstream states. Only the states of tasks which the flow runner
+            is asked to return are gathered with their results; the states of any other
+            tasks it waits on (such as terminal and reference tasks, and mapped
+            children) are gathered without their results (see `wait_for_states`),
+            which saves memory in the flow runner's process and network traffic for
+            flows with large results. Defaults to `False`.
 
     Examples:
 
@@ -139,6 +199,8 @@ class DaskExecutor(Executor):
         client_kwargs: dict = None,
         debug: bool = None,
         performance_report_path: str = None,
+        max_mapped_in_flight: int = None,
+        results_on_workers: bool = False,
     ):
         if address is None:
             address = context.config.engine.executor.dask.address or None
@@ -192,6 +254,8 @@ class DaskExecutor(Executor):
         self._watch_dask_events_task = None  # type: Optional[concurrent.futures.Future]
 
         self.performance_report_path = performance_report_path
+        self.max_mapped_in_flight = _check_max_mapped_in_flight(max_mapped_in_flight)
+        self.results_on_workers = results_on_workers
 
         super().__init__()
 
@@ -352,14 +416,14 @@ class DaskExecutor(Executor):
         self._should_run_event = None
         self._futures = None
 
-    def _prep_dask_kwargs(self, extra_context: dict = None) -> dict:
+    def _prep_dask_kwargs(self, extra_context: dict = None, suffix: str = None) -> dict:
         if extra_context is None:
             extra_context = {}
 
         dask_kwargs = {"pure": False}  # type: dict
 
         # set a key for the dask scheduler UI
-        key = _make_task_key(**extra_context)
+        key = _make_task_key(**dict(extra_context, suffix=suffix))
         if key is not None:
             dask_kwargs["key"] = key
 
@@ -424,6 +488,130 @@ class DaskExecutor(Executor):
             self._futures.add(fut)
         return fut
 
+    def submit_many(
+        self,
+        fn: Callable,
+        kwargs_list: List[dict],
+        extra_contexts: List[dict] = None,
+        **kwargs: Any,
+    ) -> List["Future"]:
+        """
+        Submit many calls of a function to the executor for execution, such as the
+        children of a mapped task. Returns a list of Future objects, one per call.
+
+        The calls are sent to the scheduler together with `Client.map`, rather than
+        in one message per call, and the keyword arguments shared by every call are
+        only sent once.
+
+        Args:
+            - fn (Callable): function that is being submitted for execution
+            - kwargs_list (List[dict]): the keyword arguments of each call
+            - extra_contexts (List[dict], optional): an optional dictionary with extra
+                information about each call
+            - **kwargs (Any): keyword arguments to be passed to every call, which are
+                overridden by the keyword arguments of the call
+
+        Returns:
+            - List[Future]: a list of Future-like objects, in the order of
+                `kwargs_list`
+        """
+        from dask.utils import funcname
+
+        if self.client is None:
+            raise ValueError("This executor has not been started.")
+
+        if extra_contexts is None:
+            extra_contexts = [{}] * len(kwargs_list)
+
+        # calls are sent together if they need the same resources (which is always
+        # the case for the children of a mapped task); their keys share a random
+        # suffix, made unique by the position of the call
+        suffix = uuid.uuid4().hex
+        groups = {}  # type: Dict[tuple, Dict[str, Any]]
+        for i, extra_context in enumerate(extra_contexts):
+            dask_kwargs = self._prep_dask_kwargs(extra_context, suffix=f"{suffix}-{i}")
+            resources = dask_kwargs.get("resources")
+            group = groups.setdefault(
+                tuple(sorted((resources or {}).items())),
+                dict(indices=[], keys=[], resources=resources),
+            )
+            group["indices"].append(i)
+            group["keys"].append(
+                dask_kwargs.get("key") or f"{funcname(fn)}-{suffix}-{i}"
+            )
+
+        event_name = (
+            None if self._should_run_event is None else self._should_run_event.name
+        )
+        # the keyword arguments shared by the calls are sent to the cluster once,
+        # rather than with every call
+        shared_kwargs = (
+            self.share(kwargs) if kwargs and len(kwargs_list) > 1 else kwargs
+        )
+        futures = [None] * len(kwargs_list)  # type: List[Any]
+        for group in groups.values():
+            # calls are sent in batches, which bounds the size of each message
+            group_futures = self.client.map(
+                _run_call,
+                [kwargs_list[i] for i in group["indices"]],
+                key=group["keys"],
+                resources=group["resources"],
+                pure=False,
+                batch_size=1000,
+                fn=fn,
+                shared_kwargs=shared_kwargs,
+                event_name=event_name,
+            )
+            for i, future in zip(group["indices"], group_futures):
+                futures[i] = future
+        if self._futures is not None:
+            self._futures.update(futures)
+        return futures
+
+    @contextmanager
+    def limit_task_tags(self, limits: Mapping[str, int]) -> Iterator[TaskTagLimiter]:
+        """
+        Context manager which yields a limiter enforcing task tag concurrency limits
+        for the functions submitted to this executor, using `distributed.Semaphore`s
+        shared by all workers of the cluster.
+
+        Args:
+            - limits (Mapping[str, int]): the maximum number of concurrent runs of
+                tasks with each tag
+
+        Returns:
+            - Iterator[TaskTagLimiter]: the limiter, which task runs take their slots
+                from
+        """
+        if self.client is None:
+            raise ValueError("This executor has not been started.")
+
+        limiter = DaskTaskTagLimiter(limits, self.client)
+        try:
+            yield limiter
+        finally:
+            limiter.close()
+
+    def share(self, value: Any) -> "Future":
+        """
+        Sends a value which many submitted functions take as an argument to the
+        cluster once. Returns a Future which can be passed to `submit` in place of the
+        value, so that workers fetch it (at most once each) instead of it being
+        serialized with every submission.
+
+        Args:
+            - value (Any): the value to share
+
+        Returns:
+            - Future: a Future resolving to `value`
+        """
+        if self.client is None:
+            raise ValueError("This executor has not been started.")
+
+        # unlike `client.scatter`, submitting the value doesn't wait for a worker to
+        # be available, which adaptive clusters may only start once work is submitted
+        return self.client.submit(_identity, value, pure=False)
+
     def wait(self, futures: Any) -> Any:
         """
         Resolves the Future objects to their values. Blocks until the computation is complete.
@@ -439,6 +627,74 @@ class DaskExecutor(Executor):
 
         return self.client.gather(futures)
 
+    def _release_results(self, futures: Any) -> Any:
+        """
+        Replaces each Future in a (potentially nested) collection with the Future of a
+        copy of its state(s) without results, computed where the state is.
+        """
+        from distributed import Future
+
+        if isinstance(futures, Future):
+            return self.client.submit(release_results, futures)
+        elif isinstance(futures, (list, tuple, set)):
+            return type(futures)(self._release_results(f) for f in futures)
+        elif isinstance(futures, dict):
+            return {key: self._release_results(f) for key, f in futures.items()}
+        return futures
+
+    def wait_for_states(self, futures: Any) -> Any:
+        """
+        Resolves Future objects of task states to the states. Blocks until the
+        computation is complete.
+
+        With `results_on_workers`, the states are copied without their results on the
+        workers, and only the copies are gathered.
+
+        Args:
+            - futures (Any): single or iterable of future-like objects to compute
+
+        Returns:
+            - Any: an iterable of resolved states with similar shape to the input
+        """
+        if self.client is None:
+            raise ValueError("This executor has not been started.")
+
+        if self.results_on_workers:
+            futures = self._release_results(futures)
+        return self.client.gather(futures)
+
+    def wait_any(self, futures: Dict[Hashable, Any]) -> Dict[Hashable, Any]:
+        """
+        Resolves the groups of Future objects that complete first. Blocks until at
+        least one group is complete.
+
+        With `results_on_workers`, the groups are resolved without results, as with
+        `wait_for_states`.
+
+        Args:
+            - futures (Dict[Hashable, Any]): a dictionary of (potentially nested)
+                collections of future-like objects to wait on
+
+        Returns:
+            - Dict[Hashable, Any]: the resolved values of every group in `futures`
+                which has completed, keyed the same way
+        """
+        if self.client is None:
+            raise ValueError("This executor has not been started.")
+
+        from distributed import as_completed, futures_of
+
+        groups = {key: futures_of(group) for key, group in futures.items()}
+        while True:
+            done = [k for k, group in groups.items() if all(f.done() for f in group)]
+            if done:
+                done_futures = {k: futures[k] for k in done}
+                if self.results_on_workers:
+                    done_futures = self._release_results(done_futures)
+                return self.client.gather(done_futures)
+            pending = [f for group in groups.values() for f in group if not f.done()]
+            next(as_completed(pending, loop=self.client.loop))
+
     @property
     def performance_report(self) -> str:
         """The performance report html string."""
@@ -478,11 +734,23 @@ class LocalDaskExecutor(Executor):
     Args:
         - scheduler (str): The local dask scheduler to use; common options are
             "threads", "processes", and "synchronous".  Defaults to "threads".
+        - max_mapped_in_flight (int, optional): the maximum number of children of each
+            mapped task to leave uncomputed at once. Once the limit is reached, the
+            children in flight are computed before further children are submitted,
+            which bounds the size of the task graphs built for large maps. Tasks can
+            override this with the `max_mapped_in_flight` argument to `Task.map`.
+            Defaults to no limit.
         - **kwargs (Any): Additional keyword arguments to pass to dask config
     """
 
-    def __init__(self, scheduler: str = "threads", **kwargs: Any):
+    def __init__(
+        self,
+        scheduler: str = "threads",
+        max_mapped_in_flight: int = None,
+        **kwargs: Any,
+    ):
         self.scheduler = self._normalize_scheduler(scheduler)
+        self.max_mapped_in_flight = _check_max_mapped_in_flight(max_mapped_in_flight)
         self.dask_config = kwargs
         self._pool = None  # type: Optional[multiprocessing.pool.Pool]
         super().__init__()
@@ -517,36 +785,8 @@ class LocalDaskExecutor(Executor):
 
         if self.scheduler == "threads":
             # `ThreadPool.terminate()` doesn't stop running tasks, only
-            # prevents new tasks from running. In CPython we can attempt to
-            # raise an exception in all threads. This exception will be raised
-            # the next time the task does something with the Python api.
-            # However, if the task is currently blocked in a c extension, it
-            # will not immediately be interrupted. There isn't a good way
-            # around this unfortunately.
-            import platform
-
-            if platform.python_implementation() != "CPython":
-                self.logger.warning(
-                    "Interrupting a running threadpool is only supported in CPython, "
-                    "all currently running tasks will continue to completion"
-                )
-                return
-
-            self.logger.info("Attempting to interrupt and cancel all running tasks...")
-
-            import sys
-            import ctypes
-
-            # signature of this method changed in python 3.7
-            if sys.version_info >= (3, 7):
-                id_type = ctypes.c_ulong
-            else:
-                id_type = ctypes.c_long
-
-            for t in self._pool._pool:  # type: ignore
-                ctypes.pythonapi.PyThreadState_SetAsyncExc(
-                    id_type(t.ident), ctypes.py_object(KeyboardInterrupt)
-                )
+            # prevents new tasks from running
+            _interrupt_threads(self._pool._pool, self.logger)  # type: ignore
 
     @contextmanager
     def start(self) -> Iterator:
@@ -625,6 +865,46 @@ class LocalDaskExecutor(Executor):
             extra_kwargs["dask_key_name"] = key
         return dask.delayed(fn, pure=False)(*args, **kwargs, **extra_kwargs)
 
+    @contextmanager
+    def limit_task_tags(self, limits: Mapping[str, int]) -> Iterator[TaskTagLimiter]:
+        """
+        Context manager which yields a limiter enforcing task tag concurrency limits
+        for the functions submitted to this executor. With the "processes" scheduler,
+        the limiter's slots are held by a `multiprocessing` manager.
+
+        Args:
+            - limits (Mapping[str, int]): the maximum number of concurrent runs of
+                tasks with each tag
+
+        Returns:
+            - Iterator[TaskTagLimiter]: the limiter, which task runs take their slots
+                from
+        """
+        if self.scheduler != "processes":
+            yield TaskTagLimiter(limits)
+        else:
+            from dask.multiprocessing import get_context
+
+            with get_context().Manager() as manager:
+                yield ManagedTaskTagLimiter(limits, manager)
+
+    def share(self, value: Any) -> "dask.delayed":
+        """
+        Wraps a value which many submitted functions take as an argument in a single
+        `dask.delayed` object, which can be passed to `submit` in place of the value
+        without it being traversed on every submission.
+
+        Args:
+            - value (Any): the value to share
+
+        Returns:
+            - dask.delayed: a `dask.delayed` object resolving to `value`
+        """
+        # import dask here to reduce prefect import times
+        import dask
+
+        return dask.delayed(value, pure=False, traverse=False)
+
     def wait(self, futures: Any) -> Any:
         """
         Resolves a (potentially nested) collection of `dask.delayed` object to
@@ -0,0 +1,221 @@
+"""
+Local enforcement of task tag concurrency limits: while a flow runs, task runs with a
+tag which has a limit wait for one of the tag's slots before running, so that no more
+than the limit of runs with the tag are in progress at once. Limits are configured
+with the `flows.task_tag_limits` setting, or the `task_tag_limits` key of a flow run's
+context, and enforced by the limiter of the flow run's executor (see
+`Executor.limit_task_tags`).
+"""
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Tuple
+
+# a task run's wait for a slot of a tag: (tag, start of the wait, end of the wait)
+WaitRecord = Tuple[str, float, float]
+
+
+def _check_task_tag_limits(limits: Mapping[str, int]) -> Dict[str, int]:
+    """A helper for validating task tag limits"""
+    for tag, limit in limits.items():
+        if not isinstance(limit, int) or limit < 1:
+            raise ValueError(
+                f"The limit of task tag {tag!r} must be a positive integer, "
+                f"got {limit!r}"
+            )
+    return dict(limits)
+
+
+class TaskTagLimiter:
+    """
+    Limits the number of concurrent runs of tasks with each tag, for task runs in the
+    threads of a single process, and records how long runs wait for their tags.
+
+    Args:
+        - limits (Mapping[str, int]): the maximum number of concurrent runs of tasks
+            with each tag
+    """
+
+    def __init__(self, limits: Mapping[str, int]):
+        self.limits = _check_task_tag_limits(limits)
+        self._semaphores = {
+            tag: self._create_semaphore(tag, limit)
+            for tag, limit in self.limits.items()
+        }
+        self._records = self._create_records()
+
+    def _create_semaphore(self, tag: str, limit: int) -> Any:
+        return threading.BoundedSemaphore(limit)
+
+    def _create_records(self) -> Any:
+        return []
+
+    def _add_records(self, records: List[WaitRecord]) -> None:
+        self._records.extend(records)
+
+    def _get_records(self) -> List[WaitRecord]:
+        return list(self._records)
+
+    @contextmanager
+    def limit(self, tags: Iterable[str]) -> Iterator[None]:
+        """
+        Context manager which holds a slot of each of `tags` which has a limit,
+        waiting for slots to free up if needed.
+
+        Args:
+            - tags (Iterable[str]): the tags of the task run
+        """
+        # slots are taken in a consistent order, so that runs waiting on several of
+        # the same tags can't each hold a slot the other needs
+        limited = sorted(tag for tag in set(tags) if tag in self.limits)
+        if not limited:
+            yield
+            return
+
+        acquired = []  # type: List[str]
+        start = time.time()
+        try:
+            for tag in limited:
+                self._semaphores[tag].acquire()
+                acquired.append(tag)
+            end = time.time()
+            self._add_records([(tag, start, end) for tag in limited])
+            yield
+        finally:
+            for tag in reversed(acquired):
+                self._semaphores[tag].release()
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarizes the waits of the task runs with each limited tag so far.
+
+        Returns:
+            - Dict[str, Dict[str, Any]]: for each tag with a limit, a dictionary with
+                keys:
+                - `limit`: the tag's limit
+                - `runs`: the number of task runs with the tag
+                - `max_waiting`: the most runs with the tag waiting for a slot at once
+                - `total_wait`: the number of seconds the runs waited for a slot
+                - `max_wait`: the longest a run waited for a slot, in seconds
+        """
+        records = {tag: [] for tag in self.limits}  # type: Dict[str, List[Any]]
+        for tag, start, end in self._get_records():
+            records[tag].append((start, end))
+
+        metrics = {}
+        for tag, waits in records.items():
+            # the number of runs waiting changes at the start and end of each wait;
+            # ends come first where they tie, so that waits that don't overlap are not
+            # counted together
+            events = sorted(
+                [(end, -1) for _, end in waits] + [(s, 1) for s, _ in waits]
+            )
+            waiting = max_waiting = 0
+            for _, change in events:
+                waiting += change
+                max_waiting = max(max_waiting, waiting)
+            metrics[tag] = dict(
+                limit=self.limits[tag],
+                runs=len(waits),
+                max_waiting=max_waiting,
+                total_wait=sum(end - start for start, end in waits),
+                max_wait=max((end - start for start, end in waits), default=0.0),
+            )
+        return metrics
+
+    def close(self) -> None:
+        """
+        Releases any resources held by the limiter once the flow run is done.
+        """
+
+
+class ManagedTaskTagLimiter(TaskTagLimiter):
+    """
+    A `TaskTagLimiter` for task runs in the processes of a local process pool, whose
+    slots and records are held by a `multiprocessing` manager.
+
+    Args:
+        - limits (Mapping[str, int]): the maximum number of concurrent runs of tasks
+            with each tag
+        - manager (multiprocessing.managers.SyncManager): a started manager
+    """
+
+    def __init__(self, limits: Mapping[str, int], manager: Any):
+        self._manager = manager
+        super().__init__(limits)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_manager"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+
+    def _create_semaphore(self, tag: str, limit: int) -> Any:
+        return self._manager.BoundedSemaphore(limit)
+
+    def _create_records(self) -> Any:
+        return self._manager.list()
+
+    def _get_records(self) -> List[WaitRecord]:
+        return list(self._records[:])
+
+
+class DaskTaskTagLimiter(TaskTagLimiter):
+    """
+    A `TaskTagLimiter` for task runs on the workers of a Dask cluster, whose slots
+    are `distributed.Semaphore`s and whose records are sent back through a
+    `distributed.Queue`.
+
+    Args:
+        - limits (Mapping[str, int]): the maximum number of concurrent runs of tasks
+            with each tag
+        - client (distributed.Client): the client of the cluster
+    """
+
+    def __init__(self, limits: Mapping[str, int], client: Any):
+        self._client = client
+        self._name = f"prefect-task-tag-limits-{uuid.uuid4()}"
+        self._collected = []  # type: List[WaitRecord]
+        super().__init__(limits)
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.update(_client=None, _collected=[])
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+
+    def _create_semaphore(self, tag: str, limit: int) -> Any:
+        from distributed import Semaphore
+
+        return Semaphore(
+            max_leases=limit,
+            name=f"{self._name}-{tag}",
+            scheduler_rpc=self._client.scheduler,
+            loop=self._client.loop,
+        )
+
+    def _create_records(self) -> Any:
+        from distributed import Queue
+
+        return Queue(self._name, client=self._client)
+
+    def _add_records(self, records: List[WaitRecord]) -> None:
+        self._records.put(records)
+
+    def _get_records(self) -> List[WaitRecord]:
+        if self._records.qsize():
+            for records in self._records.get(batch=True):
+                self._collected.extend(tuple(record) for record in records)
+        return list(self._collected)
+
+    def close(self) -> None:
+        """
+        Releases the limiter's semaphores on the cluster's scheduler.
+        """
+        for semaphore in self._semaphores.values():
+            semaphore.close()
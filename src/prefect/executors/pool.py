@@ -0,0 +1,356 @@
+import concurrent.futures
+import multiprocessing
+import sys
+import threading
+from contextlib import contextmanager
+from logging import Logger
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+)
+
+import cloudpickle
+
+from prefect.executors.base import Executor
+from prefect.executors.limits import ManagedTaskTagLimiter, TaskTagLimiter
+
+
+def _find_futures(obj: Any, futures: List[concurrent.futures.Future]) -> None:
+    """Collects the futures in a (potentially nested) collection"""
+    if isinstance(obj, concurrent.futures.Future):
+        futures.append(obj)
+    elif type(obj) in (list, tuple, set):
+        for item in obj:
+            _find_futures(item, futures)
+    elif type(obj) is dict:
+        for item in obj.values():
+            _find_futures(item, futures)
+
+
+def _resolve(obj: Any) -> Any:
+    """Replaces the futures in a (potentially nested) collection with their results"""
+    if isinstance(obj, concurrent.futures.Future):
+        return obj.result()
+    elif type(obj) in (list, tuple, set):
+        return type(obj)(_resolve(item) for item in obj)
+    elif type(obj) is dict:
+        return {key: _resolve(value) for key, value in obj.items()}
+    return obj
+
+
+def _run(fn: Callable, args: tuple, kwargs: dict) -> Any:
+    return fn(*_resolve(args), **_resolve(kwargs))
+
+
+def _run_pickled(payload: bytes) -> bytes:
+    fn, args, kwargs = cloudpickle.loads(payload)
+    return cloudpickle.dumps(fn(*args, **kwargs))
+
+
+def _copy_future_state(
+    source: concurrent.futures.Future,
+    target: concurrent.futures.Future,
+    pickled: bool = False,
+) -> None:
+    if source.cancelled():
+        target.cancel()
+        return
+    exc = source.exception()
+    if exc is not None:
+        target.set_exception(exc)
+    elif pickled:
+        try:
+            target.set_result(cloudpickle.loads(source.result()))
+        except Exception as exc:
+            target.set_exception(exc)
+    else:
+        target.set_result(source.result())
+
+
+def _process_pool_initializer() -> None:
+    """Initialize a process used in a `PoolExecutor`.
+
+    Ensures the standard atexit handlers are run."""
+    import signal
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit())
+
+
+def _interrupt_threads(threads: Iterable[threading.Thread], logger: Logger) -> None:
+    """
+    Attempts to interrupt the functions running in `threads` by raising a
+    `KeyboardInterrupt` in each thread.
+    """
+    # Threads can't be stopped, but in CPython we can attempt to raise an exception
+    # in them. This exception will be raised the next time the running function
+    # does something with the Python api. However, if the function is currently
+    # blocked in a c extension, it will not immediately be interrupted. There isn't a
+    # good way around this unfortunately.
+    import platform
+
+    if platform.python_implementation() != "CPython":
+        logger.warning(
+            "Interrupting a running threadpool is only supported in CPython, "
+            "all currently running tasks will continue to completion"
+        )
+        return
+
+    logger.info("Attempting to interrupt and cancel all running tasks...")
+
+    import ctypes
+
+    # signature of this method changed in python 3.7
+    if sys.version_info >= (3, 7):
+        id_type = ctypes.c_ulong
+    else:
+        id_type = ctypes.c_long
+
+    for t in threads:
+        if t.ident is not None:
+            ctypes.pythonapi.PyThreadState_SetAsyncExc(
+                id_type(t.ident), ctypes.py_object(KeyboardInterrupt)
+            )
+
+
+class PoolExecutor(Executor):
+    """
+    An executor that runs functions in a local pool of threads or processes from
+    `concurrent.futures`, without building a task graph.
+
+    Each submitted function is handed to the pool once the futures it takes as
+    arguments are complete, with their results in their place, so that functions
+    waiting on others don't occupy a worker.
+
+    With processes, functions and their arguments are serialized with `cloudpickle`.
+    Worker processes are started with the "forkserver" method where available (and
+    "spawn" otherwise), and are reused across functions.
+
+    Args:
+        - kind (str, optional): the kind of pool, either "threads" or "processes".
+            Defaults to "threads".
+        - max_workers (int, optional): the maximum number of functions running at
+            once. Defaults to the `concurrent.futures` default for the kind of pool.
+    """
+
+    def __init__(self, kind: str = "threads", max_workers: int = None):
+        self.kind = self._normalize_kind(kind)
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("`max_workers` must be at least 1")
+        self.max_workers = max_workers
+        self._pool = None  # type: Optional[concurrent.futures.Executor]
+        self._in_flight = set()  # type: set
+        super().__init__()
+
+    @staticmethod
+    def _normalize_kind(kind: str) -> str:
+        kind = kind.lower()
+        if kind in ("threads", "threading"):
+            return "threads"
+        elif kind in ("processes", "multiprocessing"):
+            return "processes"
+        else:
+            raise ValueError(f"Unknown pool kind {kind!r}")
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state.update(_pool=None, _in_flight=set())
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+
+    @staticmethod
+    def _mp_context() -> Any:
+        method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        return multiprocessing.get_context(method)
+
+    def _create_pool(self) -> concurrent.futures.Executor:
+        if self.kind == "threads":
+            return concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="prefect-pool-executor"
+            )
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=self._mp_context(),
+            initializer=_process_pool_initializer,
+        )
+
+    def _interrupt_pool(self, pool: concurrent.futures.Executor) -> None:
+        """Cancel all queued functions and interrupt the running ones."""
+        for future in list(self._in_flight):
+            future.cancel()
+
+        if self.kind == "threads":
+            _interrupt_threads(list(pool._threads), self.logger)  # type: ignore
+        else:
+            for process in list(pool._processes.values()):  # type: ignore
+                process.terminate()
+
+    @contextmanager
+    def start(self) -> Iterator[None]:
+        """
+        Context manager for initializing execution: creates the pool, and shuts it
+        down once all submitted functions have finished. If execution is interrupted,
+        queued functions are cancelled and running ones interrupted instead.
+        """
+        self._pool = self._create_pool()
+        try:
+            exiting_early = False
+            yield
+        except BaseException:
+            exiting_early = True
+            raise
+        finally:
+            # functions whose arguments complete from now on are cancelled
+            pool, self._pool = self._pool, None
+            if exiting_early:
+                self._interrupt_pool(pool)
+            pool.shutdown(wait=True)
+            self._in_flight.clear()
+
+    @contextmanager
+    def limit_task_tags(self, limits: Mapping[str, int]) -> Iterator[TaskTagLimiter]:
+        """
+        Context manager which yields a limiter enforcing task tag concurrency limits
+        for the functions submitted to this executor. With processes, the limiter's
+        slots are held by a `multiprocessing` manager.
+
+        Args:
+            - limits (Mapping[str, int]): the maximum number of concurrent runs of
+                tasks with each tag
+
+        Returns:
+            - Iterator[TaskTagLimiter]: the limiter, which task runs take their slots
+                from
+        """
+        if self.kind == "threads":
+            yield TaskTagLimiter(limits)
+        else:
+            with self._mp_context().Manager() as manager:
+                yield ManagedTaskTagLimiter(limits, manager)
+
+    def _submit_ready(
+        self, fn: Callable, args: tuple, kwargs: dict
+    ) -> concurrent.futures.Future:
+        """Hands a function whose arguments are complete to the pool"""
+        pool = self._pool
+        if pool is None:
+            raise RuntimeError("This executor has been shut down")
+
+        if self.kind == "threads":
+            future = pool.submit(_run, fn, args, kwargs)
+        else:
+            result = concurrent.futures.Future()  # type: concurrent.futures.Future
+            try:
+                payload = cloudpickle.dumps((fn, _resolve(args), _resolve(kwargs)))
+            except Exception as exc:
+                result.set_exception(exc)
+                return result
+            future = pool.submit(_run_pickled, payload)
+            future.add_done_callback(
+                lambda f: _copy_future_state(f, result, pickled=True)
+            )
+
+        self._in_flight.add(future)
+        future.add_done_callback(self._in_flight.discard)
+        return future if self.kind == "threads" else result
+
+    def submit(
+        self, fn: Callable, *args: Any, extra_context: dict = None, **kwargs: Any
+    ) -> concurrent.futures.Future:
+        """
+        Submit a function to the executor for execution. Returns a Future. The
+        function is run once all futures in its arguments are complete, with their
+        results in their place.
+
+        Args:
+            - fn (Callable): function that is being submitted for execution
+            - *args (Any): arguments to be passed to `fn`
+            - extra_context (dict, optional): an optional dictionary with extra information
+                about the submitted task
+            - **kwargs (Any): keyword arguments to be passed to `fn`
+
+        Returns:
+            - Future: a Future-like object that represents the computation of `fn(*args, **kwargs)`
+        """
+        if self._pool is None:
+            raise ValueError("This executor must be started before submitting work")
+
+        dependencies = []  # type: List[concurrent.futures.Future]
+        _find_futures((args, kwargs), dependencies)
+        dependencies = [f for f in dependencies if not f.done()]
+        if not dependencies:
+            return self._submit_ready(fn, args, kwargs)
+
+        # the function is only handed to the pool once its arguments are complete,
+        # so that it doesn't occupy a worker while it waits
+        future = concurrent.futures.Future()  # type: concurrent.futures.Future
+        remaining = [len(dependencies)]
+        lock = threading.Lock()
+
+        def on_done(_: concurrent.futures.Future) -> None:
+            with lock:
+                remaining[0] -= 1
+                if remaining[0]:
+                    return
+            try:
+                inner = self._submit_ready(fn, args, kwargs)
+            except RuntimeError:
+                # the executor was shut down while the function was waiting
+                future.cancel()
+                return
+            inner.add_done_callback(lambda f: _copy_future_state(f, future))
+
+        for dependency in dependencies:
+            dependency.add_done_callback(on_done)
+        return future
+
+    def wait(self, futures: Any) -> Any:
+        """
+        Resolves the Future objects to their values. Blocks until the computation is complete.
+
+        Args:
+            - futures (Any): single or iterable of future-like objects to compute
+
+        Returns:
+            - Any: an iterable of resolved futures with similar shape to the input
+        """
+        return _resolve(futures)
+
+    def wait_any(self, futures: Dict[Hashable, Any]) -> Dict[Hashable, Any]:
+        """
+        Resolves the groups of futures that complete first. Blocks until at least one
+        group is complete.
+
+        Args:
+            - futures (Dict[Hashable, Any]): a dictionary of (potentially nested)
+                collections of futures to wait on
+
+        Returns:
+            - Dict[Hashable, Any]: the resolved values of the complete groups in
+                `futures`, keyed the same way
+        """
+        groups = {}  # type: Dict[Hashable, List[concurrent.futures.Future]]
+        for key, group in futures.items():
+            groups[key] = []
+            _find_futures(group, groups[key])
+
+        while True:
+            done = [k for k, group in groups.items() if all(f.done() for f in group)]
+            if done or not groups:
+                return {key: _resolve(futures[key]) for key in done}
+            concurrent.futures.wait(
+                [f for group in groups.values() for f in group if not f.done()],
+                return_when=concurrent.futures.FIRST_COMPLETED,
+            )
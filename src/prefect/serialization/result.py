@@ -66,6 +66,8 @@ class LocalResultSchema(ObjectSchema):
 
     dir = fields.Str(allow_none=False)
     location = fields.Str(allow_none=True)
+    content_addressed = fields.Bool()
+    max_size = fields.Int(allow_none=True)
 
     @post_load
     def create_object(self, data: dict, **kwargs: Any) -> results.LocalResult:
@@ -87,6 +89,8 @@ class S3ResultSchema(ObjectSchema):
 
     bucket = fields.Str(allow_none=False)
     location = fields.Str(allow_none=True)
+    part_size = fields.Int()
+    max_concurrency = fields.Int()
 
 
 class SecretResultSchema(ObjectSchema):
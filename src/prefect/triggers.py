@@ -42,7 +42,7 @@ flow.set_reference_tasks([success])
 flow.run()
 ```
 """
-from typing import TYPE_CHECKING, Callable, Dict, Union
+from typing import TYPE_CHECKING, Callable, Dict, Tuple, Union
 
 from prefect import context
 from prefect.engine import signals
@@ -53,23 +53,31 @@ if TYPE_CHECKING:
     from prefect import core  # noqa
 
 
-def _get_all_states_as_set(upstream_states: Dict["core.Edge", "state.State"]) -> set:
+def _count_states(
+    upstream_states: Dict["core.Edge", "state.State"], kind: str
+) -> Tuple[int, int]:
     """
-    Convert all upstream states to a set and expand map states.
+    Counts the upstream states, including the children of mapped states, which are of
+    the given kind. The children of mapped states are counted from their compact
+    `MappedStates` storage, without building a `State` object for each of them.
 
     Args:
         - upstream_states (dict[Edge, State]): the set of all upstream states
+        - kind (str): one of `"finished"`, `"successful"`, `"failed"` or `"skipped"`
 
     Returns:
-        - set: a set of all upstream State objects
+        - Tuple[int, int]: the number of states of the given kind, and the total number
+            of states
     """
-    all_states = set()
-    for upstream_state in upstream_states.values():
+    count = total = 0
+    for upstream_state in set(upstream_states.values()):
         if isinstance(upstream_state, Mapped):
-            all_states.update(upstream_state.map_states)
+            count += getattr(upstream_state.map_states, "n_" + kind)
+            total += len(upstream_state.map_states)
         else:
-            all_states.add(upstream_state)
-    return all_states
+            count += getattr(upstream_state, "is_" + kind)()
+            total += 1
+    return count, total
 
 
 def all_finished(upstream_states: Dict["core.Edge", "state.State"]) -> bool:
@@ -79,7 +87,8 @@ def all_finished(upstream_states: Dict["core.Edge", "state.State"]) -> bool:
     Args:
         - upstream_states (dict[Edge, State]): the set of all upstream states
     """
-    if not all(s.is_finished() for s in _get_all_states_as_set(upstream_states)):
+    n_finished, n_states = _count_states(upstream_states, "finished")
+    if n_finished < n_states:
         raise signals.TRIGGERFAIL(
             'Trigger was "all_finished" but some of the upstream tasks were not finished.'
         )
@@ -112,7 +121,8 @@ def all_successful(upstream_states: Dict["core.Edge", "state.State"]) -> bool:
         - upstream_states (dict[Edge, State]): the set of all upstream states
     """
 
-    if not all(s.is_successful() for s in _get_all_states_as_set(upstream_states)):
+    n_successful, n_states = _count_states(upstream_states, "successful")
+    if n_successful < n_states:
         raise signals.TRIGGERFAIL(
             'Trigger was "all_successful" but some of the upstream tasks failed.'
         )
@@ -128,7 +138,8 @@ def all_failed(upstream_states: Dict["core.Edge", "state.State"]) -> bool:
         - upstream_states (dict[Edge, State]): the set of all upstream states
     """
 
-    if not all(s.is_failed() for s in _get_all_states_as_set(upstream_states)):
+    n_failed, n_states = _count_states(upstream_states, "failed")
+    if n_failed < n_states:
         raise signals.TRIGGERFAIL(
             'Trigger was "all_failed" but some of the upstream tasks succeeded.'
         )
@@ -144,9 +155,7 @@ def any_successful(upstream_states: Dict["core.Edge", "state.State"]) -> bool:
         - upstream_states (dict[Edge, State]): the set of all upstream states
     """
 
-    if upstream_states and not any(
-        s.is_successful() for s in _get_all_states_as_set(upstream_states)
-    ):
+    if upstream_states and not _count_states(upstream_states, "successful")[0]:
         raise signals.TRIGGERFAIL(
             'Trigger was "any_successful" but none of the upstream tasks succeeded.'
         )
@@ -162,9 +171,7 @@ def any_failed(upstream_states: Dict["core.Edge", "state.State"]) -> bool:
         - upstream_states (dict[Edge, State]): the set of all upstream states
     """
 
-    if upstream_states and not any(
-        s.is_failed() for s in _get_all_states_as_set(upstream_states)
-    ):
+    if upstream_states and not _count_states(upstream_states, "failed")[0]:
         raise signals.TRIGGERFAIL(
             'Trigger was "any_failed" but none of the upstream tasks failed.'
         )
@@ -206,10 +213,7 @@ def some_failed(
             return True
 
         # scale conversions
-        num_failed = len(
-            [s for s in _get_all_states_as_set(upstream_states) if s.is_failed()]
-        )
-        num_states = len(_get_all_states_as_set(upstream_states))
+        num_failed, num_states = _count_states(upstream_states, "failed")
         if at_least is not None:
             min_num = (num_states * at_least) if at_least < 1 else at_least
         else:
@@ -265,10 +269,7 @@ def some_successful(
             return True
 
         # scale conversions
-        num_success = len(
-            [s for s in _get_all_states_as_set(upstream_states) if s.is_successful()]
-        )
-        num_states = len(_get_all_states_as_set(upstream_states))
+        num_success, num_states = _count_states(upstream_states, "successful")
         if at_least is not None:
             min_num = (num_states * at_least) if at_least < 1 else at_least
         else:
@@ -295,11 +296,10 @@ def not_all_skipped(upstream_states: Dict["core.Edge", "state.State"]) -> bool:
         - upstream_states (dict[Edge, State]): the set of all upstream states
     """
 
-    if all(state.is_skipped() for state in _get_all_states_as_set(upstream_states)):
+    n_skipped, n_states = _count_states(upstream_states, "skipped")
+    if n_skipped == n_states:
         raise signals.SKIP("All upstreams were skipped", result=None)
-    elif not all(
-        state.is_successful() for state in _get_all_states_as_set(upstream_states)
-    ):
+    elif _count_states(upstream_states, "successful")[0] < n_states:
         raise signals.TRIGGERFAIL(
             'Trigger was "not_all_skipped" but some of the upstream tasks failed.'
         )
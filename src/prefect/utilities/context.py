@@ -125,7 +125,11 @@ class Context(DotDict, threading.local):
         previous_context = self.__dict__.copy()
         try:
             new_context = dict(*args, **kwargs)
-            if "config" in new_context:
+            # contexts derived from this one (such as those of task runs) pass its
+            # config back unchanged, in which case there is nothing to merge
+            if "config" in new_context and new_context["config"] is not self.get(
+                "config"
+            ):
                 new_context["config"] = merge_dicts(
                     self.get("config", {}), new_context["config"]
                 )
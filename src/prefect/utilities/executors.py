@@ -1,4 +1,7 @@
+import asyncio
+import atexit
 import cloudpickle
+import collections.abc
 import contextlib
 import copy
 import itertools
@@ -15,7 +18,11 @@ from concurrent.futures import TimeoutError as FutureTimeout
 from contextlib import contextmanager
 from functools import wraps
 from logging import Logger
-from queue import Empty
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:  # Python < 3.8
+    shared_memory = None  # type: ignore
 
 import prefect
 from prefect import config
@@ -33,6 +40,8 @@ from typing import (
     Sequence,
     Mapping,
     Iterator,
+    Optional,
+    Tuple,
 )
 
 if TYPE_CHECKING:
@@ -256,33 +265,11 @@ def run_with_thread_timeout(
         signal.alarm(0)
 
 
-def multiprocessing_safe_run_and_retrieve(
-    queue: multiprocessing.Queue,
-    payload: bytes,
-) -> None:
+def _run_and_pickle(payload: bytes) -> "Tuple[bytes, str, Logger]":
     """
-    Gets the return value from a function and puts it in a multiprocessing-safe
-    container. Helper function for `run_with_multiprocess_timeout`, must be defined
-    top-level so it can be pickled and sent to `multiprocessing.Process`
-
-    Passing the payload serialized allows us to escape the limitations of the python
-    native pickler which will fail on tasks defined in scripts because of name
-    mismatches. Whilst this particular example only affects the `func` arg, any of the
-    others could be affected by other pickle limitations as well.
-
-    Args:
-        - queue (multiprocessing.Queue): The queue to pass the resulting payload to
-        - payload (bytes): A serialized dictionary containing the data required to run
-            the function. Should be serialized with `cloudpickle.dumps`
-            Expects the following keys:
-            - fn (Callable): The function to call
-            - args (list): Positional argument values to call the function with
-            - kwargs (Mapping): Keyword arguments to call the function with
-            - context (dict): The prefect context dictionary to use during execution
-            - name (str): an optional name to attach to logs for this function run,
-                defaults to the name of the given function. Provides an interface for
-                passing task names for logs.
-            - logger (Logger): the logger to use
+    Runs the function in a payload (see `multiprocessing_safe_run_and_retrieve`) and
+    returns its pickled return value (or error), along with the name and logger to use
+    for logs about the run.
     """
     request = cloudpickle.loads(payload)
 
@@ -329,6 +316,39 @@ def multiprocessing_safe_run_and_retrieve(
         logger.error(f"{name}: {err_msg}")
         pickled_val = cloudpickle.dumps(RuntimeError(err_msg))
 
+    return pickled_val, name, logger
+
+
+def multiprocessing_safe_run_and_retrieve(
+    queue: multiprocessing.Queue,
+    payload: bytes,
+) -> None:
+    """
+    Gets the return value from a function and puts it in a multiprocessing-safe
+    container. Helper function for `run_with_multiprocess_timeout`, must be defined
+    top-level so it can be pickled and sent to `multiprocessing.Process`
+
+    Passing the payload serialized allows us to escape the limitations of the python
+    native pickler which will fail on tasks defined in scripts because of name
+    mismatches. Whilst this particular example only affects the `func` arg, any of the
+    others could be affected by other pickle limitations as well.
+
+    Args:
+        - queue (multiprocessing.Queue): The queue to pass the resulting payload to
+        - payload (bytes): A serialized dictionary containing the data required to run
+            the function. Should be serialized with `cloudpickle.dumps`
+            Expects the following keys:
+            - fn (Callable): The function to call
+            - args (list): Positional argument values to call the function with
+            - kwargs (Mapping): Keyword arguments to call the function with
+            - context (dict): The prefect context dictionary to use during execution
+            - name (str): an optional name to attach to logs for this function run,
+                defaults to the name of the given function. Provides an interface for
+                passing task names for logs.
+            - logger (Logger): the logger to use
+    """
+    pickled_val, name, logger = _run_and_pickle(payload)
+
     logger.debug(f"{name}: Passing result back to main process...")
 
     try:
@@ -341,6 +361,194 @@ def multiprocessing_safe_run_and_retrieve(
         raise
 
 
+# return values which pickle to more than this many bytes are passed back from timeout
+# worker processes through shared memory, rather than through their pipe
+SHARED_MEMORY_THRESHOLD = 2**20
+
+
+def _timeout_worker(conn: "multiprocessing.connection.Connection") -> None:
+    """
+    The main loop of a `TimeoutWorkerPool` worker process: runs each payload received
+    on `conn` (see `multiprocessing_safe_run_and_retrieve`) and sends back its pickled
+    return value, or the name and size of a shared memory block holding it. Exits once
+    `conn` is closed by the parent process.
+    """
+    while True:
+        try:
+            payload = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+
+        pickled_val, name, logger = _run_and_pickle(payload)
+        logger.debug(f"{name}: Passing result back to main process...")
+
+        if shared_memory is not None and len(pickled_val) > SHARED_MEMORY_THRESHOLD:
+            block = shared_memory.SharedMemory(create=True, size=len(pickled_val))
+            block.buf[: len(pickled_val)] = pickled_val
+            conn.send(("shared_memory", block.name, len(pickled_val)))
+            block.close()
+        else:
+            conn.send(("pipe", pickled_val))
+
+
+class TimeoutWorkerPool:
+    """
+    A pool of reusable worker processes for `run_with_multiprocess_timeout`, so that
+    each run with a timeout doesn't pay for starting (and importing everything in) a new
+    process. Workers are started with the "spawn" method and run one function at a
+    time; a worker is only killed if its function exceeds its timeout, in which case a
+    replacement is started right away.
+
+    Workers are reused across runs, so changes a function makes to the global state of
+    its process (such as environment variables or imported modules) are seen by later
+    runs in the same worker.
+
+    Args:
+        - max_idle (int, optional): the number of idle workers to keep; any others are
+            stopped once their run finishes. Defaults to the
+            `engine.task_runner.timeout_workers` setting.
+    """
+
+    def __init__(self, max_idle: int = None):
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle = []  # type: List[Tuple[multiprocessing.Process, Any]]
+        self._context = multiprocessing.get_context("spawn")
+
+    def _start_worker(self) -> "Tuple[multiprocessing.Process, Any]":
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_timeout_worker, args=(child_conn,))
+        process.start()
+        child_conn.close()
+        return process, parent_conn
+
+    def _max_idle(self) -> int:
+        if self.max_idle is not None:
+            return self.max_idle
+        return config.engine.task_runner.timeout_workers
+
+    def _acquire(self) -> "Tuple[multiprocessing.Process, Any]":
+        with self._lock:
+            while self._idle:
+                worker = self._idle.pop()
+                if worker[0].is_alive():
+                    return worker
+                worker[1].close()
+        return self._start_worker()
+
+    def _release(self, worker: "Tuple[multiprocessing.Process, Any]") -> None:
+        with self._lock:
+            if len(self._idle) < self._max_idle():
+                self._idle.append(worker)
+                return
+        self._stop_worker(worker)
+
+    @staticmethod
+    def _stop_worker(worker: "Tuple[multiprocessing.Process, Any]") -> None:
+        process, conn = worker
+        # closing the pipe stops the worker's loop
+        conn.close()
+        process.join(1)
+        if process.is_alive():
+            process.terminate()
+            process.join()
+
+    @staticmethod
+    def _kill_worker(worker: "Tuple[multiprocessing.Process, Any]") -> None:
+        process, conn = worker
+        process.terminate()
+        process.join()
+        conn.close()
+
+    def run(
+        self, payload: bytes, timeout: float, name: str, logger: Logger = None
+    ) -> Any:
+        """
+        Runs a payload (see `multiprocessing_safe_run_and_retrieve`) in a worker.
+
+        Args:
+            - payload (bytes): the payload to run
+            - timeout (float): the number of seconds to wait for the function's result
+            - name (str): the name to use in logs for the function run
+            - logger (Logger, optional): the logger to use
+
+        Returns:
+            - Any: the return value of the function
+
+        Raises:
+            - Exception: any error raised by the function
+            - TaskTimeoutSignal: if the function doesn't finish within the timeout
+            - RuntimeError: if the worker exits while running the function
+        """
+        logger = logger or get_logger()
+        process, conn = worker = self._acquire()
+        logger.debug(f"{name}: Sending execution to worker process {process.pid}...")
+        try:
+            conn.send_bytes(payload)
+            logger.debug(
+                f"{name}: Waiting for process to return with {timeout}s timeout..."
+            )
+            # If no result arrives, the function did not finish before the timeout
+            if not conn.poll(timeout):
+                logger.debug(f"{name}: No result returned within the timeout period!")
+                self._kill_worker(worker)
+                # replace the worker, so that the next run doesn't wait for one to start
+                if len(self._idle) < self._max_idle():
+                    self._release(self._start_worker())
+                raise TaskTimeoutSignal(f"Execution timed out for {name}.")
+            message = conn.recv()
+        except (EOFError, OSError) as exc:
+            self._kill_worker(worker)
+            raise RuntimeError(
+                f"{name}: The process running the function exited unexpectedly."
+            ) from exc
+
+        self._release(worker)
+
+        if message[0] == "shared_memory":
+            _, block_name, size = message
+            block = shared_memory.SharedMemory(name=block_name)
+            try:
+                pickled_result = bytes(block.buf[:size])
+            finally:
+                block.close()
+                block.unlink()
+        else:
+            pickled_result = message[1]
+
+        logger.debug(f"{name}: Result received from subprocess, unpickling...")
+        result = cloudpickle.loads(pickled_result)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    def shutdown(self) -> None:
+        """
+        Stops all idle workers.
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            self._stop_worker(worker)
+
+
+_timeout_worker_pool = None  # type: Optional[TimeoutWorkerPool]
+_timeout_worker_pool_lock = threading.Lock()
+
+
+def get_timeout_worker_pool() -> TimeoutWorkerPool:
+    """
+    Returns the `TimeoutWorkerPool` shared by all runs in this process, creating it
+    on first use.
+    """
+    global _timeout_worker_pool
+    with _timeout_worker_pool_lock:
+        if _timeout_worker_pool is None:
+            _timeout_worker_pool = TimeoutWorkerPool()
+            atexit.register(_timeout_worker_pool.shutdown)
+        return _timeout_worker_pool
+
+
 def run_with_multiprocess_timeout(
     fn: Callable,
     args: Sequence = (),
@@ -352,8 +560,9 @@ def run_with_multiprocess_timeout(
     """
     Helper function for implementing timeouts on function executions.
 
-    Implemented by spawning a new multiprocess.Process() and using a queue to pass
-    the result back. The result is retrieved from the queue with a timeout.
+    Implemented by running the function in a worker process of the shared
+    `TimeoutWorkerPool` and waiting for the result with a timeout. Workers are reused
+    between runs, unless they time out.
 
     Args:
         - fn (callable): the function to execute
@@ -382,11 +591,6 @@ def run_with_multiprocess_timeout(
     if timeout is None:
         return fn(*args, **kwargs)
 
-    spawn_mp = multiprocessing.get_context("spawn")
-
-    # Create a queue to pass the function return value back
-    queue = spawn_mp.Queue()  # type: multiprocessing.Queue
-
     # Set internal kwargs for the helper function
     request = {
         "fn": fn,
@@ -398,30 +602,100 @@ def run_with_multiprocess_timeout(
     }
     payload = cloudpickle.dumps(request)
 
-    run_process = spawn_mp.Process(
-        target=multiprocessing_safe_run_and_retrieve,
-        args=(queue, payload),
+    return get_timeout_worker_pool().run(
+        payload, timeout=timeout, name=name, logger=logger
     )
-    logger.debug(f"{name}: Sending execution to a new process...")
-    run_process.start()
-    logger.debug(f"{name}: Waiting for process to return with {timeout}s timeout...")
 
-    # Pull the data from the queue. If empty, the function did not finish before
-    # the timeout
+
+# the event loop which coroutine tasks are run on by threads which belong to an
+# executor with an event loop (see `AsyncExecutor`)
+_thread_event_loop = threading.local()
+
+
+def set_thread_event_loop(loop: "Optional[asyncio.AbstractEventLoop]") -> None:
+    """
+    Sets the event loop (running in another thread) which `run_coroutine` runs
+    coroutines on when called from the current thread.
+
+    Args:
+        - loop (asyncio.AbstractEventLoop, optional): the event loop, or `None` to
+            run coroutines on a new event loop in the current thread
+    """
+    _thread_event_loop.loop = loop
+
+
+class _InContext:
+    """
+    Awaits a coroutine with the Prefect context set to its own context whenever the
+    coroutine runs, so that coroutines running concurrently on the same event loop
+    (and so in the same thread) each see the context they were started in.
+    """
+
+    def __init__(self, coro: Any, context: dict):
+        self.coro = coro
+        self.context = context
+
+    def __await__(self) -> Iterator[Any]:
+        value, error = None, None  # type: Any, Optional[BaseException]
+        while True:
+            outer_context = prefect.context.__dict__.copy()
+            prefect.context.clear()
+            prefect.context.update(self.context)
+            try:
+                if error is not None:
+                    yielded = self.coro.throw(error)
+                else:
+                    yielded = self.coro.send(value)
+            except StopIteration as exc:
+                return exc.value
+            finally:
+                self.context = prefect.context.__dict__.copy()
+                prefect.context.clear()
+                prefect.context.update(outer_context)
+            try:
+                value, error = (yield yielded), None
+            except BaseException as exc:
+                value, error = None, exc
+
+
+async def _await_in_context(coro: Any, context: dict) -> Any:
+    return await _InContext(coro, context)
+
+
+def run_coroutine(coro: Any, timeout: float = None, name: str = None) -> Any:
+    """
+    Runs a coroutine to completion from synchronous code, in the current Prefect
+    context, and returns its result.
+
+    If the current thread belongs to an executor with an event loop (see
+    `set_thread_event_loop`), the coroutine runs on that loop, alongside the coroutines
+    of other threads; otherwise it runs on a new event loop in the current thread.
+
+    Args:
+        - coro (Coroutine): the coroutine to run
+        - timeout (float, optional): the number of seconds after which the coroutine
+            is cancelled
+        - name (str, optional): a name to use in the timeout error message
+
+    Returns:
+        - the result of the coroutine
+
+    Raises:
+        - TaskTimeoutSignal: if the coroutine doesn't finish within the timeout
+    """
+    awaitable = _await_in_context(coro, prefect.context.to_dict())
+    if timeout is not None:
+        awaitable = asyncio.wait_for(awaitable, timeout)
+
+    loop = getattr(_thread_event_loop, "loop", None)
     try:
-        pickled_result = queue.get(block=True, timeout=timeout)
-        logger.debug(f"{name}: Result received from subprocess, unpickling...")
-        result = cloudpickle.loads(pickled_result)
-        if isinstance(result, Exception):
-            raise result
-        return result
-    except Empty:
-        logger.debug(f"{name}: No result returned within the timeout period!")
-        raise TaskTimeoutSignal(f"Execution timed out for {name}.")
-    finally:
-        # Do not let the process dangle
-        run_process.join(0.1)
-        run_process.terminate()
+        if loop is None:
+            return asyncio.run(awaitable)
+        return asyncio.run_coroutine_threadsafe(awaitable, loop).result()
+    except asyncio.TimeoutError as exc:
+        raise TaskTimeoutSignal(
+            f"Execution timed out for {name or 'coroutine'}."
+        ) from exc
 
 
 def run_task_with_timeout(
@@ -462,6 +736,14 @@ def run_task_with_timeout(
     name = prefect.context.get("task_full_name", task.name)
     kwargs = kwargs or {}
 
+    # coroutine tasks are awaited, and their timeout enforced by cancelling them
+    if asyncio.iscoroutinefunction(task.run):  # type: ignore
+        return run_coroutine(
+            task.run(*args, **kwargs),  # type: ignore
+            timeout=task.timeout,
+            name=f"Task '{name}'",
+        )
+
     # if no timeout, just run the function
     if task.timeout is None:
         return task.run(*args, **kwargs)  # type: ignore
@@ -590,6 +872,23 @@ def tail_recursive(func: Callable) -> Callable:
     return wrapper
 
 
+def is_stream(value: Any) -> bool:
+    """
+    Returns `True` if a task result is a stream of items to map over: an iterator (for
+    example the generator returned by a task whose `run` method yields) which,
+    unlike a list, can't be indexed and can only be consumed once.
+
+    Args:
+        - value (Any): a task result
+
+    Returns:
+        - bool: whether the value is a stream
+    """
+    return isinstance(value, collections.abc.Iterator) and not hasattr(
+        value, "__getitem__"
+    )
+
+
 def prepare_upstream_states_for_mapping(
     state: "State",
     upstream_states: "Dict[Edge, State]",
@@ -607,14 +906,74 @@ def prepare_upstream_states_for_mapping(
     Returns:
         - List: a restructured list of upstream states correponding to each new mapped child task
     """
+    return list(
+        iter_upstream_states_for_mapping(
+            state, upstream_states, mapped_children, executor=executor
+        )
+    )
+
+
+class MappedUpstreamState:
+    """
+    A view of the upstream states of the mapped children of a task, for an upstream
+    task whose result the children map over. Indexing the view returns a copy of the
+    upstream state whose result is the corresponding item of the upstream result.
+
+    Mapped children are given `(view, index)` pairs, which `resolve_mapped_child`
+    resolves when the child runs, so that no state is built for a child before then.
+
+    Args:
+        - state (State): the upstream task's state
+        - index_result (bool, optional): whether to index into the upstream result;
+            if `False`, copies of the upstream state are returned as they are
+    """
+
+    def __init__(self, state: "State", index_result: bool = True):
+        self.state = state
+        self.index_result = index_result
+
+    def __getitem__(self, index: int) -> "State":
+        new_state = copy.copy(self.state)
+        if self.index_result:
+            result = self.state.result
+            value = result[index] if hasattr(result, "__getitem__") else None
+            new_state.result = self.state._result.from_value(value)  # type: ignore
+        return new_state
+
+
+def iter_upstream_states_for_mapping(
+    state: "State",
+    upstream_states: "Dict[Edge, State]",
+    mapped_children: "Dict[Task, list]",
+    executor: "prefect.executors.Executor",
+) -> "Iterator[Dict[Edge, State]]":
+    """
+    Lazily restructures the upstream states of a mapped task into the upstream states of
+    each of its mapped children, as `prepare_upstream_states_for_mapping` does.
+
+    The states of upstream tasks whose results are mapped over are not built here:
+    children are given `(view, index)` pairs over a `MappedUpstreamState`, which is
+    shared with the executor once and resolved by `resolve_mapped_child` as each child
+    runs. Upstream results which are streams (see `is_stream`) are consumed one item per
+    child, only as the children are requested, so that children can be submitted
+    before the stream is exhausted.
+
+    Args:
+        - state (State): the parent task's current state
+        - upstream_states (Dict[Edge, State]): the upstream states to this task
+        - mapped_children (Dict[Task, List[State]]): any mapped children upstream of this task
+        - executor (Executor): the executor used to flatten mapped children and share
+            upstream states
+
+    Returns:
+        - Iterator[Dict[Edge, State]]: the upstream states of each new mapped child task
+    """
 
     # if the current state is failed / skipped or otherwise
     # in a state that signifies we should not continue with mapping,
     # we return an empty list
     if state.is_pending() or state.is_failed() or state.is_skipped():
-        return []
-
-    map_upstream_states = []
+        return
 
     # copy the mapped children dict to avoid mutating the global one
     # when we flatten mapped children
@@ -624,6 +983,11 @@ def prepare_upstream_states_for_mapping(
     # the end of the shortest one
     counter = itertools.count()
 
+    # views of the upstream states whose results are mapped over, and the number of
+    # children they (and this task's existing children) allow for
+    views = {}  # type: Dict[Edge, Any]
+    n_children = None  # type: Optional[int]
+
     # preprocessing
     for edge, upstream_state in upstream_states.items():
 
@@ -639,13 +1003,55 @@ def prepare_upstream_states_for_mapping(
                 mapped_children=mapped_children[edge.upstream_task], executor=executor
             )
 
+        if not edge.mapped or upstream_state.is_mapped():
+            continue
+
+        # if the current state is already Mapped, then we might be executing
+        # a re-run of the mapping pipeline. In that case, the upstream states
+        # might not have `result` attributes.
+        # Therefore, we only try to get a result if EITHER this task's
+        # state is not already mapped OR the upstream result is not None.
+        index_result = (
+            not state.is_mapped()
+            or upstream_state._result != prefect.engine.result.NoResult
+        )
+        lengths = []
+        if index_result:
+            result = upstream_state.result
+            # streams, and results of unknown length, are indexed as children
+            # are requested below
+            if is_stream(result) or (
+                hasattr(result, "__getitem__") and not hasattr(result, "__len__")
+            ):
+                continue
+            if hasattr(result, "__getitem__"):
+                lengths.append(len(result))
+            if state.map_states:  # type: ignore
+                lengths.append(len(state.map_states))  # type: ignore
+        else:
+            lengths.append(len(state.map_states))  # type: ignore
+
+        views[edge] = executor.share(MappedUpstreamState(upstream_state, index_result))
+        if n_children is not None:
+            lengths.append(n_children)
+        if lengths:
+            n_children = min(lengths)
+
+    # edges are looked up once, rather than once per child
+    edges = [
+        (edge, upstream_state, views.get(edge))
+        for edge, upstream_state in upstream_states.items()
+    ]
+
     # infinite loop, if upstream_states has any entries
     while True and upstream_states:
         i = next(counter)
         states = {}
         try:
+            if n_children is not None and i >= n_children:
+                raise IndexError()
 
-            for edge, upstream_state in upstream_states.items():
+            for edge, upstream_state, view in edges:
 
                 # if the edge is not mapped over, then we take its state
                 if not edge.mapped:
@@ -656,49 +1062,102 @@ def prepare_upstream_states_for_mapping(
                 # state from the upstream tasks's `Mapped.map_states` array.
                 # Note that these "states" might actually be futures at this time; we aren't
                 # blocking until they finish.
-                elif edge.mapped and upstream_state.is_mapped():
+                elif upstream_state.is_mapped():
                     states[edge] = mapped_children[edge.upstream_task][i]  # type: ignore
 
                 # Otherwise, we are mapping over the result of a "vanilla" task. In this
-                # case, we create a copy of the upstream state but set the result to the
-                # appropriately-indexed item from the upstream task's `State.result`
-                # array.
+                # case, the child's state is a copy of the upstream state with the
+                # appropriately-indexed item of the upstream task's `State.result`
+                # array as its result, which is built when the child runs
+                elif view is not None:
+                    states[edge] = (view, i)
+
+                # streams are consumed as children are requested, so their items are
+                # taken from them right away
                 else:
-                    states[edge] = copy.copy(upstream_state)
-
-                    # if the current state is already Mapped, then we might be executing
-                    # a re-run of the mapping pipeline. In that case, the upstream states
-                    # might not have `result` attributes.
-                    # Therefore, we only try to get a result if EITHER this task's
-                    # state is not already mapped OR the upstream result is not None.
-                    if (
-                        not state.is_mapped()
-                        or upstream_state._result != prefect.engine.result.NoResult
-                    ):
-                        if not hasattr(upstream_state.result, "__getitem__"):
-                            value = None
-                        else:
-                            value = upstream_state.result[i]
-                        upstream_result = upstream_state._result.from_value(value)  # type: ignore
-                        states[edge].result = upstream_result
-                        if state.map_states and i >= len(state.map_states):  # type: ignore
+                    if is_stream(upstream_state.result):
+                        # the end of a stream is the end of the iterable
+                        value = next(upstream_state.result, StopIteration)
+                        if value is StopIteration:
                             raise IndexError()
-                    elif state.is_mapped():
-                        if i >= len(state.map_states):  # type: ignore
-                            raise IndexError()
-
-            # only add this iteration if we made it through all iterables
-            map_upstream_states.append(states)
+                    else:
+                        value = upstream_state.result[i]
+                    states[edge] = copy.copy(upstream_state)
+                    states[edge].result = upstream_state._result.from_value(value)  # type: ignore
+                    if state.map_states and i >= len(state.map_states):  # type: ignore
+                        raise IndexError()
 
         # index error means we reached the end of the shortest iterable
         except IndexError:
-            break
+            return
 
-    return map_upstream_states
+        # only yield this iteration if we made it through all iterables
+        yield states
+
+
+def resolve_mapped_child(child: Any) -> "State":
+    """
+    Returns the state of a mapped child. The children of mapped tasks that run in
+    chunks are represented by `(chunk, index)` pairs, where `chunk` is the list of
+    states returned by the chunk (or a future for it). The upstream states of mapped
+    children are represented by `(view, index)` pairs in the same way (see
+    `MappedUpstreamState`).
+
+    Args:
+        - child (Any): a child state, or a `(chunk, index)` pair
+
+    Returns:
+        - State: the state of the child
+    """
+    if isinstance(child, tuple):
+        chunk, index = child
+        return chunk[index]
+    return child
+
+
+def release_result(state: "State") -> "State":
+    """
+    Returns a copy of a state without its in-memory result value. If the result was
+    persisted, the copy keeps the result's location, so the value can be recovered
+    with `State.load_result`; otherwise, the copy's result is `NoResult`.
+
+    Args:
+        - state (State): the state whose result should be released
+
+    Returns:
+        - State: a copy of `state` which no longer references its result value
+    """
+    released = copy.copy(state)
+    if getattr(state._result, "location", None) is not None:
+        released._result = state._result.copy()
+        released._result.value = None
+    else:
+        released._result = prefect.engine.result.NoResult
+    return released
+
+
+def release_results(value: Any) -> Any:
+    """
+    Releases the result of a state with `release_result`, or of each state in a list
+    (such as the states returned by a chunk of mapped children). Any other value is
+    returned as is.
+
+    Args:
+        - value (Any): a state, or a list of states
+
+    Returns:
+        - Any: `value`, with the results of its states released
+    """
+    if isinstance(value, prefect.engine.state.State):
+        return release_result(value)
+    if isinstance(value, list):
+        return [release_results(item) for item in value]
+    return value
 
 
 def _build_flattened_state(state: "State", index: int) -> "State":
     """Helper function for `flatten_upstream_state`"""
+    state = resolve_mapped_child(state)
     new_state = copy.copy(state)
     new_state.result = state._result.from_value(state.result[index])  # type: ignore
     return new_state
@@ -725,7 +1184,10 @@ def flatten_mapped_children(
     executor: "prefect.executors.Executor",
 ) -> List["State"]:
     counts = executor.wait(
-        [executor.submit(lambda c: len(c._result.value), c) for c in mapped_children]
+        [
+            executor.submit(lambda c: len(resolve_mapped_child(c)._result.value), c)
+            for c in mapped_children
+        ]
     )
     new_states = []
 
@@ -25,7 +25,13 @@ if TYPE_CHECKING:
     from prefect import Flow
 
 
-def apply_map(func: Callable, *args: Any, flow: "Flow" = None, **kwargs: Any) -> Any:
+def apply_map(
+    func: Callable,
+    *args: Any,
+    flow: "Flow" = None,
+    chunk_size: int = None,
+    **kwargs: Any,
+) -> Any:
     """
     Map a function that adds tasks to a flow elementwise across one or more
     tasks.  Arguments that should _not_ be mapped over should be wrapped with
@@ -41,6 +47,9 @@ def apply_map(func: Callable, *args: Any, flow: "Flow" = None, **kwargs: Any) ->
         - flow (Flow, optional): The flow to use, defaults to the current flow
             in context if no flow is specified. If specified, `func` must accept
             a `flow` keyword argument.
+        - chunk_size (int, optional): if provided, the children of every task created
+            by `func` are run in chunks of this many elements; see `Task.map` for
+            details
         - **kwargs: keyword task arguments to map over
 
     Returns:
@@ -78,6 +87,11 @@ def apply_map(func: Callable, *args: Any, flow: "Flow" = None, **kwargs: Any) ->
             raise ValueError("Couldn't infer a flow in the current context")
     assert isinstance(flow, prefect.Flow)  # appease mypy
 
+    if chunk_size is not None and (not isinstance(chunk_size, int) or chunk_size < 1):
+        raise ValueError(
+            "`chunk_size` must be a positive integer, got {!r}".format(chunk_size)
+        )
+
     # Cache the original tasks of the flow for calculating the difference later
     original_flow_tasks = flow.tasks.copy()
 
@@ -187,6 +201,8 @@ def apply_map(func: Callable, *args: Any, flow: "Flow" = None, **kwargs: Any) ->
     # to all newly created tasks in the apply_map.
     new_tasks = flow2.tasks.difference(original_flow_tasks).difference(arg_info)
     for task in new_tasks:
+        if chunk_size is not None:
+            task.chunk_size = chunk_size
         upstream_tasks = flow.upstream_tasks(task)
         is_root_in_subgraph = not upstream_tasks.intersection(new_tasks)
         if is_root_in_subgraph:
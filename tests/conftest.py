@@ -11,7 +11,12 @@ if sys.platform != "win32":
 from distributed import Client
 
 import prefect
-from prefect.executors import DaskExecutor, LocalDaskExecutor, LocalExecutor
+from prefect.executors import (
+    DaskExecutor,
+    LocalDaskExecutor,
+    LocalExecutor,
+    PoolExecutor,
+)
 from prefect.utilities import configuration
 
 
@@ -95,7 +100,28 @@ def mproc():
 
 
 @pytest.fixture()
-def _switch(mthread, local, sync, mproc, mproc_local, threaded_local):
+def threaded_pool():
+    "Multithreaded executor using a `concurrent.futures` thread pool"
+    yield PoolExecutor("threads", max_workers=4)
+
+
+@pytest.fixture()
+def mproc_pool():
+    "Multiprocessing executor using a `concurrent.futures` process pool"
+    yield PoolExecutor("processes", max_workers=2)
+
+
+@pytest.fixture()
+def _switch(
+    mthread,
+    local,
+    sync,
+    mproc,
+    mproc_local,
+    threaded_local,
+    threaded_pool,
+    mproc_pool,
+):
     """
     A construct needed so we can parametrize the executor fixture.
 
@@ -109,6 +135,8 @@ def _switch(mthread, local, sync, mproc, mproc_local, threaded_local):
         mproc=mproc,
         mproc_local=mproc_local,
         threaded_local=threaded_local,
+        threaded_pool=threaded_pool,
+        mproc_pool=mproc_pool,
     )
     return lambda e: execs[e]
 
@@ -1,3 +1,4 @@
+import cloudpickle
 import pytest
 
 import prefect
@@ -92,6 +93,24 @@ def test_object_inequality():
     assert Edge(Task(), Task()) != 1
 
 
+def test_edge_pickle_roundtrip():
+    edge = Edge(Task(), Task(), key="x", mapped=True)
+    new = cloudpickle.loads(cloudpickle.dumps(edge))
+    assert new.upstream_task.slug == edge.upstream_task.slug
+    assert new.downstream_task.slug == edge.downstream_task.slug
+    assert (new.key, new.mapped, new.flattened) == ("x", True, False)
+
+
+def test_edge_setstate_accepts_dict_state():
+    t1, t2 = Task(), Task()
+    state = dict(
+        upstream_task=t1, downstream_task=t2, key="x", mapped=False, flattened=True
+    )
+    edge = Edge.__new__(Edge)
+    edge.__setstate__(state)
+    assert edge == Edge(t1, t2, key="x", flattened=True)
+
+
 def test_serialize_edge():
     t1 = Task()
     t2 = Task()
@@ -1166,6 +1166,119 @@ def test_sorted_tasks_with_invalid_start_task():
         f.sorted_tasks(root_tasks=[t3])
 
 
+def test_sorted_tasks_with_edges_added_against_insertion_order():
+    """
+    t1 -> t2 -> t3 -> t4, with tasks added to the flow in reverse
+    """
+    f = Flow(name="test")
+    t1, t2, t3, t4 = Task("1"), Task("2"), Task("3"), Task("4")
+    for t in [t4, t3, t2, t1]:
+        f.add_task(t)
+    f.add_edge(t3, t4)
+    f.add_edge(t1, t2)
+    f.add_edge(t2, t3)
+    assert f.sorted_tasks() == (t1, t2, t3, t4)
+    assert f.sorted_tasks(root_tasks=[t2]) == (t2, t3, t4)
+
+
+def test_sorted_tasks_detects_long_cycles_added_without_validation():
+    f = Flow(name="test")
+    t1, t2, t3, t4 = Task("1"), Task("2"), Task("3"), Task("4")
+    f.chain(t1, t2, t3, t4)
+    f.add_edge(t4, t2, validate=False)
+
+    with pytest.raises(ValueError, match="Cycle found"):
+        f.sorted_tasks()
+    with pytest.raises(ValueError, match="Cycle found"):
+        f.sorted_tasks(root_tasks=[t3])
+
+
+def test_sorted_tasks_after_replace():
+    f = Flow(name="test")
+    t1, t2, t3, t4 = Task("1"), Task("2"), Task("3"), Task("4")
+    f.chain(t1, t2, t3)
+    f.replace(t2, t4)
+    assert f.sorted_tasks() == (t1, t4, t3)
+
+
+def test_graph_indexes_are_rebuilt_for_flows_pickled_without_them():
+    f = Flow(name="test")
+    t1, t2 = Task("1"), Task("2")
+    f.add_edge(t2, t1)
+    state = f.__dict__.copy()
+    state["edges"] = set(f.edges)
+    for attr in ["_graph", "_slug_values", "_task_order"]:
+        state.pop(attr)
+
+    new = Flow.__new__(Flow)
+    new.__setstate__(state)
+    assert new.edges_to(t1) == f.edges_to(t1)
+    assert new.sorted_tasks() == (t2, t1)
+    with pytest.raises(ValueError, match="slug"):
+        new.add_task(Task("3", slug=f.slugs[t1]))
+
+
+class TestCompactGraph:
+    def test_compact_graph_defaults_to_config(self):
+        assert Flow(name="test").graph_stats()["backend"] == "default"
+        with set_temporary_config({"flows.compact_graph": True}):
+            assert Flow(name="test").graph_stats()["backend"] == "compact"
+
+    def test_compact_graph_matches_default_graph(self):
+        flows = [Flow(name="test"), Flow(name="test", compact_graph=True)]
+        t1, t2, t3, t4 = Task("1"), Task("2"), Task("3"), Task("4")
+        for f in flows:
+            f.add_edge(t3, t4, key="x", mapped=True)
+            f.add_edge(t1, t2)
+            f.add_edge(t2, t3, flattened=True)
+            f.add_edge(t1, t3)
+
+        default, compact = flows
+        assert compact.edges == default.edges
+        assert compact.sorted_tasks() == default.sorted_tasks() == (t1, t2, t3, t4)
+        for t in [t1, t2, t3, t4]:
+            assert compact.edges_to(t) == default.edges_to(t)
+            assert compact.edges_from(t) == default.edges_from(t)
+            assert compact.upstream_tasks(t) == default.upstream_tasks(t)
+        assert compact.all_downstream_edges() == default.all_downstream_edges()
+
+    def test_compact_graph_replace_and_copy(self):
+        f = Flow(name="test", compact_graph=True)
+        t1, t2, t3, t4 = Task("1"), Task("2"), Task("3"), Task("4")
+        f.chain(t1, t2, t3)
+        f2 = f.copy()
+        f.replace(t2, t4)
+        assert f.sorted_tasks() == (t1, t4, t3)
+        assert f.edges == {Edge(t1, t4), Edge(t4, t3)}
+        assert f2.edges == {Edge(t1, t2), Edge(t2, t3)}
+
+    def test_compact_graph_survives_cloudpickle(self):
+        f = Flow(name="test", compact_graph=True)
+        t1, t2 = Task("1"), Task("2")
+        f.add_edge(t1, t2, key="x")
+        new = cloudpickle.loads(cloudpickle.dumps(f))
+        assert new.graph_stats()["backend"] == "compact"
+        assert len(new.edges) == 1
+        assert [e.key for e in new.edges] == ["x"]
+
+    def test_compact_graph_flow_runs(self):
+        with Flow(name="test", compact_graph=True) as f:
+            x = Parameter("x")
+            y = AddTask().map(x, unmapped(1))
+        state = f.run(x=[1, 2, 3])
+        assert state.is_successful()
+        assert state.result[y].result == [2, 3, 4]
+
+    @pytest.mark.parametrize("compact_graph", [False, True])
+    def test_graph_stats(self, compact_graph):
+        f = Flow(name="test", compact_graph=compact_graph)
+        f.chain(Task("1"), Task("2"), Task("3"))
+        stats = f.graph_stats()
+        assert stats["tasks"] == 3
+        assert stats["edges"] == 2
+        assert stats["total_bytes"] == stats["edge_bytes"] + stats["index_bytes"] > 0
+
+
 def test_flow_raises_for_irrelevant_user_provided_parameters():
     class ParameterTask(Task):
         def run(self):
@@ -1691,6 +1804,39 @@ class TestCache:
         f.set_reference_tasks([t1])
         assert 1 not in f._cache
 
+    def test_cache_is_invalidated_when_graph_version_changes(self):
+        f = Flow(name="test")
+        t1 = Task()
+        t2 = Task()
+        f.add_edge(t1, t2)
+        f.root_tasks()
+        key = ("root_tasks", ())
+        f._cache[key] = 1
+        assert f.root_tasks() == 1
+
+        f._graph_version += 1
+        assert f.root_tasks() == {t1}
+
+    def test_mutating_methods_increment_graph_version(self):
+        f = Flow(name="test")
+        t1 = Task()
+        t2 = Task()
+        t3 = Task()
+
+        versions = [f._graph_version]
+        f.add_task(t1)
+        versions.append(f._graph_version)
+        f.add_edge(t1, t2)
+        versions.append(f._graph_version)
+        f.set_reference_tasks([t2])
+        versions.append(f._graph_version)
+        f.replace(t2, t3)
+        versions.append(f._graph_version)
+        f.update(Flow(name="other", tasks=[Task()]))
+        versions.append(f._graph_version)
+
+        assert versions == sorted(set(versions))
+
 
 class TestReplace:
     def test_replace_replaces_all_the_things(self):
@@ -0,0 +1,63 @@
+import pytest
+
+from prefect.core import Edge, Task
+from prefect.core.graph import CompactTaskGraph, TaskGraph
+
+
+@pytest.fixture(params=[TaskGraph, CompactTaskGraph])
+def graph_cls(request):
+    return request.param
+
+
+def test_add_and_remove_edges(graph_cls):
+    graph = graph_cls()
+    t1, t2, t3 = Task("1"), Task("2"), Task("3")
+    for t in [t1, t2, t3]:
+        graph.add_task(t)
+    e1, e2 = Edge(t1, t2), Edge(t2, t3, key="x")
+    graph.add_edge(e1)
+    graph.add_edge(e2)
+    graph.add_edge(Edge(t1, t2))
+
+    assert len(graph.edges) == 2
+    assert graph.edges_to(t3) == {e2}
+    assert graph.downstream_tasks(t1) == [t2]
+
+    graph.remove_edge(e1)
+    assert graph.edges == {e2}
+    assert graph.edges_from(t1) == set()
+
+
+def test_remove_task_returns_incident_edges(graph_cls):
+    t1, t2, t3 = Task("1"), Task("2"), Task("3")
+    edges = [Edge(t1, t2), Edge(t2, t3)]
+    graph = graph_cls.from_edges([t1, t2, t3], edges)
+    assert graph.remove_task(t2) == set(edges)
+    assert len(graph.edges) == 0
+    assert graph.stats()["tasks"] == 2
+
+
+def test_copy_is_independent(graph_cls):
+    t1, t2, t3 = Task("1"), Task("2"), Task("3")
+    graph = graph_cls.from_edges([t1, t2, t3], [Edge(t1, t2)])
+    new = graph.copy()
+    new.add_edge(Edge(t2, t3))
+    assert graph.edges == {Edge(t1, t2)}
+    assert new.edges == {Edge(t1, t2), Edge(t2, t3)}
+
+
+def test_compact_graph_indexes_many_edges():
+    tasks = [Task(str(i)) for i in range(3000)]
+    edges = [Edge(tasks[0], t) for t in tasks[1:]] + [
+        Edge(a, b) for a, b in zip(tasks[1:], tasks[2:])
+    ]
+    graph = CompactTaskGraph.from_edges(tasks, edges)
+    default = TaskGraph.from_edges(tasks, edges)
+
+    assert graph.edges == default.edges
+    for t in tasks[::100]:
+        assert graph.edges_to(t) == default.edges_to(t)
+        assert sorted(graph.upstream_tasks(t), key=tasks.index) == sorted(
+            default.upstream_tasks(t), key=tasks.index
+        )
+    assert graph.stats()["total_bytes"] < default.stats()["total_bytes"]
@@ -9,7 +9,9 @@ from prefect.exceptions import PrefectSignal
 from prefect.core import Edge, Flow, Parameter, Task
 from prefect.engine.flow_runner import FlowRunner
 from prefect.engine.result import Result, NoResult
-from prefect.engine.state import Mapped, Pending, Retrying, Success
+from prefect.engine.state import Mapped, MappedStates, Pending, Retrying, Success
+from prefect.executors import LocalDaskExecutor
+from prefect.utilities.configuration import set_temporary_config
 from prefect.utilities.debug import raise_on_exception
 from prefect.utilities.tasks import task
 from prefect.utilities.edges import unmapped, flatten, mapped
@@ -88,7 +90,7 @@ def test_map_spawns_new_tasks(executor):
     m = s.result[res]
     assert s.is_successful()
     assert m.is_mapped()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.map_states) == 3
     assert all(isinstance(ms, Success) for ms in m.map_states)
     assert m.result == [2, 3, 4]
@@ -108,7 +110,7 @@ def test_map_over_parameters(executor):
     m = s.result[res]
     assert s.is_successful()
     assert m.is_mapped()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert all(s.is_successful() for s in m.map_states)
     assert len(m.map_states) == 3
     assert m.result == [2, 3, 4]
@@ -134,12 +136,12 @@ def test_map_composition(executor):
     assert m1.is_mapped()
     assert m2.is_mapped()
 
-    assert isinstance(m1.map_states, list)
+    assert isinstance(m1.map_states, MappedStates)
     assert all(s.is_successful() for s in m1.map_states)
     assert len(m1.map_states) == 3
     assert m1.result == [2, 3, 4]
 
-    assert isinstance(m2.map_states, list)
+    assert isinstance(m2.map_states, MappedStates)
     assert all(s.is_successful() for s in m2.map_states)
     assert len(m2.map_states) == 3
     assert m2.result == [3, 4, 5]
@@ -161,7 +163,7 @@ def test_deep_map_composition(executor):
     m = s.result[res]
     assert s.is_successful()
     assert m.is_mapped()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.map_states) == 3
     assert m.result == [12, 13, 14]
 
@@ -179,7 +181,7 @@ def test_multiple_map_arguments(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result == [2, 4, 6]
 
@@ -227,7 +229,7 @@ def test_map_failures_dont_leak_out(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_failed()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result[1:] == [1, 0.5]
     assert isinstance(m.result[0], prefect.engine.signals.TRIGGERFAIL)
@@ -253,7 +255,7 @@ def test_map_skips_return_exception_as_result(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result[1:] == [3, 4]
     assert isinstance(m.result[0], BaseException)
@@ -324,7 +326,7 @@ def test_map_skips_dont_leak_out(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result == [None, 4, 5]
     assert m.map_states[0].result is None
@@ -391,7 +393,7 @@ def test_map_can_handle_fixed_kwargs(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result == [6, 7, 8]
 
@@ -408,7 +410,7 @@ def test_map_can_handle_nonkeyed_upstreams(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result == [[1, 2, 3] for _ in range(3)]
 
@@ -427,7 +429,7 @@ def test_map_can_handle_nonkeyed_mapped_upstreams(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result == [[1, 2, 3] for _ in range(3)]
 
@@ -445,7 +447,7 @@ def test_map_can_handle_nonkeyed_nonmapped_upstreams_and_mapped_args(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result == [[1 + i, 2 + i, 3 + i] for i in range(3)]
 
@@ -465,7 +467,7 @@ def test_map_can_handle_nonkeyed_nonmapped_upstreams_and_mapped_args_2(executor)
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.result) == 3
     assert m.result == [[1 + i, 2 + i, 3 + i] for i in range(3)]
 
@@ -562,7 +564,7 @@ def test_map_can_handle_nonkeyed_mapped_upstreams_and_mapped_args(executor):
     s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.map_states) == 3
     assert m.result == [[1 + i, 2 + i, 3 + i] for i in range(3)]
 
@@ -586,7 +588,7 @@ def test_map_behaves_like_zip_with_differing_length_results(executor):
         s = f.run(executor=executor)
     m = s.result[res]
     assert s.is_successful()
-    assert isinstance(m.map_states, list)
+    assert isinstance(m.map_states, MappedStates)
     assert len(m.map_states) == 2
     assert m.result == [0, 2]
 
@@ -1188,3 +1190,175 @@ def test_mapped_retries_regenerate_child_pipelines():
     assert new_state.is_successful()
     assert new_state.result[mapped].is_mapped()
     assert new_state.result[reduced].is_successful()
+
+
+class TestChunkedMapping:
+    def test_map_sets_chunk_size_on_the_copy(self):
+        a = AddTask()
+        with Flow(name="test"):
+            res = a.map([1, 2, 3], chunk_size=2)
+            unchunked = res.map([1, 2, 3])
+
+        assert res.chunk_size == 2
+        assert unchunked.chunk_size is None
+
+    @pytest.mark.parametrize("chunk_size", [0, -1, 1.5, "2"])
+    def test_map_raises_for_invalid_chunk_size(self, chunk_size):
+        with Flow(name="test"):
+            with pytest.raises(ValueError, match="chunk_size"):
+                AddTask().map([1, 2, 3], chunk_size=chunk_size)
+
+    @pytest.mark.parametrize(
+        "executor", ["local", "sync", "mproc", "mthread"], indirect=True
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3, 10])
+    def test_chunked_map_composition(self, executor, chunk_size):
+        a = AddTask()
+
+        with Flow(name="test") as f:
+            r1 = a.map(list(range(7)), chunk_size=chunk_size)
+            r2 = a.map(r1, chunk_size=2)
+            r3 = a.map(r2)
+
+        with raise_on_exception():
+            s = f.run(executor=executor)
+
+        assert s.is_successful()
+        for r, offset in [(r1, 1), (r2, 2), (r3, 3)]:
+            assert s.result[r].is_mapped()
+            assert len(s.result[r].map_states) == 7
+            assert all(ms.is_successful() for ms in s.result[r].map_states)
+            assert s.result[r].result == [x + offset for x in range(7)]
+
+    @pytest.mark.parametrize(
+        "executor", ["local", "sync", "mproc", "mthread"], indirect=True
+    )
+    def test_chunked_map_failures_are_per_element(self, executor):
+        div = DivTask()
+        a = AddTask()
+
+        with Flow(name="test") as f:
+            divved = div.map([1, 0, 2, 4], chunk_size=3)
+            res = a.map(divved, chunk_size=3)
+
+        s = f.run(executor=executor)
+        states = s.result[divved].map_states
+        assert [ms.is_successful() for ms in states] == [True, False, True, True]
+        assert isinstance(states[1].result, ZeroDivisionError)
+        assert s.result[res].map_states[1].is_failed()
+        assert s.result[res].result[2:] == [1.5, 1.25]
+
+    @pytest.mark.parametrize(
+        "executor", ["local", "sync", "mproc", "mthread"], indirect=True
+    )
+    def test_chunked_map_sets_map_index_per_element(self, executor):
+        @task
+        def get_index(x):
+            return prefect.context.map_index
+
+        with Flow(name="test") as f:
+            res = get_index.map(list(range(5)), chunk_size=2)
+
+        s = f.run(executor=executor)
+        assert s.result[res].result == [0, 1, 2, 3, 4]
+
+    @pytest.mark.parametrize(
+        "executor", ["local", "sync", "mproc", "mthread"], indirect=True
+    )
+    def test_reduce_and_flatten_over_chunked_map(self, executor):
+        n = NestTask()
+        ii = IdTask()
+
+        with Flow(name="test") as f:
+            nested = n.map(list(range(5)), chunk_size=2)
+            reduced = ii(nested)
+            flat = ii.map(flatten(nested), chunk_size=4)
+
+        with raise_on_exception():
+            s = f.run(executor=executor)
+
+        assert s.result[reduced].result == [[0], [1], [2], [3], [4]]
+        assert s.result[flat].result == [0, 1, 2, 3, 4]
+
+
+class GenTask(Task):
+    # yields the numbers below n, recording each item as it's produced
+    def __init__(self, **kwargs):
+        self.produced = []
+        super().__init__(checkpoint=False, **kwargs)
+
+    def run(self, n=5):
+        for i in range(n):
+            self.produced.append(i)
+            yield i
+
+
+class TestStreamedMapping:
+    @pytest.mark.parametrize(
+        "executor", ["local", "sync", "threaded_local", "threaded_pool"], indirect=True
+    )
+    @pytest.mark.parametrize("chunk_size", [None, 2])
+    def test_map_over_generator(self, executor, chunk_size):
+        gen = GenTask()
+        a = AddTask()
+
+        with Flow(name="test") as f:
+            res = a.map(gen(n=5), chunk_size=chunk_size)
+            res2 = a.map(res)
+            reduced = IdTask()(res2)
+
+        with raise_on_exception():
+            s = f.run(executor=executor)
+
+        assert s.is_successful()
+        assert s.result[res].is_mapped()
+        assert len(s.result[res].map_states) == 5
+        assert s.result[res].result == [1, 2, 3, 4, 5]
+        assert s.result[res2].result == [2, 3, 4, 5, 6]
+        assert s.result[reduced].result == [2, 3, 4, 5, 6]
+
+    def test_map_over_generator_zips_with_lists(self):
+        gen = GenTask()
+        a = AddTask()
+
+        with Flow(name="test") as f:
+            res = a.map(gen(n=5), [10, 20, 30])
+
+        s = f.run()
+        assert s.result[res].result == [10, 21, 32]
+        # items are only taken from the stream as they are needed (depending on the
+        # order the upstream edges are visited in, one extra item may be taken)
+        assert gen.produced in ([0, 1, 2], [0, 1, 2, 3])
+
+    def test_map_over_empty_generator(self):
+        gen = GenTask()
+        a = AddTask()
+
+        with Flow(name="test") as f:
+            res = a.map(gen(n=0))
+
+        s = f.run()
+        assert s.is_successful()
+        assert s.result[res].is_mapped()
+        assert s.result[res].map_states == []
+
+    @pytest.mark.parametrize("window", [1, 4])
+    def test_children_in_flight_are_bounded_by_stream_window(self, window):
+        gen = GenTask()
+        log = []
+
+        @task
+        def record(x):
+            log.append((x, list(gen.produced)))
+            return x
+
+        with Flow(name="test") as f:
+            res = record.map(gen(n=20))
+
+        with set_temporary_config({"engine.flow_runner.stream_window": window}):
+            s = f.run(executor=LocalDaskExecutor(scheduler="sync"))
+
+        assert s.result[res].result == list(range(20))
+        # when a child runs, the stream has produced at most a window of items ahead
+        for x, produced in log:
+            assert len(produced) <= x + 1 + window
@@ -0,0 +1,86 @@
+import pickle
+import threading
+
+import pytest
+
+import prefect
+from prefect.engine.result import Result
+from prefect.engine.result.writer import ResultWriter
+from prefect.engine.results import LocalResult
+
+
+class SlowResult(Result):
+    def __init__(self, event=None, **kwargs):
+        self.event = event
+        super().__init__(**kwargs)
+
+    def write(self, value_, **kwargs):
+        self.event.wait(5)
+        if value_ == "bad":
+            raise ValueError("bad value")
+        new = self.format(**kwargs)
+        new.value = value_
+        return new
+
+
+def test_writer_returns_the_value_before_it_is_written():
+    event = threading.Event()
+    with ResultWriter(max_workers=1) as writer:
+        result = SlowResult(event=event, location="{x}.txt")
+        pending = writer.write("key", result, 42, kwargs=dict(x="loc"))
+        assert pending.value == 42
+        assert pending.location is None
+
+        event.set()
+        assert writer.wait() == {}
+        assert pending.location == "loc.txt"
+
+
+def test_writer_returns_errors_by_key():
+    event = threading.Event()
+    event.set()
+    with ResultWriter() as writer:
+        writer.write("good", SlowResult(event=event), 1, kwargs={})
+        writer.write("bad", SlowResult(event=event), "bad", kwargs={})
+        errors = writer.wait()
+    assert list(errors) == ["bad"]
+    assert isinstance(errors["bad"], ValueError)
+
+
+def test_writer_ignores_results_which_cant_be_written():
+    with ResultWriter() as writer:
+        pending = writer.write("key", Result(), 1, kwargs={})
+        assert writer.wait() == {}
+    assert pending.value == 1
+    assert pending.location is None
+
+
+def test_writer_writes_in_the_given_context():
+    locations = []
+
+    class ContextResult(Result):
+        def write(self, value_, **kwargs):
+            locations.append(prefect.context.get("foo"))
+            return self.format(**kwargs)
+
+    with ResultWriter() as writer:
+        writer.write("key", ContextResult(), 1, kwargs={}, context=dict(foo="bar"))
+        writer.wait()
+    assert locations == ["bar"]
+
+
+def test_writer_writes_local_results(tmpdir):
+    with ResultWriter() as writer:
+        pending = writer.write(
+            "key", LocalResult(dir=str(tmpdir), location="{x}.prefect"), 99, dict(x=1)
+        )
+        writer.wait()
+    assert pending.location == str(tmpdir.join("1.prefect"))
+    assert LocalResult(dir=str(tmpdir)).read(pending.location).value == 99
+
+
+def test_writer_unpickles_as_itself_only_while_open():
+    writer = ResultWriter()
+    with writer:
+        assert pickle.loads(pickle.dumps(writer)) is writer
+    assert pickle.loads(pickle.dumps(writer)) is None
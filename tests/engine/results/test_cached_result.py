@@ -0,0 +1,171 @@
+import os
+import tempfile
+
+import cloudpickle
+import pytest
+
+from prefect.engine.result import Result
+from prefect.engine.results import CachedResult, LocalResult
+
+
+class CountingResult(Result):
+    """An in-memory result which counts its reads"""
+
+    def __init__(self, **kwargs):
+        self.store = {}
+        self.reads = 0
+        super().__init__(**kwargs)
+
+    def read(self, location):
+        self.reads += 1
+        new = self.copy()
+        new.location = location
+        new.value = self.store[location]
+        return new
+
+    def write(self, value_, **kwargs):
+        new = self.format(**kwargs)
+        new.value = value_
+        self.store[new.location] = value_
+        return new
+
+    def exists(self, location, **kwargs):
+        return location.format(**kwargs) in self.store
+
+
+def size_of_one(value):
+    return 1
+
+
+def total_size(*values):
+    from dask.sizeof import sizeof
+
+    return sum(sizeof(v) for v in values)
+
+
+class TestCachedResult:
+    def test_cached_result_validates_sizes(self):
+        with pytest.raises(ValueError, match="non-negative"):
+            CachedResult(CountingResult(), max_size=-1)
+        with pytest.raises(ValueError, match="requires a `spill_dir`"):
+            CachedResult(CountingResult(), spill_max_size=100)
+
+    def test_cached_result_uses_wrapped_location_and_serializer(self):
+        inner = CountingResult(location="{x}.txt")
+        result = CachedResult(inner)
+        assert result.location == "{x}.txt"
+        assert result.serializer is inner.serializer
+        assert result.format(x=1).location == "1.txt"
+
+    def test_reads_are_cached_by_location(self):
+        inner = CountingResult()
+        inner.store.update(a=1, b=2)
+        result = CachedResult(inner)
+
+        assert result.read("a").value == 1
+        assert result.read("a").value == 1
+        new = result.read("b")
+        assert new.value == 2
+        assert new.location == "b"
+
+        assert inner.reads == 2
+        assert result.stats == dict(
+            hits=1, disk_hits=0, misses=2, size=total_size(1, 2)
+        )
+
+    def test_writes_go_through_and_are_cached(self):
+        inner = CountingResult(location="{x}.txt")
+        result = CachedResult(inner)
+
+        new = result.write("value", x=1)
+        assert new.location == "1.txt"
+        assert inner.store == {"1.txt": "value"}
+        assert result.exists("{x}.txt", x=1)
+
+        assert new.read("1.txt").value == "value"
+        assert inner.reads == 0
+        assert result.stats["hits"] == 1
+
+    def test_copies_share_the_cache(self):
+        inner = CountingResult()
+        inner.store.update(a=1)
+        result = CachedResult(inner)
+        result.copy().read("a")
+        result.format().read("a")
+        assert inner.reads == 1
+
+    def test_cache_is_not_pickled(self):
+        inner = CountingResult()
+        inner.store.update(a=1)
+        result = CachedResult(inner)
+        result.read("a")
+
+        unpickled = cloudpickle.loads(cloudpickle.dumps(result))
+        unpickled.clear()
+        assert unpickled.read("a").value == 1
+        assert unpickled.stats["misses"] == 1
+
+    def test_least_recently_used_values_are_evicted(self):
+        inner = CountingResult()
+        inner.store.update(a=1, b=2, c=3)
+        result = CachedResult(inner, max_size=2, sizeof=size_of_one)
+
+        result.read("a")
+        result.read("b")
+        result.read("a")
+        result.read("c")
+        assert result.stats["size"] == 2
+
+        # "b" was evicted
+        reads = inner.reads
+        result.read("a")
+        result.read("c")
+        assert inner.reads == reads
+        result.read("b")
+        assert inner.reads == reads + 1
+
+    def test_values_larger_than_the_cache_are_not_kept(self):
+        inner = CountingResult()
+        inner.store.update(a=1)
+        result = CachedResult(inner, max_size=0, sizeof=size_of_one)
+        result.read("a")
+        result.read("a")
+        assert inner.reads == 2
+        assert result.stats["size"] == 0
+
+    def test_evicted_values_are_spilled_to_disk(self):
+        inner = CountingResult()
+        inner.store.update(a=1, b=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            result = CachedResult(inner, max_size=1, sizeof=size_of_one, spill_dir=tmp)
+            result.read("a")
+            result.read("b")
+            assert len([f for f in os.listdir(tmp) if f.endswith("_result")]) == 1
+
+            assert result.read("a").value == 1
+            assert inner.reads == 2
+            assert result.stats == dict(hits=0, disk_hits=1, misses=2, size=1)
+
+    def test_values_evicted_from_disk_are_read_again(self):
+        inner = CountingResult()
+        inner.store.update(a=1, b=2)
+        with tempfile.TemporaryDirectory() as tmp:
+            result = CachedResult(inner, max_size=1, sizeof=size_of_one, spill_dir=tmp)
+            result.read("a")
+            result.read("b")
+            for fname in os.listdir(tmp):
+                os.remove(os.path.join(tmp, fname))
+
+            assert result.read("a").value == 1
+            assert inner.reads == 3
+
+    def test_wraps_local_results(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = CachedResult(LocalResult(dir=tmp, location="{x}.txt"))
+            location = result.write([1, 2], x="one").location
+            assert location == os.path.join(tmp, "one.txt")
+
+            fresh = CachedResult(LocalResult(dir=tmp))
+            assert fresh.read(location).value == [1, 2]
+            assert fresh.read(location).value == [1, 2]
+            assert fresh.stats["hits"] == 1
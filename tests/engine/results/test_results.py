@@ -1,5 +1,7 @@
+import mmap
 import os
 import json
+import pickle
 import sys
 import tempfile
 from typing import Union
@@ -17,8 +19,10 @@ from prefect.engine.results import (
 )
 from prefect.engine.serializers import (
     JSONSerializer,
+    OutOfBandPickleSerializer,
     PickleSerializer,
     DateTimeSerializer,
+    Serializer,
 )
 from prefect.tasks.core.constants import Constant
 from prefect.tasks.secrets import PrefectSecret
@@ -238,6 +242,129 @@ class TestLocalResult:
         assert result.exists("44.txt") is True
         assert result.exists(os.path.join(tmp_dir, "44.txt")) is True
 
+    @pytest.mark.skipif(
+        sys.version_info < (3, 8), reason="Pickle protocol 5 requires Python 3.8+"
+    )
+    def test_local_result_reads_zero_copy_values_from_a_memory_map(self, tmp_dir):
+        class Blob:
+            def __init__(self, data):
+                self.data = data
+
+            def __reduce_ex__(self, protocol):
+                return (Blob, (pickle.PickleBuffer(self.data),))
+
+        result = LocalResult(
+            dir=tmp_dir, location="mapped.bin", serializer=OutOfBandPickleSerializer()
+        )
+        location = result.write(Blob(bytearray(b"x" * 100_000))).location
+        blob = result.read(location).value
+        assert isinstance(blob.data.obj, mmap.mmap)
+        assert blob.data == b"x" * 100_000
+
+        # the memory map is private to the value, and the file is left unchanged
+        blob.data[:1] = b"y"
+        assert result.read(location).value.data[:1] == b"x"
+
+    def test_local_result_reads_empty_files(self, tmp_dir):
+        with open(os.path.join(tmp_dir, "empty.bin"), "wb"):
+            pass
+        result = LocalResult(dir=tmp_dir, serializer=OutOfBandPickleSerializer())
+        with pytest.raises(EOFError):
+            result.read("empty.bin")
+
+    def test_local_result_failed_writes_leave_no_file(self, tmp_dir):
+        class BrokenSerializer(Serializer):
+            def write_to(self, value, file):
+                file.write(b"partial")
+                raise ValueError("boom")
+
+        result = LocalResult(
+            dir=tmp_dir, location="broken.bin", serializer=BrokenSerializer()
+        )
+        with pytest.raises(ValueError, match="boom"):
+            result.write(1)
+        assert not result.exists("broken.bin")
+        assert not [f for f in os.listdir(tmp_dir) if f.startswith("broken.bin")]
+
+    def test_local_result_max_size_requires_content_addressing(self, tmp_dir):
+        with pytest.raises(ValueError, match="only applies to content-addressed"):
+            LocalResult(dir=tmp_dir, max_size=100)
+
+    def test_content_addressed_results_store_identical_values_once(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = LocalResult(dir=tmp, content_addressed=True)
+            first = result.write({"a": 1})
+            second = result.write({"a": 1})
+            third = result.write({"a": 2})
+
+            assert first.location == second.location != third.location
+            assert os.path.basename(first.location).endswith(".prefect_result")
+            assert result.read(first.location).value == {"a": 1}
+            assert result.read(third.location).value == {"a": 2}
+            assert sorted(
+                f for f in os.listdir(tmp) if f.endswith("_result")
+            ) == sorted(os.path.basename(r.location) for r in (first, third))
+
+    def test_content_addressed_results_ignore_location_templates(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = LocalResult(dir=tmp, location="{x}.txt", content_addressed=True)
+            new = result.write("value", x=1)
+            assert (
+                new.location
+                == LocalResult(dir=tmp, content_addressed=True).write("value").location
+            )
+
+    def test_content_addressed_results_record_access_times(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = LocalResult(dir=tmp, content_addressed=True)
+            location = result.write("value").location
+            with open(os.path.join(tmp, ".prefect-result-index.json")) as f:
+                written = json.load(f)[os.path.basename(location)]
+
+            result.read(location)
+            with open(os.path.join(tmp, ".prefect-result-index.json")) as f:
+                assert json.load(f)[os.path.basename(location)] >= written
+
+    def test_content_addressed_results_evict_least_recently_used(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(
+            "prefect.engine.results.local_result.time.time", lambda: now[0]
+        )
+
+        with tempfile.TemporaryDirectory() as tmp:
+            result = LocalResult(dir=tmp, content_addressed=True, max_size=2500)
+            locations = []
+            for value in (b"a" * 1000, b"b" * 1000):
+                locations.append(result.write(value).location)
+                now[0] += 1
+
+            # reading the first result makes the second the least recently used
+            result.read(locations[0])
+            now[0] += 1
+            locations.append(result.write(b"c" * 1000).location)
+
+            assert [os.path.exists(loc) for loc in locations] == [True, False, True]
+            with open(os.path.join(tmp, ".prefect-result-index.json")) as f:
+                assert set(json.load(f)) == {
+                    os.path.basename(locations[0]),
+                    os.path.basename(locations[2]),
+                }
+
+    def test_content_addressed_results_keep_the_newest_result(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = LocalResult(dir=tmp, content_addressed=True, max_size=10)
+            first = result.write(b"a" * 100).location
+            second = result.write(b"b" * 100).location
+            assert not os.path.exists(first)
+            assert result.read(second).value == b"b" * 100
+
+    def test_content_addressed_results_leave_other_results_alone(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            LocalResult(dir=tmp, location="named.txt").write(b"a" * 100)
+            result = LocalResult(dir=tmp, content_addressed=True, max_size=10)
+            result.write(b"b" * 100)
+            assert os.path.exists(os.path.join(tmp, "named.txt"))
+
     @pytest.mark.skipif(sys.platform != "win32", reason="Windows specific test")
     def test_local_init_with_different_drive_works_on_windows(self):
         result = LocalResult(dir="E:/location", validate_dir=False)
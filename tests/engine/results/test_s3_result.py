@@ -1,3 +1,4 @@
+import io
 from unittest.mock import MagicMock
 
 import cloudpickle
@@ -13,9 +14,11 @@ pytest.importorskip("botocore")
 
 @pytest.fixture
 def mock_boto3(monkeypatch):
+    from prefect.engine.results.s3_result import _CLIENT_POOL
     from prefect.utilities.aws import _CLIENT_CACHE
 
     _CLIENT_CACHE.clear()
+    _CLIENT_POOL.clear()
 
     boto3 = MagicMock()
     monkeypatch.setattr("prefect.utilities.aws.boto3", boto3)
@@ -62,11 +65,108 @@ class TestS3Result:
         with prefect.context(thing="yes!"):
             new_result = result.write("so-much-data", **prefect.context)
 
-        used_uri = mock_boto3.client.return_value.upload_fileobj.call_args[1]["Key"]
+        used_uri = mock_boto3.client.return_value.put_object.call_args[1]["Key"]
 
         assert used_uri == new_result.location
         assert new_result.location.startswith("yes!/here.txt")
 
+    def test_s3_result_validates_transfer_options(self, mock_boto3):
+        with pytest.raises(ValueError, match="at least 5 MiB"):
+            S3Result(bucket="bob", part_size=2**20)
+        with pytest.raises(ValueError, match="at least 1"):
+            S3Result(bucket="bob", max_concurrency=0)
+
+    def test_s3_writes_small_values_in_one_request(self, mock_boto3):
+        result = S3Result(bucket="bob", location="small")
+        result.write("value")
+
+        client = mock_boto3.client.return_value
+        assert client.create_multipart_upload.called is False
+        body = client.put_object.call_args[1]["Body"]
+        assert cloudpickle.loads(body) == "value"
+
+    def test_s3_writes_large_values_in_parts(self, mock_boto3):
+        client = mock_boto3.client.return_value
+        client.create_multipart_upload.return_value = {"UploadId": "upload"}
+        client.upload_part.side_effect = lambda **kwargs: {
+            "ETag": "etag-{}".format(kwargs["PartNumber"])
+        }
+
+        part_size = 5 * 2**20
+        value = b"x" * (2 * part_size + 10)
+        result = S3Result(bucket="bob", location="large", part_size=part_size)
+        result.write(value)
+
+        calls = sorted(
+            (c[1] for c in client.upload_part.call_args_list),
+            key=lambda kwargs: kwargs["PartNumber"],
+        )
+        assert [len(c["Body"]) for c in calls[:2]] == [part_size, part_size]
+        assert cloudpickle.loads(b"".join(c["Body"] for c in calls)) == value
+        assert client.complete_multipart_upload.call_args[1] == dict(
+            Bucket="bob",
+            Key="large",
+            UploadId="upload",
+            MultipartUpload={
+                "Parts": [
+                    dict(ETag="etag-{}".format(i), PartNumber=i) for i in (1, 2, 3)
+                ]
+            },
+        )
+        assert client.put_object.called is False
+
+    def test_s3_aborts_failed_uploads(self, mock_boto3):
+        client = mock_boto3.client.return_value
+        client.create_multipart_upload.return_value = {"UploadId": "upload"}
+        client.upload_part.side_effect = ValueError("boom")
+
+        result = S3Result(bucket="bob", location="large", part_size=5 * 2**20)
+        with pytest.raises(ValueError, match="boom"):
+            result.write(b"x" * 11 * 2**20)
+
+        assert client.abort_multipart_upload.call_args[1] == dict(
+            Bucket="bob", Key="large", UploadId="upload"
+        )
+        assert client.complete_multipart_upload.called is False
+
+    def test_s3_reads_values_in_ranges(self, mock_boto3):
+        data = cloudpickle.dumps(b"x" * 12 * 2**20)
+
+        def get_object(Bucket, Key, Range):
+            start, end = Range[len("bytes=") :].split("-")
+            return {"Body": io.BytesIO(data[int(start) : int(end) + 1])}
+
+        client = mock_boto3.client.return_value
+        client.head_object.return_value = {"ContentLength": len(data)}
+        client.get_object.side_effect = get_object
+
+        result = S3Result(bucket="bob", part_size=5 * 2**20)
+        assert result.read("stuff").value == b"x" * 12 * 2**20
+        assert sorted(c[1]["Range"] for c in client.get_object.call_args_list) == [
+            "bytes=0-5242879",
+            "bytes=10485760-{}".format(len(data) - 1),
+            "bytes=5242880-10485759",
+        ]
+
+    def test_s3_reads_empty_values_as_none(self, mock_boto3):
+        client = mock_boto3.client.return_value
+        client.head_object.return_value = {"ContentLength": 0}
+
+        result = S3Result(bucket="bob")
+        assert result.read("stuff").value is None
+        assert client.get_object.called is False
+
+    def test_s3_results_share_clients(self, mock_boto3):
+        mock_boto3.client.side_effect = lambda *args, **kwargs: MagicMock()
+
+        result = S3Result(bucket="bob")
+        other = cloudpickle.loads(cloudpickle.dumps(S3Result(bucket="alice")))
+        assert result.client is other.client
+        assert mock_boto3.client.call_count == 1
+
+        regional = S3Result(bucket="bob", boto3_kwargs={"region_name": "a-region"})
+        assert regional.client is not result.client
+
     def test_s3_result_is_pickleable(self, mock_boto3):
         class NoPickle:
             def __getstate__(self):
@@ -80,6 +180,31 @@ class TestS3Result:
         res = cloudpickle.loads(cloudpickle.dumps(result))
         assert isinstance(res, S3Result)
 
+    def test_s3_result_reads_ranges_for_random_access_serializers(self, mock_boto3):
+        data = bytes(range(100))
+
+        class RangeSerializer(prefect.engine.serializers.Serializer):
+            random_access = True
+
+            def deserialize_from(self, file):
+                file.seek(-10, 2)
+                return file.read(4)
+
+        def get_object(Bucket, Key, Range):
+            start, end = Range[len("bytes=") :].split("-")
+            return {"Body": io.BytesIO(data[int(start) : int(end) + 1])}
+
+        client = mock_boto3.client.return_value
+        client.head_object.return_value = {"ContentLength": len(data)}
+        client.get_object.side_effect = get_object
+
+        result = S3Result(bucket="bob", serializer=RangeSerializer())
+        assert result.read("stuff").value == data[90:94]
+        assert client.download_fileobj.called is False
+        assert client.get_object.call_args[1] == dict(
+            Bucket="bob", Key="stuff", Range="bytes=90-93"
+        )
+
     def test_s3_result_does_not_exist(self, mock_boto3):
         import botocore
 
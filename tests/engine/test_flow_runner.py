@@ -1,9 +1,12 @@
 import collections
 import datetime
+import gc
 import logging
 import queue
 import random
+import threading
 import time
+import weakref
 from contextlib import contextmanager
 from unittest.mock import MagicMock
 
@@ -14,9 +17,15 @@ import prefect
 from prefect.core import Flow, Parameter, Task
 from prefect.engine import signals
 from prefect.engine.cache_validators import duration_only
-from prefect.executors import Executor, LocalExecutor
-from prefect.engine.flow_runner import ENDRUN, FlowRunner, FlowRunnerInitializeResult
-from prefect.engine.result import Result
+from prefect.executors import DaskExecutor, Executor, LocalDaskExecutor, LocalExecutor
+from prefect.engine.flow_runner import (
+    ENDRUN,
+    FlowRunner,
+    FlowRunnerInitializeResult,
+    release_result,
+)
+from prefect.utilities.executors import release_results
+from prefect.engine.result import NoResult, Result
 from prefect.engine.state import (
     Cached,
     Failed,
@@ -36,6 +45,7 @@ from prefect.engine.state import (
 )
 from prefect.tasks.secrets import PrefectSecret
 from prefect.triggers import manual_only
+from prefect.utilities.configuration import set_temporary_config
 from prefect.utilities.debug import raise_on_exception
 from prefect.exceptions import TaskTimeoutSignal
 
@@ -746,6 +756,327 @@ def test_flow_runner_uses_user_provided_executor():
             FlowRunner(flow=f).run(executor=Executor())
 
 
+class TestReadyQueueScheduling:
+    def test_scheduling_defaults_to_config(self):
+        assert FlowRunner(flow=Flow(name="test")).scheduling == "sorted"
+        with set_temporary_config({"engine.flow_runner.scheduling": "ready_queue"}):
+            assert FlowRunner(flow=Flow(name="test")).scheduling == "ready_queue"
+
+    def test_unknown_scheduling_raises(self):
+        with pytest.raises(ValueError, match="Unknown scheduling mode"):
+            FlowRunner(flow=Flow(name="test"), scheduling="random")
+
+    @pytest.mark.parametrize(
+        "executor",
+        ["local", "sync", "threaded_local", "mthread", "threaded_pool"],
+        indirect=True,
+    )
+    def test_ready_queue_runs_mapped_and_reduce_tasks(self, executor):
+        @prefect.task
+        def numbers():
+            return [1, 2, 3]
+
+        @prefect.task
+        def nested():
+            return [[1, 2], [3]]
+
+        @prefect.task
+        def inc(x):
+            return x + 1
+
+        @prefect.task
+        def pair(x):
+            return [x, x]
+
+        @prefect.task
+        def total(xs):
+            return sum(xs)
+
+        with Flow(name="test") as flow:
+            a = inc.map(inc.map(numbers()))
+            b = AddTask()(x=1, y=SuccessTask()())
+            c = inc.map(prefect.flatten(nested()))
+            d = inc.map(prefect.flatten(pair.map(numbers())))
+            e = total(inc.map(numbers()))
+            f = total(prefect.flatten(pair.map(numbers())))
+
+        state = FlowRunner(flow=flow, scheduling="ready_queue").run(
+            executor=executor, return_tasks=[a, b, c, d, e, f]
+        )
+        assert state.is_successful()
+        assert state.result[a].result == [3, 4, 5]
+        assert state.result[b].result == 2
+        assert state.result[c].result == [2, 3, 4]
+        assert state.result[d].result == [2, 2, 3, 3, 4, 4]
+        assert state.result[e].result == 9
+        assert state.result[f].result == 12
+
+    def test_ready_queue_submits_independent_tasks_before_waiting(self):
+        calls = []
+
+        class RecordingExecutor(LocalExecutor):
+            def submit(self, fn, *args, extra_context=None, **kwargs):
+                calls.append(extra_context["task_name"])
+                return super().submit(fn, *args, extra_context=extra_context, **kwargs)
+
+            def wait_any(self, futures):
+                calls.append("wait")
+                return super().wait_any(futures)
+
+        @prefect.task
+        def numbers():
+            return [1, 2, 3]
+
+        @prefect.task
+        def inc(x):
+            return x + 1
+
+        @prefect.task
+        def independent():
+            return 1
+
+        with Flow(name="test") as flow:
+            inc.map(numbers())
+            independent()
+
+        state = FlowRunner(flow=flow, scheduling="ready_queue").run(
+            executor=RecordingExecutor()
+        )
+        assert state.is_successful()
+        assert calls[:3] == ["numbers", "independent", "wait"]
+        assert calls.count("inc") == 4
+
+
+class TestReleaseResults:
+    def test_intermediate_results_are_released_once_consumed(self):
+        class Data:
+            pass
+
+        refs = []
+
+        @prefect.task
+        def produce():
+            data = Data()
+            refs.append(weakref.ref(data))
+            return data
+
+        @prefect.task
+        def consume(data):
+            return 1
+
+        @prefect.task
+        def check(x):
+            gc.collect()
+            return refs[0]() is None
+
+        with Flow(name="test") as flow:
+            result = check(consume(produce()))
+
+        state = FlowRunner(flow=flow).run(return_tasks=[result])
+        assert state.is_successful()
+        assert state.result[result].result is True
+
+    def test_return_and_reference_task_results_are_kept(self):
+        with Flow(name="test") as flow:
+            a = SuccessTask()
+            b = AddTask()(x=a, y=1)
+            c = AddTask()(x=b, y=1)
+        flow.set_reference_tasks([b])
+
+        state = FlowRunner(flow=flow).run(return_tasks=[a, b, c])
+        assert state.is_successful()
+        assert state.result[a].result == 1
+        assert state.result[b].result == 2
+        assert state.result[c].result == 3
+
+    def test_release_result_keeps_persisted_location(self):
+        state = Success(result=Result(value=1, location="/path/to/result"))
+        released = release_result(state)
+        assert released.is_successful()
+        assert released._result.location == "/path/to/result"
+        assert released.result is None
+        assert state.result == 1
+
+    def test_release_result_without_location(self):
+        released = release_result(Success(result=1))
+        assert released._result is NoResult
+
+    def test_release_results_releases_lists_of_states(self):
+        released = release_results([Success(result=1), [Failed(result=2)], 3])
+        assert released[0]._result is NoResult
+        assert released[1][0].is_failed() and released[1][0]._result is NoResult
+        assert released[2] == 3
+
+    @pytest.mark.parametrize("max_mapped_in_flight", [None, 2])
+    def test_dask_results_on_workers(self, mthread, max_mapped_in_flight):
+        @prefect.task
+        def fail(x):
+            if x:
+                raise ValueError("boom")
+
+        with Flow(name="test") as flow:
+            a = AddTask().map(x=list(range(6)), y=prefect.unmapped(1))
+            b = AddTask().map(x=a, y=a)
+            c = AddTask()(x=b[0], y=b[1])
+            fail(c)
+
+        executor = DaskExecutor(
+            mthread.address,
+            max_mapped_in_flight=max_mapped_in_flight,
+            results_on_workers=True,
+        )
+        state = FlowRunner(flow=flow).run(executor=executor, return_tasks=[b, c])
+
+        # the failed terminal task fails the flow without its result being gathered
+        assert state.is_failed()
+        assert state.result[b].result == [2 * (i + 1) for i in range(6)]
+        assert state.result[c].result == 6
+
+
+class ConcurrencyTracker:
+    # records the peak number of concurrently running calls of `run`
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    @classmethod
+    def run(cls, x):
+        with cls.lock:
+            cls.running += 1
+            cls.peak = max(cls.peak, cls.running)
+        time.sleep(0.005)
+        with cls.lock:
+            cls.running -= 1
+        return x
+
+
+@prefect.task
+def tracked(x):
+    return ConcurrencyTracker.run(x)
+
+
+class TestMaxMappedInFlight:
+    @pytest.fixture(autouse=True)
+    def reset_tracker(self):
+        ConcurrencyTracker.peak = 0
+
+    @pytest.mark.parametrize(
+        "executor_cls,kwargs",
+        [
+            (LocalDaskExecutor, dict(num_workers=4)),
+            (
+                DaskExecutor,
+                dict(
+                    cluster_kwargs=dict(
+                        processes=False, n_workers=1, threads_per_worker=4
+                    )
+                ),
+            ),
+        ],
+    )
+    def test_executor_limits_children_in_flight(self, executor_cls, kwargs):
+        with Flow(name="test") as flow:
+            res = tracked.map(list(range(30)))
+
+        executor = executor_cls(max_mapped_in_flight=2, **kwargs)
+        state = FlowRunner(flow=flow).run(executor=executor, return_tasks=[res])
+
+        assert state.is_successful()
+        assert state.result[res].result == list(range(30))
+        assert ConcurrencyTracker.peak <= 2
+        assert executor.mapped_metrics == {
+            flow.slugs[res]: dict(queued=0, running=0, completed=30)
+        }
+
+    @pytest.mark.parametrize("chunk_size", [None, 2])
+    def test_task_limit_overrides_executor(self, chunk_size):
+        with Flow(name="test") as flow:
+            res = tracked.map(
+                list(range(20)), max_mapped_in_flight=1, chunk_size=chunk_size
+            )
+
+        executor = LocalDaskExecutor(max_mapped_in_flight=10, num_workers=4)
+        state = FlowRunner(flow=flow).run(executor=executor, return_tasks=[res])
+
+        assert state.result[res].result == list(range(20))
+        assert ConcurrencyTracker.peak == 1
+
+    def test_metrics_track_children_as_they_are_submitted(self):
+        metrics = []
+
+        @prefect.task
+        def record(x):
+            metrics.append(dict(executor.mapped_metrics[flow.slugs[res]]))
+            return x
+
+        with Flow(name="test") as flow:
+            res = record.map(list(range(4)))
+
+        executor = LocalExecutor()
+        FlowRunner(flow=flow).run(executor=executor)
+
+        # without a limit, all children are submitted at once, and the local
+        # executor runs each child as soon as it's submitted
+        assert metrics == [dict(queued=0, running=4, completed=0)] * 4
+        assert executor.mapped_metrics[flow.slugs[res]] == dict(
+            queued=0, running=0, completed=4
+        )
+
+    @pytest.mark.parametrize(
+        "map_kwargs,sizes",
+        [
+            (dict(), [5]),
+            (dict(max_mapped_in_flight=2), [2, 2, 1]),
+            (dict(chunk_size=2), [3]),
+        ],
+    )
+    def test_children_are_submitted_together(self, map_kwargs, sizes):
+        class RecordingExecutor(LocalExecutor):
+            def submit_many(self, fn, kwargs_list, extra_contexts=None, **kwargs):
+                submissions.append(len(kwargs_list))
+                return super().submit_many(fn, kwargs_list, extra_contexts, **kwargs)
+
+        submissions = []
+        with Flow(name="test") as flow:
+            res = AddTask().map(x=list(range(5)), y=prefect.unmapped(1), **map_kwargs)
+
+        state = FlowRunner(flow=flow).run(
+            executor=RecordingExecutor(), return_tasks=[res]
+        )
+        assert state.result[res].result == [1, 2, 3, 4, 5]
+        assert submissions == sizes
+
+    def test_metrics_track_children_submitted_in_windows(self):
+        metrics = []
+
+        @prefect.task
+        def record(x):
+            metrics.append(dict(executor.mapped_metrics[flow.slugs[res]]))
+            return x
+
+        with Flow(name="test") as flow:
+            res = record.map(list(range(4)), max_mapped_in_flight=1)
+
+        executor = LocalExecutor()
+        FlowRunner(flow=flow).run(executor=executor)
+
+        assert metrics == [dict(queued=3 - i, running=1, completed=i) for i in range(4)]
+        assert executor.mapped_metrics[flow.slugs[res]] == dict(
+            queued=0, running=0, completed=4
+        )
+
+    @pytest.mark.parametrize("cls", [LocalDaskExecutor, DaskExecutor])
+    @pytest.mark.parametrize("value", [0, -1, 1.5])
+    def test_invalid_max_mapped_in_flight_raises(self, cls, value):
+        with pytest.raises(ValueError, match="max_mapped_in_flight"):
+            cls(max_mapped_in_flight=value)
+
+    def test_invalid_task_max_mapped_in_flight_raises(self):
+        with Flow(name="test"):
+            with pytest.raises(ValueError, match="max_mapped_in_flight"):
+                tracked.map([1, 2], max_mapped_in_flight=0)
+
+
 @pytest.mark.parametrize("executor", ["mproc", "mthread"], indirect=True)
 def test_flow_runner_captures_and_exposes_dask_errors(executor):
     q = queue.Queue()
@@ -834,7 +1165,17 @@ def test_flow_runner_properly_provides_context_to_task_runners(executor):
 
 
 @pytest.mark.parametrize(
-    "executor", ["local", "mthread", "sync", "mproc", "threaded_local"], indirect=True
+    "executor",
+    [
+        "local",
+        "mthread",
+        "sync",
+        "mproc",
+        "threaded_local",
+        "threaded_pool",
+        "mproc_pool",
+    ],
+    indirect=True,
 )
 def test_flow_runner_handles_timeouts(executor):
     sleeper = SlowTask(timeout=1)
@@ -1239,6 +1580,45 @@ class TestContext:
         assert flow_state.is_successful()
         assert flow_state.result[grab_key].result == 42
 
+    @pytest.mark.parametrize("executor", ["local", "sync", "mproc"], indirect=True)
+    def test_task_contexts_override_the_shared_run_context(self, executor):
+        @prefect.task(name="whoami")
+        def whoami(x=None):
+            ctx = prefect.context
+            return ctx.task_name, ctx.flow_name, ctx.THE_ANSWER, ctx.map_index
+
+        with Flow(name="layers") as flow:
+            plain = whoami()
+            mapped = whoami.map([1, 2])
+
+        with prefect.context(THE_ANSWER=42, task_name="not-a-task"):
+            flow_state = flow.run(executor=executor)
+
+        assert flow_state.is_successful()
+        assert flow_state.result[plain].result == ("whoami", "layers", 42, None)
+        assert flow_state.result[mapped].result == [
+            ("whoami", "layers", 42, 0),
+            ("whoami", "layers", 42, 1),
+        ]
+
+    def test_tasks_in_a_thread_share_the_flow_runs_merged_config(self):
+        @prefect.task
+        def grab_config():
+            return prefect.context.config
+
+        with Flow(name="test") as flow:
+            a = grab_config()
+            b = grab_config(upstream_tasks=[a])
+
+        executor = LocalDaskExecutor(scheduler="threads", num_workers=1)
+        flow_state = flow.run(
+            executor=executor, context=dict(config=dict(THE_ANSWER=42))
+        )
+
+        assert flow_state.is_successful()
+        assert flow_state.result[a].result.THE_ANSWER == 42
+        assert flow_state.result[a].result is flow_state.result[b].result
+
     def test_flow_runner_provides_scheduled_start_time(self):
         @prefect.task
         def return_scheduled_start_time():
@@ -1505,3 +1885,143 @@ def test_dask_executor_with_flow_runner_sets_task_keys(mthread):
     flow.run(executor=MyExecutor())
 
     assert key_names == {"inc", "do_sum"}
+
+
+class TestWriteBehindCheckpointing:
+    @pytest.fixture(autouse=True)
+    def write_behind(self):
+        with set_temporary_config({"flows.checkpoint_write_behind": True}):
+            yield
+
+    def test_results_are_written_before_the_flow_run_finishes(self, tmpdir):
+        from prefect.engine.results import LocalResult
+
+        with Flow("test", result=LocalResult(dir=str(tmpdir))) as flow:
+            x = AddTask(checkpoint=True)(1, 2)
+            y = AddTask(checkpoint=True)(x, 3)
+
+        with prefect.context(checkpointing=True):
+            state = FlowRunner(flow=flow).run(return_tasks=[x, y])
+
+        assert state.is_successful()
+        assert state.result[y].result == 6
+        for task in [x, y]:
+            result = state.result[task]._result
+            assert result.location is not None
+            assert LocalResult().read(result.location).value == result.value
+
+    def test_failed_writes_fail_the_task_and_the_flow_run(self):
+        class BadResult(Result):
+            def write(self, value_, **kwargs):
+                raise OSError("disk full")
+
+        with Flow("test") as flow:
+            x = AddTask(checkpoint=True, result=BadResult())(1, 2)
+            y = AddTask(checkpoint=True)(x, 3)
+
+        with prefect.context(checkpointing=True):
+            state = FlowRunner(flow=flow).run(return_tasks=[x, y])
+
+        assert state.is_failed()
+        assert state.result[x].is_failed()
+        assert "disk full" in state.result[x].message
+        assert state.result[y].is_successful()
+        assert state.result[y].result == 6
+
+    def test_failed_writes_of_mapped_children_fail_the_child(self):
+        class BadResult(Result):
+            def write(self, value_, **kwargs):
+                if value_ == 3:
+                    raise OSError("disk full")
+                return self.format(**kwargs)
+
+        with Flow("test") as flow:
+            x = AddTask(checkpoint=True, result=BadResult()).map([1, 2, 3], [0, 0, 0])
+
+        with prefect.context(checkpointing=True):
+            state = FlowRunner(flow=flow).run(return_tasks=[x])
+
+        assert state.is_failed()
+        children = state.result[x].map_states
+        assert [c.is_successful() for c in children] == [True, True, False]
+
+
+@prefect.task(tags=["db"])
+def record_run_interval(x):
+    start = time.time()
+    time.sleep(0.2)
+    return (start, time.time())
+
+
+def max_overlap(intervals):
+    events = sorted(
+        [(end, -1) for _, end in intervals] + [(s, 1) for s, _ in intervals]
+    )
+    running = most = 0
+    for _, change in events:
+        running += change
+        most = max(most, running)
+    return most
+
+
+class TestTaskTagLimits:
+    @pytest.mark.parametrize(
+        "executor",
+        [
+            "threaded_local",
+            "mproc_local",
+            "threaded_pool",
+            "mproc_pool",
+            "mthread",
+            "mproc",
+        ],
+        indirect=True,
+    )
+    def test_limits_concurrent_runs_of_tasks_with_a_tag(self, executor):
+        with Flow("test") as flow:
+            res = record_run_interval.map(list(range(6)))
+
+        state = FlowRunner(flow=flow).run(
+            return_tasks=[res],
+            executor=executor,
+            context={"task_tag_limits": {"db": 2}},
+        )
+        assert state.is_successful()
+        assert max_overlap(state.result[res].result) <= 2
+
+        metrics = executor.task_tag_metrics
+        assert metrics["db"]["limit"] == 2
+        assert metrics["db"]["runs"] == 6
+        assert metrics["db"]["max_wait"] > 0
+
+    def test_limits_can_be_configured(self):
+        with Flow("test") as flow:
+            res = record_run_interval.map(list(range(4)))
+
+        executor = LocalDaskExecutor(num_workers=4)
+        with set_temporary_config({"flows.task_tag_limits.db": 1}):
+            state = FlowRunner(flow=flow).run(return_tasks=[res], executor=executor)
+        assert state.is_successful()
+        assert max_overlap(state.result[res].result) == 1
+        assert executor.task_tag_metrics["db"]["max_waiting"] >= 2
+
+    def test_context_limits_override_configured_limits(self):
+        with Flow("test") as flow:
+            res = record_run_interval.map(list(range(4)))
+
+        executor = LocalDaskExecutor(num_workers=4)
+        with set_temporary_config({"flows.task_tag_limits.db": 1}):
+            state = FlowRunner(flow=flow).run(
+                return_tasks=[res],
+                executor=executor,
+                context={"task_tag_limits": {"db": 4}},
+            )
+        assert max_overlap(state.result[res].result) > 1
+        assert executor.task_tag_metrics["db"]["limit"] == 4
+
+    def test_no_metrics_without_limits(self):
+        executor = LocalExecutor()
+        with Flow("test") as flow:
+            record_run_interval(1)
+        assert FlowRunner(flow=flow).run(executor=executor).is_successful()
+        assert executor.task_tag_metrics == {}
@@ -1,18 +1,42 @@
 import base64
+import io
 import json
+import os
+import pickle
+import struct
+import sys
 
 import cloudpickle
 import pendulum
 import pytest
 
 from prefect.engine.serializers import (
+    ArrowSerializer,
     CompressedSerializer,
     DateTimeSerializer,
     JSONSerializer,
+    LazyArrowTable,
+    OutOfBandPickleSerializer,
     PandasSerializer,
     PickleSerializer,
 )
 
+requires_pickle_buffers = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Pickle protocol 5 requires Python 3.8+"
+)
+
+
+class Blob:
+    """An object whose data is pickled out-of-band with pickle protocol 5"""
+
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return (Blob, (pickle.PickleBuffer(self.data),))
+        return (Blob, (bytes(self.data),))
+
 
 class TestPickleSerializer:
     def test_serialize_returns_bytes(self):
@@ -47,6 +71,56 @@ class TestPickleSerializer:
             PickleSerializer().deserialize(b"bad-bytes")
 
 
+class TestOutOfBandPickleSerializer:
+    def test_serialize_returns_bytes(self):
+        value = ["abc", 123, pendulum.now()]
+        serialized = OutOfBandPickleSerializer().serialize(value)
+        assert isinstance(serialized, bytes)
+
+    def test_deserialize_returns_objects(self):
+        value = ["abc", 123, pendulum.now()]
+        serialized = OutOfBandPickleSerializer().serialize(value)
+        deserialized = OutOfBandPickleSerializer().deserialize(serialized)
+        assert deserialized == value
+
+    def test_deserializes_pickle_serializer_output(self):
+        value = ["abc", 123, pendulum.now()]
+        serialized = PickleSerializer().serialize(value)
+        assert OutOfBandPickleSerializer().deserialize(serialized) == value
+
+    def test_write_to_matches_serialize(self):
+        value = {"blob": Blob(bytearray(b"x" * 1000)), "y": 1}
+        buffer = io.BytesIO()
+        OutOfBandPickleSerializer().write_to(value, buffer)
+        assert buffer.getvalue() == OutOfBandPickleSerializer().serialize(value)
+
+    @requires_pickle_buffers
+    def test_buffers_are_stored_in_aligned_segments(self):
+        data = bytearray(b"x" * 1000)
+        serialized = OutOfBandPickleSerializer().serialize([Blob(data), Blob(data)])
+
+        (count,) = struct.unpack_from("<Q", serialized, 8)
+        locations = list(struct.iter_unpack("<QQ", serialized[16 : 16 + 16 * count]))
+        assert count == 3
+        assert all(offset % 64 == 0 for offset, _ in locations)
+        for offset, length in locations[1:]:
+            assert serialized[offset : offset + length] == data
+
+    @requires_pickle_buffers
+    def test_deserialized_buffers_are_views_of_the_serialized_value(self):
+        serializer = OutOfBandPickleSerializer()
+        serialized = bytearray(serializer.serialize(Blob(bytearray(b"x" * 1000))))
+
+        blob = serializer.deserialize(serialized)
+        assert isinstance(blob.data, memoryview)
+        assert blob.data.obj is serialized
+        assert blob.data == b"x" * 1000
+
+    def test_meaningful_errors_are_raised(self):
+        with pytest.raises(cloudpickle.pickle.UnpicklingError, match="stack underflow"):
+            OutOfBandPickleSerializer().deserialize(b"bad-bytes")
+
+
 class TestJSONSerializer:
     def test_serialize_returns_bytes(self):
         value = ["abc", 123]
@@ -125,6 +199,102 @@ class TestPandasSerializer:
         pd.testing.assert_frame_equal(expected, deserialized)
 
 
+class TestArrowSerializer:
+    @pytest.fixture
+    def input_dataframe(self):
+        pytest.importorskip("pyarrow", reason="pyarrow not installed")
+        pd = pytest.importorskip("pandas", reason="Pandas not installed")
+        return pd.DataFrame(
+            {"one": list(range(10)), "two": [str(i) for i in range(10)]}
+        )
+
+    def test_complains_when_unavailable_format_specified(self):
+        pytest.importorskip("pyarrow", reason="pyarrow not installed")
+        with pytest.raises(ValueError, match="must be either 'parquet' or 'ipc'"):
+            ArrowSerializer("blerg")
+
+    @pytest.mark.parametrize("format", ["parquet", "ipc"])
+    def test_serialize_deserialize_dataframe_is_invariant(
+        self, format, input_dataframe
+    ):
+        pd = pytest.importorskip("pandas")
+        serializer = ArrowSerializer(format)
+        serialized = serializer.serialize(input_dataframe)
+        assert isinstance(serialized, bytes)
+        pd.testing.assert_frame_equal(
+            serializer.deserialize(serialized), input_dataframe
+        )
+
+    @pytest.mark.parametrize("format", ["parquet", "ipc"])
+    def test_serialize_deserialize_table_is_invariant(self, format):
+        pa = pytest.importorskip("pyarrow", reason="pyarrow not installed")
+        table = pa.table({"x": [1, 2, 3]})
+        serializer = ArrowSerializer(format)
+        deserialized = serializer.deserialize(serializer.serialize(table))
+        assert isinstance(deserialized, pa.Table)
+        assert deserialized.equals(table)
+
+    @pytest.mark.parametrize("format", ["parquet", "ipc"])
+    def test_write_to_writes_row_groups(self, format, input_dataframe):
+        serializer = ArrowSerializer(format, row_group_size=3, lazy=True)
+        buffer = io.BytesIO()
+        serializer.write_to(input_dataframe, buffer)
+
+        table = serializer.deserialize(buffer.getvalue())
+        assert isinstance(table, LazyArrowTable)
+        assert table.num_row_groups == 4
+        assert table.num_rows == 10
+        assert table.column_names == ["one", "two"]
+
+    @pytest.mark.parametrize("format", ["parquet", "ipc"])
+    def test_lazy_tables_read_requested_columns_and_row_groups(
+        self, format, input_dataframe
+    ):
+        serializer = ArrowSerializer(format, row_group_size=3, lazy=True)
+        table = serializer.deserialize_from(
+            io.BytesIO(serializer.serialize(input_dataframe))
+        )
+
+        part = table.read(columns=["two"], row_groups=[1, 3])
+        assert part.column_names == ["two"]
+        assert part.column("two").to_pylist() == ["3", "4", "5", "9"]
+        assert list(table.to_pandas(columns=["one"], row_groups=[0])["one"]) == [
+            0,
+            1,
+            2,
+        ]
+
+    @pytest.mark.parametrize("format", ["parquet", "ipc"])
+    def test_lazy_tables_are_pickleable(self, format, input_dataframe):
+        pd = pytest.importorskip("pandas")
+        serializer = ArrowSerializer(format, lazy=True)
+        table = serializer.deserialize_from(
+            io.BytesIO(serializer.serialize(input_dataframe))
+        )
+
+        unpickled = cloudpickle.loads(cloudpickle.dumps(table))
+        pd.testing.assert_frame_equal(unpickled.to_pandas(), input_dataframe)
+
+    def test_parquet_reads_only_requested_columns(self, input_dataframe):
+        serializer = ArrowSerializer(lazy=True)
+        serialized = serializer.serialize(
+            input_dataframe.assign(big=[os.urandom(10000).hex() for _ in range(10)])
+        )
+
+        class CountingFile(io.BytesIO):
+            bytes_read = 0
+
+            def read(self, size=-1):
+                data = super().read(size)
+                self.bytes_read += len(data)
+                return data
+
+        file = CountingFile(serialized)
+        table = serializer.deserialize_from(file)
+        assert list(table.to_pandas(columns=["one"])["one"]) == list(range(10))
+        assert file.bytes_read < len(serialized) / 2
+
+
 class TestCompressedSerializer:
     @pytest.mark.parametrize("format", ["bz2", "gzip", "lzma", "zlib"])
     def test_constructor_accepts_standard_formats(self, format) -> None:
@@ -214,6 +384,8 @@ def test_equality():
     assert PickleSerializer() == PickleSerializer()
     assert JSONSerializer() == JSONSerializer()
     assert PickleSerializer() != JSONSerializer()
+    assert OutOfBandPickleSerializer() == OutOfBandPickleSerializer()
+    assert OutOfBandPickleSerializer() != PickleSerializer()
 
 
 def test_compressed_serializer_equality() -> None:
@@ -253,3 +425,12 @@ def test_pandas_serializer_equality():
     assert PandasSerializer("csv", serialize_kwargs={"one": 1}) != PandasSerializer(
         "csv", serialize_kwargs={"one": 2}
     )
+
+
+def test_arrow_serializer_equality():
+    pytest.importorskip("pyarrow", reason="pyarrow not installed")
+    assert ArrowSerializer() == ArrowSerializer("parquet")
+    assert ArrowSerializer() != PickleSerializer()
+    assert ArrowSerializer("parquet") != ArrowSerializer("ipc")
+    assert ArrowSerializer(row_group_size=10) != ArrowSerializer(row_group_size=20)
+    assert ArrowSerializer(lazy=True) != ArrowSerializer()
@@ -17,6 +17,7 @@ from prefect.engine.state import (
     Finished,
     Looped,
     Mapped,
+    MappedStates,
     Paused,
     Pending,
     Queued,
@@ -675,6 +676,80 @@ def test_n_map_states():
     assert state.n_map_states == 4
 
 
+class TestMappedStates:
+    def test_mapped_converts_map_states(self):
+        state = Mapped(map_states=[Success(), None])
+        assert isinstance(state.map_states, MappedStates)
+
+        state.map_states = [Failed()]
+        assert isinstance(state.map_states, MappedStates)
+        assert state.map_states == [Failed()]
+
+    def test_states_are_rebuilt_on_access(self):
+        retrying = Retrying(
+            message="retry", result=2, run_count=3, context={"tags": ["a"]}
+        )
+        states = MappedStates([Success(message="ok", result=1), None, retrying, 4])
+
+        assert len(states) == 4
+        assert states[0] == Success(result=1)
+        assert states[0].message == "ok"
+        assert states[1] is None
+        assert states[2] == retrying
+        assert states[2].run_count == 3
+        assert states[2].context == {"tags": ["a"]}
+        assert states[-1] == 4
+        assert states[:2] == [Success(result=1), None]
+        assert states.results == [1, None, 2, None]
+
+    def test_rebuilt_states_are_independent(self):
+        states = MappedStates([Success(context={"tags": ["a"]})] * 2)
+        first = states[0]
+        first.message = "changed"
+        first.context["x"] = 1
+        assert states[0].message is None
+
+        assert states[0].context == {"tags": ["a"]}
+
+        states[0] = first
+        assert states[0].message == "changed"
+        assert states[1].message is None
+        assert states[1].context == {"tags": ["a"]}
+
+    def test_mutation(self):
+        states = MappedStates([Success(), Failed()])
+        states.append(Skipped())
+        states.insert(0, Pending())
+        del states[1]
+        assert states == [Pending(), Failed(), Skipped()]
+
+        states[1:] = [Success()]
+        assert states == [Pending(), Success()]
+
+    def test_counts(self):
+        states = MappedStates(
+            [Success(), Skipped(), Failed(), TriggerFailed(), Pending(), None]
+        )
+        assert states.n_finished == 4
+        assert states.n_successful == 2
+        assert states.n_failed == 2
+        assert states.n_skipped == 1
+
+    def test_pickle(self):
+        state = Mapped(map_states=[Success(result=1), Failed(message="no"), None])
+        new_state = cloudpickle.loads(cloudpickle.dumps(state))
+        assert isinstance(new_state.map_states, MappedStates)
+        assert new_state == state
+        assert new_state.map_states[1].message == "no"
+
+    def test_pickled_lists_are_converted(self):
+        state = Mapped()
+        state.__dict__["map_states"] = [Success()]
+        new_state = cloudpickle.loads(cloudpickle.dumps(state))
+        assert isinstance(new_state.map_states, MappedStates)
+        assert new_state.map_states == [Success()]
+
+
 def test_init_with_falsey_value():
     state = Success(result={})
     assert state.result == {}
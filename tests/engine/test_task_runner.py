@@ -2007,6 +2007,26 @@ class TestCheckTaskReadyToMapStep:
         assert exc.value.state.is_mapped()
         assert exc.value.state.n_map_states == 2
 
+    def test_run_mapped_accepts_upstream_streams(self):
+        stream = iter([1, 2, 3])
+        upstreams = {
+            Edge(mapped=True, upstream_task=Task(), downstream_task=Task()): Success(
+                result=stream
+            ),
+            Edge(mapped=True, downstream_task=Task(), upstream_task=Task()): Success(
+                result=list(range(10))
+            ),
+        }
+
+        with pytest.raises(ENDRUN) as exc:
+            TaskRunner(task=Task()).check_task_ready_to_map(
+                state=Pending(), upstream_states=upstreams
+            )
+        assert exc.value.state.is_mapped()
+        # the length of the stream isn't known until it's consumed
+        assert exc.value.state.n_map_states == 0
+        assert list(stream) == [1, 2, 3]
+
 
 def test_task_runner_skips_upstream_check_for_parent_mapped_task():
     add = AddTask(trigger=prefect.triggers.all_failed)
@@ -2153,6 +2173,115 @@ def test_task_runner_provides_logger():
     assert state.result is my_task.logger
 
 
+class TestPlainTaskRun:
+    def test_plain_task_is_plain(self):
+        task = AddTask()
+        upstream = {Edge(Task(), task, key="x"): Success(result=1)}
+        assert TaskRunner(task).is_plain_task_run(Pending(), upstream_states=upstream)
+
+    @pytest.mark.parametrize(
+        "task_kwargs",
+        [
+            dict(state_handlers=[lambda *args: None]),
+            dict(trigger=prefect.triggers.always_run),
+            dict(cache_for=timedelta(minutes=1)),
+            dict(target="{task_name}"),
+            dict(max_retries=1, retry_delay=timedelta(0)),
+            dict(timeout=10),
+        ],
+    )
+    def test_configured_tasks_are_not_plain(self, task_kwargs):
+        runner = TaskRunner(Task(**task_kwargs))
+        assert not runner.is_plain_task_run(Pending(), upstream_states={})
+
+    def test_runner_state_handlers_are_not_plain(self):
+        runner = TaskRunner(Task(), state_handlers=[lambda *args: None])
+        assert not runner.is_plain_task_run(Pending(), upstream_states={})
+
+    @pytest.mark.parametrize(
+        "state", [Scheduled(), Retrying(), Resume(), Paused(), Cached(), Success()]
+    )
+    def test_non_pending_states_are_not_plain(self, state):
+        assert not TaskRunner(Task()).is_plain_task_run(state, upstream_states={})
+
+    @pytest.mark.parametrize(
+        "upstream_state",
+        [Failed(), Skipped(), Mapped(map_states=[Success()]), Pending(), Running()],
+    )
+    def test_unsuccessful_upstreams_are_not_plain(self, upstream_state):
+        task = Task()
+        upstream = {Edge(Task(), task): upstream_state}
+        assert not TaskRunner(task).is_plain_task_run(
+            Pending(), upstream_states=upstream
+        )
+
+    def test_runners_overriding_skipped_steps_are_not_plain(self):
+        class MyRunner(TaskRunner):
+            def check_task_trigger(self, state, upstream_states):
+                return state
+
+        class OtherRunner(TaskRunner):
+            def get_task_run_state(self, state, inputs):
+                return super().get_task_run_state(state, inputs)
+
+        assert not MyRunner(Task()).is_plain_task_run(Pending(), upstream_states={})
+        assert OtherRunner(Task()).is_plain_task_run(Pending(), upstream_states={})
+
+    @pytest.mark.parametrize(
+        "task,check",
+        [
+            (SuccessTask(), lambda s: s.is_successful() and s.result == 1),
+            (ErrorTask(), lambda s: s.is_failed() and isinstance(s.result, ValueError)),
+            (RaiseFailTask(), lambda s: s.is_failed() and "custom-fail" in s.message),
+            (RaiseSkipTask(), lambda s: s.is_skipped()),
+            (RaiseSuccessTask(), lambda s: s.is_successful()),
+            (RaiseRetryTask(), lambda s: s.is_retrying()),
+        ],
+    )
+    def test_plain_run_matches_full_pipeline(self, task, check):
+        class FullRunner(TaskRunner):
+            def is_plain_task_run(self, state, upstream_states):
+                return False
+
+        plain = TaskRunner(task).run()
+        full = FullRunner(task).run()
+        assert check(plain)
+        assert type(plain) is type(full)
+        assert plain.message == full.message
+
+    def test_plain_run_gets_inputs_and_context(self):
+        @prefect.task
+        def add(x, y):
+            return (x + y, prefect.context.task_full_name)
+
+        upstream = {
+            Edge(Task(), add, key="x"): Success(result=1),
+            Edge(Task(), add, key="y"): Success(result=2),
+        }
+        state = TaskRunner(add).run(upstream_states=upstream, context={"map_index": 3})
+        assert state.result == (3, "add[3]")
+
+    def test_plain_run_logs_start_and_finish(self, caplog):
+        TaskRunner(SuccessTask()).run()
+        messages = [r.message for r in caplog.records if r.levelname == "INFO"]
+        assert messages == [
+            "Task 'SuccessTask': Starting task run...",
+            "Task 'SuccessTask': Finished task run for task with final state: "
+            "'Success'",
+        ]
+
+    def test_plain_run_can_loop(self):
+        @prefect.task
+        def my_task():
+            if prefect.context.get("task_loop_count", 1) < 3:
+                raise signals.LOOP(result=prefect.context.get("task_loop_count", 1))
+            return prefect.context.task_loop_result
+
+        state = TaskRunner(my_task).run()
+        assert state.is_successful()
+        assert state.result == 2
+
+
 class TestLooping:
     def test_looping_works(self):
         @prefect.task
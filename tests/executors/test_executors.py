@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 import random
@@ -6,6 +7,7 @@ import tempfile
 import threading
 import time
 import uuid
+from unittest.mock import MagicMock
 
 import cloudpickle
 import dask
@@ -14,12 +16,16 @@ import pytest
 
 import prefect
 from prefect.executors import (
+    AsyncExecutor,
     DaskExecutor,
     Executor,
     LocalDaskExecutor,
     LocalExecutor,
+    PoolExecutor,
 )
+from prefect.engine.result import NoResult
 from prefect.engine.signals import SUCCESS
+from prefect.engine.state import Failed, Success
 
 
 @pytest.mark.parametrize(
@@ -253,7 +259,226 @@ class TestLocalExecutor:
             assert isinstance(post, LocalExecutor)
 
 
-@pytest.mark.parametrize("executor", ["mproc", "mthread", "sync"], indirect=True)
+class TestPoolExecutor:
+    def test_kind_defaults_to_threads(self):
+        assert PoolExecutor().kind == "threads"
+
+    def test_normalize_kind(self):
+        normalize = PoolExecutor._normalize_kind
+        for name in ["THREADS", "threading", "threads"]:
+            assert normalize(name) == "threads"
+        for name in ["multiprocessing", "processes"]:
+            assert normalize(name) == "processes"
+        with pytest.raises(ValueError):
+            normalize("unknown")
+
+    def test_max_workers_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_workers"):
+            PoolExecutor(max_workers=0)
+
+    def test_submit_requires_start(self):
+        with pytest.raises(ValueError, match="started"):
+            PoolExecutor().submit(lambda: 1)
+
+    @pytest.mark.parametrize("kind", ["threads", "processes"])
+    def test_submit_and_wait(self, kind):
+        e = PoolExecutor(kind, max_workers=2)
+        with e.start():
+            x = e.submit(lambda: 1)
+            y = e.submit(lambda a, b: a + sum(b), x, b=[x, 1])
+            z = e.submit(lambda a: a, {"y": y, "xs": (x, 2)})
+            assert e.wait([x, y, z]) == [1, 3, {"y": 3, "xs": (1, 2)}]
+
+    @pytest.mark.parametrize("kind", ["threads", "processes"])
+    def test_errors_are_raised_by_wait(self, kind):
+        def fail():
+            raise ValueError("oops")
+
+        e = PoolExecutor(kind, max_workers=1)
+        with e.start():
+            x = e.submit(fail)
+            y = e.submit(lambda a: a, x)
+            with pytest.raises(ValueError, match="oops"):
+                e.wait(x)
+            with pytest.raises(ValueError, match="oops"):
+                e.wait(y)
+
+    def test_processes_are_reused(self):
+        e = PoolExecutor("processes", max_workers=1)
+        with e.start():
+            pids = e.wait([e.submit(os.getpid) for _ in range(3)])
+        assert len(set(pids)) == 1
+        assert pids[0] != os.getpid()
+
+    def test_functions_waiting_on_others_dont_occupy_workers(self):
+        event = threading.Event()
+        e = PoolExecutor(max_workers=1)
+        with e.start():
+            blocker = e.submit(lambda: event.wait(5))
+            waiting = [e.submit(lambda a: a, blocker) for _ in range(3)]
+            assert not any(f.done() for f in waiting)
+            event.set()
+            assert e.wait(waiting) == [True, True, True]
+
+    def test_wait_any(self):
+        event = threading.Event()
+        e = PoolExecutor()
+        with e.start():
+            futures = {
+                "slow": e.submit(lambda: event.wait(5) and 1),
+                "fast": [e.submit(lambda: 2)],
+            }
+            assert e.wait_any(futures) == {"fast": [2]}
+            event.set()
+
+    def test_is_pickleable_after_start(self):
+        e = PoolExecutor("processes", max_workers=3)
+        with e.start():
+            post = cloudpickle.loads(cloudpickle.dumps(e))
+            assert isinstance(post, PoolExecutor)
+            assert post.kind == "processes"
+            assert post.max_workers == 3
+            assert post._pool is None
+
+    @pytest.mark.parametrize("kind", ["threads", "processes"])
+    def test_interrupt_stops_running_functions_quickly(self, kind):
+        main_thread = threading.get_ident()
+
+        def interrupt():
+            if sys.platform == "win32":
+                # pthread_kill is Windows only
+                from _thread import interrupt_main
+
+                interrupt_main()
+            else:
+                import signal
+
+                signal.pthread_kill(main_thread, signal.SIGINT)
+
+        def long_task():
+            for i in range(50):
+                time.sleep(0.1)
+
+        e = PoolExecutor(kind, max_workers=1)
+        try:
+            interrupter = threading.Timer(0.5, interrupt)
+            interrupter.start()
+            start = time.time()
+            with e.start():
+                first = e.submit(long_task)
+                second = e.submit(long_task)
+                e.wait([first, second])
+        except KeyboardInterrupt:
+            pass  # Don't exit test on the interrupt
+
+        stop = time.time()
+        # the second function is either cancelled, or its worker process killed
+        assert second.cancelled() or second.exception() is not None
+        assert (stop - start) < (6 if sys.platform == "win32" else 4)
+
+    @pytest.mark.parametrize("kind", ["threads", "processes"])
+    def test_runs_flows(self, kind):
+        @prefect.task
+        def inc(x):
+            return x + 1
+
+        with prefect.Flow("pool") as flow:
+            res = inc.map(inc.map(list(range(10))))
+
+        state = flow.run(executor=PoolExecutor(kind, max_workers=2))
+        assert state.is_successful()
+        assert state.result[res].result == list(range(2, 12))
+
+
+class TestAsyncExecutor:
+    def test_max_concurrency_must_be_positive(self):
+        with pytest.raises(ValueError, match="max_concurrency"):
+            AsyncExecutor(max_concurrency=0)
+
+    def test_submit_requires_start(self):
+        with pytest.raises(ValueError, match="started"):
+            AsyncExecutor().submit(lambda: 1)
+
+    def test_submit_and_wait(self):
+        executor = AsyncExecutor()
+        with executor.start():
+            x = executor.submit(lambda: 1)
+            y = executor.submit(lambda a, b: a + b, x, b=x)
+            assert executor.wait([x, {"y": y}]) == [1, {"y": 2}]
+
+    def test_functions_run_once_their_arguments_are_complete(self):
+        event = threading.Event()
+        executor = AsyncExecutor(max_concurrency=1)
+        with executor.start():
+            x = executor.submit(lambda: event.wait(5) and 1)
+            y = executor.submit(lambda a: a + 1, x)
+            assert not y.done()
+            event.set()
+            assert executor.wait(y) == 2
+
+    def test_wait_any(self):
+        event = threading.Event()
+        executor = AsyncExecutor()
+        with executor.start():
+            futures = {
+                "slow": executor.submit(lambda: event.wait(5) and 1),
+                "fast": [executor.submit(lambda: 2)],
+            }
+            assert executor.wait_any(futures) == {"fast": [2]}
+            event.set()
+
+    def test_is_pickleable_after_start(self):
+        e = AsyncExecutor(max_concurrency=5)
+        with e.start():
+            post = cloudpickle.loads(cloudpickle.dumps(e))
+            assert isinstance(post, AsyncExecutor)
+            assert post.max_concurrency == 5
+
+    def test_runs_coroutine_tasks_concurrently(self):
+        @prefect.task
+        async def wait(x):
+            await asyncio.sleep(0.5)
+            return (x, prefect.context.map_index)
+
+        with prefect.Flow("async") as flow:
+            res = wait.map(list(range(20)))
+
+        start = time.time()
+        state = flow.run(executor=AsyncExecutor())
+        assert time.time() - start < 5
+        assert state.is_successful()
+        assert state.result[res].result == [(i, i) for i in range(20)]
+
+    def test_runs_regular_tasks(self):
+        @prefect.task
+        def inc(x):
+            return x + 1
+
+        with prefect.Flow("sync") as flow:
+            res = inc.map(list(range(3)))
+
+        state = flow.run(executor=AsyncExecutor())
+        assert state.result[res].result == [1, 2, 3]
+
+    def test_coroutine_tasks_time_out(self):
+        @prefect.task(timeout=1)
+        async def hang():
+            await asyncio.sleep(30)
+
+        with prefect.Flow("timeout") as flow:
+            res = hang()
+
+        start = time.time()
+        state = flow.run(executor=AsyncExecutor())
+        assert time.time() - start < 10
+        assert isinstance(state.result[res], prefect.engine.state.TimedOut)
+
+
+@pytest.mark.parametrize(
+    "executor",
+    ["mproc", "mthread", "sync", "threaded_pool", "mproc_pool"],
+    indirect=True,
+)
 def test_submit_does_not_assume_pure_functions(executor):
     def random_fun():
         return random.random()
@@ -265,6 +490,42 @@ def test_submit_does_not_assume_pure_functions(executor):
     assert one != two
 
 
+@pytest.mark.parametrize(
+    "executor",
+    ["local", "sync", "mproc_local", "mthread", "threaded_pool", "mproc_pool"],
+    indirect=True,
+)
+def test_shared_values_can_be_passed_to_submitted_functions(executor):
+    value = {"x": [1, 2]}
+    with executor.start():
+        shared = executor.share(value)
+        futures = [
+            executor.submit(lambda v, i: v["x"] + [i], shared, i) for i in (3, 4)
+        ]
+        assert executor.wait(futures) == [[1, 2, 3], [1, 2, 4]]
+
+
+@pytest.mark.parametrize(
+    "executor",
+    ["local", "sync", "mproc_local", "mthread", "mproc", "threaded_pool", "mproc_pool"],
+    indirect=True,
+)
+def test_submit_many(executor):
+    def add(x, y, z=0):
+        return x + y + z
+
+    with executor.start():
+        upstream = executor.submit(lambda: 10)
+        futures = executor.submit_many(
+            add,
+            [dict(x=1), dict(x=2, z=100), dict(x=upstream)],
+            extra_contexts=[dict(task_name="add", task_index=i) for i in range(3)],
+            y=1000,
+        )
+        assert executor.wait(futures) == [1001, 1102, 1010]
+        assert executor.submit_many(add, [], y=1) == []
+
+
 class TestDaskExecutor:
     @pytest.mark.parametrize("executor", ["mproc", "mthread"], indirect=True)
     def test_submit_and_wait(self, executor):
@@ -277,6 +538,36 @@ class TestDaskExecutor:
         assert x == 3
         assert y == 4
 
+    def test_wait_for_states_gathers_states_with_results_by_default(self, mthread):
+        with mthread.start():
+            futures = [mthread.submit(lambda i: Success(result=i), i) for i in (1, 2)]
+            states = mthread.wait_for_states(futures)
+        assert [s.result for s in states] == [1, 2]
+
+    def test_wait_for_states_releases_results_on_workers(self, mthread):
+        executor = DaskExecutor(mthread.address, results_on_workers=True)
+        with executor.start():
+            single = executor.submit(lambda: Success(result=1))
+            chunk = executor.submit(lambda: [Success(result=2), Failed(result=3)])
+            states = executor.wait_for_states({"single": single, "chunk": [chunk]})
+            # the states are still available with their results
+            assert executor.wait(single).result == 1
+
+        assert states["single"].is_successful()
+        assert states["single"]._result == NoResult
+        [[success, failed]] = states["chunk"]
+        assert success.is_successful() and success._result == NoResult
+        assert failed.is_failed() and failed._result == NoResult
+
+    def test_wait_any_releases_results_on_workers(self, mthread):
+        executor = DaskExecutor(mthread.address, results_on_workers=True)
+        with executor.start():
+            future = executor.submit(lambda: Success(result=1))
+            done = executor.wait_any({"a": [future]})
+        [state] = done["a"]
+        assert state.is_successful()
+        assert state._result == NoResult
+
     @pytest.mark.skipif(
         sys.platform == "win32", reason="Nondeterministically fails on Windows machines"
     )
@@ -445,6 +736,53 @@ class TestDaskExecutor:
             assert fut.key.startswith("inc-1-")
             assert res == 2
 
+    def test_submit_many_sends_calls_together(self, mthread, monkeypatch):
+        with mthread.start():
+            map_calls = []
+            client_map = mthread.client.map
+            monkeypatch.setattr(
+                mthread.client,
+                "map",
+                lambda *args, **kwargs: map_calls.append(kwargs)
+                or client_map(*args, **kwargs),
+            )
+            futures = mthread.submit_many(
+                lambda x: x + 1,
+                [dict(x=i) for i in range(100)],
+                extra_contexts=[
+                    dict(task_name="inc", task_index=i) for i in range(100)
+                ],
+            )
+            assert mthread.wait(futures) == list(range(1, 101))
+
+        assert len(map_calls) == 1
+        assert [f.key.rsplit("-", 2)[0] for f in futures] == [
+            f"inc-{i}" for i in range(100)
+        ]
+        assert len({f.key for f in futures}) == 100
+
+    def test_submit_many_groups_calls_by_resources(self, mthread, monkeypatch):
+        with mthread.start():
+            map_calls = []
+            monkeypatch.setattr(
+                mthread.client,
+                "map",
+                lambda func, iterable, **kwargs: map_calls.append(kwargs)
+                or [MagicMock() for _ in iterable],
+            )
+            mthread.submit_many(
+                lambda: None,
+                [{}] * 3,
+                extra_contexts=[
+                    dict(task_name="a", task_tags=["dask-resource:GPU=1"]),
+                    dict(task_name="b"),
+                    dict(task_name="c", task_tags=["dask-resource:GPU=1"]),
+                ],
+            )
+
+        assert [c["resources"] for c in map_calls] == [{"GPU": 1.0}, None]
+        assert [len(c["key"]) for c in map_calls] == [2, 1]
+
     @pytest.mark.parametrize("executor", ["mproc", "mthread"], indirect=True)
     def test_is_pickleable(self, executor):
         post = cloudpickle.loads(cloudpickle.dumps(executor))
@@ -0,0 +1,114 @@
+import threading
+import time
+
+import cloudpickle
+import pytest
+
+from prefect.executors import LocalDaskExecutor, LocalExecutor, PoolExecutor
+from prefect.executors.limits import ManagedTaskTagLimiter, TaskTagLimiter
+
+
+@pytest.mark.parametrize("limit", [0, -1, 1.5, "2"])
+def test_limits_must_be_positive_integers(limit):
+    with pytest.raises(ValueError, match="positive integer"):
+        TaskTagLimiter({"db": limit})
+
+
+def test_limit_bounds_concurrent_runs_with_a_tag():
+    limiter = TaskTagLimiter({"db": 2})
+    lock = threading.Lock()
+    running = [0]
+    max_running = [0]
+
+    def run():
+        with limiter.limit(["db", "other"]):
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            time.sleep(0.1)
+            with lock:
+                running[0] -= 1
+
+    threads = [threading.Thread(target=run) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert max_running[0] == 2
+    metrics = limiter.metrics()
+    assert set(metrics) == {"db"}
+    assert metrics["db"]["limit"] == 2
+    assert metrics["db"]["runs"] == 6
+    assert 2 <= metrics["db"]["max_waiting"] <= 4
+    assert metrics["db"]["max_wait"] >= 0.1
+    assert metrics["db"]["total_wait"] >= metrics["db"]["max_wait"]
+
+
+def test_runs_without_limited_tags_dont_wait_or_count():
+    limiter = TaskTagLimiter({"db": 1})
+    with limiter.limit(["db"]):
+        with limiter.limit(["other"]):
+            pass
+    assert limiter.metrics()["db"]["runs"] == 1
+
+
+def test_slots_are_released_on_error():
+    limiter = TaskTagLimiter({"db": 1})
+    with pytest.raises(ValueError):
+        with limiter.limit(["db"]):
+            raise ValueError()
+    with limiter.limit(["db"]):
+        pass
+    assert limiter.metrics()["db"]["runs"] == 2
+
+
+def test_runs_with_several_limited_tags_dont_deadlock():
+    limiter = TaskTagLimiter({"a": 1, "b": 1})
+
+    def run(tags):
+        for _ in range(20):
+            with limiter.limit(tags):
+                pass
+
+    threads = [
+        threading.Thread(target=run, args=(tags,)) for tags in (["a", "b"], ["b", "a"])
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(5)
+    assert not any(t.is_alive() for t in threads)
+    assert limiter.metrics()["a"]["runs"] == 40
+
+
+def test_metrics_without_runs():
+    assert TaskTagLimiter({"db": 3}).metrics() == {
+        "db": dict(limit=3, runs=0, max_waiting=0, total_wait=0, max_wait=0.0)
+    }
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [LocalExecutor(), LocalDaskExecutor(), PoolExecutor()],
+    ids=["local", "local_dask", "pool"],
+)
+def test_thread_executors_limit_in_process(executor):
+    with executor.start():
+        with executor.limit_task_tags({"db": 1}) as limiter:
+            assert type(limiter) is TaskTagLimiter
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [LocalDaskExecutor("processes"), PoolExecutor("processes")],
+    ids=["local_dask", "pool"],
+)
+def test_process_executors_limit_through_a_manager(executor):
+    with executor.start():
+        with executor.limit_task_tags({"db": 1}) as limiter:
+            assert isinstance(limiter, ManagedTaskTagLimiter)
+            post = cloudpickle.loads(cloudpickle.dumps(limiter))
+            with post.limit(["db"]):
+                pass
+            assert limiter.metrics()["db"]["runs"] == 1
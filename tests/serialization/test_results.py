@@ -72,6 +72,15 @@ def test_local_result():
     assert new_result.value is None
 
 
+def test_content_addressed_local_result():
+    schema = StateResultSchema()
+    result = results.LocalResult(content_addressed=True, max_size=1000)
+    new_result = schema.load(schema.dump(result))
+
+    assert new_result.content_addressed is True
+    assert new_result.max_size == 1000
+
+
 def test_local_result_doesnt_validate_on_deserialization():
     schema = StateResultSchema()
     result = results.LocalResult(validate_dir=True)
@@ -115,6 +124,15 @@ def test_s3_result():
     assert new_result.value is None
 
 
+def test_s3_result_transfer_options():
+    schema = StateResultSchema()
+    result = results.S3Result(bucket="foo", part_size=2**24, max_concurrency=2)
+    new_result = schema.load(schema.dump(result))
+
+    assert new_result.part_size == 2**24
+    assert new_result.max_concurrency == 2
+
+
 def test_secret_result():
     schema = StateResultSchema()
     result = results.SecretResult(
@@ -176,6 +176,20 @@ def test_context_init_prioritizes_new_config_keys_when_passed_a_dict():
     assert ctx.config.cloud.send_flow_run_logs == "FOO"
 
 
+def test_context_contextmanager_doesnt_copy_an_unchanged_config():
+    config = prefect.context.config
+    with prefect.context(dict(prefect.context), x=1):
+        assert prefect.context.config is config
+
+
+def test_context_contextmanager_merges_a_config_passed_again():
+    config = {"cloud": {"send_flow_run_logs": "FOO"}}
+    with prefect.context(config=config):
+        config["cloud"]["send_flow_run_logs"] = "BAR"
+        with prefect.context(config=config):
+            assert prefect.context.config.cloud.send_flow_run_logs == "BAR"
+
+
 def test_contexts_are_thread_safe():
 
     result_queue = queue.Queue()
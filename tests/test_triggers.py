@@ -6,6 +6,7 @@ from prefect.core.edge import Edge, Task
 from prefect.engine import signals
 from prefect.engine.state import (
     Failed,
+    Mapped,
     Pending,
     Resume,
     Retrying,
@@ -212,6 +213,18 @@ def test_some_failed_with_no_args(states):
     assert triggers.some_failed(states)
 
 
+def test_triggers_count_the_children_of_mapped_states():
+    states = generate_states(success=1)
+    states[Edge(Task(), Task())] = Mapped(map_states=[Success(), Failed(), Failed()])
+
+    assert triggers.some_failed(at_least=2, at_most=0.5)(states)
+    assert triggers.any_successful(states)
+    with pytest.raises(signals.TRIGGERFAIL):
+        triggers.some_failed(at_least=3)(states)
+    with pytest.raises(signals.TRIGGERFAIL):
+        triggers.all_successful(states)
+
+
 def test_some_failed_error_msg():
     trigger = triggers.some_failed(at_least=23)
     with pytest.raises(signals.TRIGGERFAIL, match="some_failed"):
@@ -1,3 +1,4 @@
+import asyncio
 import cloudpickle
 import multiprocessing
 import os
@@ -8,7 +9,10 @@ import time
 from unittest.mock import MagicMock
 
 import prefect
+from prefect.core import Edge, Task
+from prefect.engine.state import Mapped, Success
 from prefect.exceptions import TaskTimeoutSignal
+from prefect.executors import LocalExecutor
 from prefect.utilities.executors import (
     run_with_thread_timeout,
     run_with_multiprocess_timeout,
@@ -16,6 +20,14 @@ from prefect.utilities.executors import (
     tail_recursive,
     RecursiveCall,
     HeartbeatThread,
+    is_stream,
+    iter_upstream_states_for_mapping,
+    resolve_mapped_child,
+    MappedUpstreamState,
+    TimeoutWorkerPool,
+    get_timeout_worker_pool,
+    run_coroutine,
+    set_thread_event_loop,
 )
 
 # We will test the low-level timeout handlers here and `run_task_with_timeout`
@@ -190,6 +202,9 @@ def test_run_with_multiprocess_timeout_preserves_logging(capfd):
     """
     Requires fd capturing because the subprocess output won't be captured by caplog
     """
+    # idle workers write to the output they were started with, so they're stopped
+    # for the worker running this function to be started while output is captured
+    get_timeout_worker_pool().shutdown()
     run_with_multiprocess_timeout(prefect.Flow("logs").run, timeout=10)
     stdout = capfd.readouterr().out
     assert "Beginning Flow run" in stdout
@@ -424,3 +439,194 @@ def test_heartbeat_exceptions_are_logged_to_cloud(monkeypatch):
         f"Failed to send heartbeat with exception: {ValueError('Foo')!r}"
         in log["message"]
     )
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (iter([1, 2]), True),
+        ((x for x in range(2)), True),
+        ([1, 2], False),
+        (range(2), False),
+        ("ab", False),
+        (None, False),
+    ],
+)
+def test_is_stream(value, expected):
+    assert is_stream(value) is expected
+
+
+def test_iter_upstream_states_for_mapping_consumes_streams_lazily():
+    produced = []
+
+    def gen():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    edge = Edge(Task(), Task(), key="x", mapped=True)
+    states = iter_upstream_states_for_mapping(
+        Mapped(), {edge: Success(result=gen())}, {}, executor=LocalExecutor()
+    )
+    assert produced == []
+
+    first = next(states)
+    assert first[edge].result == 0
+    assert produced == [0]
+
+    assert [s[edge].result for s in states] == list(range(1, 10))
+
+
+def test_iter_upstream_states_for_mapping_builds_child_states_when_resolved():
+    upstream = Success(result=[1, 2, 3])
+    mapped_edge = Edge(Task(), Task(), key="x", mapped=True)
+    edge = Edge(Task(), Task(), key="y")
+    states = list(
+        iter_upstream_states_for_mapping(
+            Mapped(),
+            {mapped_edge: upstream, edge: upstream},
+            {},
+            executor=LocalExecutor(),
+        )
+    )
+    assert len(states) == 3
+    assert all(s[edge] is upstream for s in states)
+
+    view, index = states[1][mapped_edge]
+    assert isinstance(view, MappedUpstreamState)
+    assert index == 1
+
+    child = resolve_mapped_child(states[1][mapped_edge])
+    assert child.result == 2
+    assert child is not resolve_mapped_child(states[1][mapped_edge])
+    assert upstream.result == [1, 2, 3]
+
+
+def test_iter_upstream_states_for_mapping_stops_at_the_shortest_result():
+    edges = [Edge(Task(), Task(), key=k, mapped=True) for k in "xy"]
+    states = iter_upstream_states_for_mapping(
+        Mapped(),
+        {edges[0]: Success(result=[1, 2, 3]), edges[1]: Success(result="ab")},
+        {},
+        executor=LocalExecutor(),
+    )
+    assert [[resolve_mapped_child(s[e]).result for e in edges] for s in states] == [
+        [1, "a"],
+        [2, "b"],
+    ]
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32", reason="Windows doesn't support any timeout logic"
+)
+class TestTimeoutWorkerPool:
+    def test_workers_are_reused(self):
+        pool = TimeoutWorkerPool(max_idle=1)
+        try:
+            pids = [
+                pool.run(cloudpickle.dumps({"fn": os.getpid}), timeout=10, name="pid")
+                for _ in range(3)
+            ]
+            assert len(set(pids)) == 1
+            assert pids[0] != os.getpid()
+        finally:
+            pool.shutdown()
+
+    def test_workers_which_time_out_are_replaced(self):
+        pool = TimeoutWorkerPool(max_idle=1)
+        try:
+            pid = pool.run(cloudpickle.dumps({"fn": os.getpid}), timeout=10, name="pid")
+            with pytest.raises(TaskTimeoutSignal):
+                pool.run(
+                    cloudpickle.dumps({"fn": time.sleep, "args": [10]}),
+                    timeout=0.5,
+                    name="sleep",
+                )
+            new_pid = pool.run(
+                cloudpickle.dumps({"fn": os.getpid}), timeout=10, name="pid"
+            )
+            assert new_pid != pid
+        finally:
+            pool.shutdown()
+
+    def test_workers_beyond_max_idle_are_stopped(self):
+        pool = TimeoutWorkerPool(max_idle=0)
+        pids = [
+            pool.run(cloudpickle.dumps({"fn": os.getpid}), timeout=10, name="pid")
+            for _ in range(2)
+        ]
+        assert len(set(pids)) == 2
+        assert pool._idle == []
+
+    @pytest.mark.parametrize("size", [10, 2**21])
+    def test_large_and_small_results_are_returned(self, size):
+        pool = TimeoutWorkerPool(max_idle=1)
+        try:
+            result = pool.run(
+                cloudpickle.dumps({"fn": bytes, "args": [size]}),
+                timeout=10,
+                name="bytes",
+            )
+            assert result == bytes(size)
+        finally:
+            pool.shutdown()
+
+
+class TestRunCoroutine:
+    def test_runs_coroutine_in_context(self):
+        async def get(key):
+            await asyncio.sleep(0)
+            return prefect.context.get(key)
+
+        with prefect.context(x=1):
+            assert run_coroutine(get("x")) == 1
+
+    def test_times_out(self):
+        with pytest.raises(TaskTimeoutSignal, match="my-coro"):
+            run_coroutine(asyncio.sleep(10), timeout=0.1, name="my-coro")
+
+    def test_runs_on_the_thread_event_loop(self):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+
+        async def get_loop():
+            return asyncio.get_running_loop()
+
+        try:
+            set_thread_event_loop(loop)
+            assert run_coroutine(get_loop()) is loop
+        finally:
+            set_thread_event_loop(None)
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def test_concurrent_coroutines_see_their_own_context(self):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, daemon=True)
+        thread.start()
+
+        async def get(i):
+            for _ in range(5):
+                assert prefect.context.i == i
+                await asyncio.sleep(0.01)
+            return prefect.context.i
+
+        def run(i):
+            set_thread_event_loop(loop)
+            with prefect.context(i=i):
+                results[i] = run_coroutine(get(i))
+
+        results = {}
+        threads = [threading.Thread(target=run, args=(i,)) for i in range(5)]
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+        assert results == {i: i for i in range(5)}
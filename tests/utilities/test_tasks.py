@@ -480,6 +480,22 @@ class TestApplyMap:
         state = flow.run()
         assert state.result[a].result == [2, 2, 4, 2, 4, 6]
 
+    def test_apply_map_chunk_size(self):
+        def func(x):
+            return inc(inc(x))
+
+        with Flow("test") as flow:
+            res = apply_map(func, range(5), chunk_size=2)
+
+        assert {t.chunk_size for t in flow.tasks if t.name == "inc"} == {2}
+        state = flow.run()
+        assert state.result[res].result == [2, 3, 4, 5, 6]
+
+    def test_apply_map_raises_for_invalid_chunk_size(self):
+        with Flow("test"):
+            with pytest.raises(ValueError, match="chunk_size"):
+                apply_map(lambda x: inc(x), range(3), chunk_size=0)
+
     def test_apply_map_mixed_edge_types(self):
         @tasks.task
         def get_mixed_types():